@@ -0,0 +1,58 @@
+"""
+Measure the setup cost per song before a download starts: creating a new
+audio provider for every song (like before), and getting the audio provider
+of the worker thread from `Downloader.get_audio_downloader`.
+Both include loading the YouTube extractor, which yt-dlp does on first use.
+
+Nothing is downloaded, so the benchmark runs offline.
+
+Usage: python scripts/benchmarks/download_setup.py [songs] [yt-dlp args]
+"""
+
+import sys
+import time
+
+from spotdl.download.downloader import Downloader
+from spotdl.providers.audio import AudioProvider
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    yt_dlp_args = sys.argv[2] if len(sys.argv) > 2 else "--retries 10 --no-part"
+
+    downloader = Downloader(
+        {
+            "ffmpeg": "true",
+            "audio_providers": ["youtube-music"],
+            "lyrics_providers": [],
+            "yt_dlp_args": yt_dlp_args,
+            "simple_tui": True,
+        }
+    )
+
+    start = time.perf_counter()
+    for _ in range(size):
+        audio_downloader = AudioProvider(
+            output_format=downloader.settings["format"],
+            cookie_file=downloader.settings["cookie_file"],
+            search_query=downloader.settings["search_query"],
+            filter_results=downloader.settings["filter_results"],
+            yt_dlp_args=downloader.settings["yt_dlp_args"],
+        )
+        audio_downloader.audio_handler.add_progress_hook(lambda data: None)
+        audio_downloader.audio_handler.get_info_extractor("Youtube")
+    per_song = (time.perf_counter() - start) / size * 1000
+
+    start = time.perf_counter()
+    for _ in range(size):
+        audio_downloader = downloader.get_audio_downloader(lambda data: None)
+        audio_downloader.audio_handler.get_info_extractor("Youtube")
+    per_thread = (time.perf_counter() - start) / size * 1000
+
+    print(f"{size} songs, yt-dlp args: {yt_dlp_args!r}")
+    print(f"new audio provider per song:    {per_song:8.3f} ms/song")
+    print(f"audio provider per thread:      {per_thread:8.3f} ms/song")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Measure the matching throughput for a J-pop playlist, where most strings
+have to be transliterated, with the previous 128 entry slugify cache,
+with the default slugify cache and with the separate transliteration cache.
+Also prints how long the transliterator takes to load on first use.
+
+The candidates are generated locally, so the benchmark runs offline.
+
+Usage: python scripts/benchmarks/japanese_matching.py [songs]
+"""
+
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.formatter import get_kakasi
+from spotdl.utils.matching import order_results
+from spotdl.utils.memo import DEFAULT_MEMO_SIZE, MEMOIZED_FUNCTIONS, set_memo_size
+
+TRACKS = [
+    ("夜に駆ける", "YOASOBI"),
+    ("紅蓮華", "LiSA"),
+    ("Lemon", "米津玄師"),
+    ("ドライフラワー", "優里"),
+    ("白日", "King Gnu"),
+    ("うっせぇわ", "Ado"),
+    ("廻廻奇譚", "Eve"),
+    ("香水", "瑛人"),
+    ("残響散歌", "Aimer"),
+    ("ミックスナッツ", "Official髭男dism"),
+    ("マリーゴールド", "あいみょん"),
+    ("炎", "LiSA"),
+    ("群青", "YOASOBI"),
+    ("猫", "DISH//"),
+    ("新時代", "Ado"),
+    ("怪獣の花唄", "Vaundy"),
+]
+
+SUFFIXES = ["", " (Official Video)", " 歌ってみた", " ライブ", " 弾いてみた", " Cover"]
+
+
+def make_song(index: int) -> Song:
+    name, artist = TRACKS[index % len(TRACKS)]
+
+    return Song.from_missing_data(
+        name=f"{name} {index // len(TRACKS)}",
+        artists=[artist],
+        artist=artist,
+        album_name=f"{name} アルバム",
+        duration=200 + index % 40,
+        song_id=f"{index:022d}",
+        explicit=False,
+    )
+
+
+def make_results(song: Song, count: int, generator: random.Random) -> List[Result]:
+    """
+    Create `count` candidates for the song, reuploads and covers of
+    the playlist's songs, so the same japanese titles come up again and again.
+    """
+
+    results = []
+    for index in range(count):
+        name, artist = generator.choice(TRACKS + [(song.name, song.artist)] * 4)
+        results.append(
+            Result(
+                source="youtube-music",
+                url=f"https://music.youtube.com/watch?v={song.song_id}{index}",
+                verified=generator.random() > 0.5,
+                name=f"{name}{generator.choice(SUFFIXES)}",
+                duration=song.duration + generator.randint(-30, 30),
+                author=generator.choice([artist, f"{artist} - Topic", "歌い手"]),
+                result_id=f"{song.song_id}{index}",
+                artists=(artist,),
+                album=generator.choice([None, song.album_name]),
+            )
+        )
+
+    return results
+
+
+def run(songs: List[Tuple[Song, List[Result]]], slugify_size: int, size: int) -> float:
+    """
+    Match all songs with the given cache sizes, in songs per second.
+    """
+
+    set_memo_size(slugify_size, ["slugify", "ratio"])
+    set_memo_size(size, ["transliterate"])
+    for memoized in MEMOIZED_FUNCTIONS.values():
+        memoized.clear()
+
+    start = time.perf_counter()
+    for song, results in songs:
+        order_results(results[:50], song)
+        order_results(results[50:], song)
+
+    return len(songs) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    generator = random.Random(0)
+
+    start = time.perf_counter()
+    get_kakasi()
+    print(f"transliterator loaded in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    songs = []
+    for index in range(size):
+        song = make_song(index)
+        songs.append((song, make_results(song, 100, generator)))
+
+    print(f"{size} songs, 100 results each")
+    cases = {
+        "slugify cache 128": (128, 0),
+        f"slugify cache {DEFAULT_MEMO_SIZE}": (DEFAULT_MEMO_SIZE, 0),
+        "+ kana cache": (DEFAULT_MEMO_SIZE, DEFAULT_MEMO_SIZE),
+    }
+    for name, (slugify_size, transliterate_size) in cases.items():
+        speed = run(songs, slugify_size, transliterate_size)
+        print(f"{name:24}{speed:8.1f} songs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare the time it takes to save and load a .spotdl file with the standard
+library (indent=4, like before) and with `spotdl.utils.jsonio`.
+
+Usage: python scripts/benchmarks/json_codec.py [songs]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from spotdl.types.song import Song
+from spotdl.utils.jsonio import JSON_BACKEND, load_json, save_json
+
+
+def make_songs(size: int) -> List[Dict[str, Any]]:
+    """
+    Create the data of `size` songs, like the one saved in .spotdl files.
+    """
+
+    return [
+        Song.from_missing_data(
+            name=f"Song {index}",
+            artists=[f"Artist {index // 60}", f"Featured Artist {index % 50}"],
+            artist=f"Artist {index // 60}",
+            genres=["pop", "dance pop"],
+            disc_number=1,
+            disc_count=1,
+            album_name=f"Album {index // 12}",
+            album_artist=f"Artist {index // 60}",
+            duration=200,
+            year=2020,
+            date="2020-01-01",
+            track_number=index % 12 + 1,
+            tracks_count=12,
+            song_id=f"{index:022d}",
+            explicit=False,
+            publisher="Label",
+            url=f"https://open.spotify.com/track/{index:022d}",
+            isrc=f"USABC{index:07d}",
+            cover_url=f"https://i.scdn.co/image/{index // 12:040d}",
+            copyright_text="2020 Label",
+            download_url=f"https://music.youtube.com/watch?v={index:011d}",
+            lyrics="La la la\n" * 40,
+        ).json
+        for index in range(size)
+    ]
+
+
+def stdlib_save(path: Path, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as save_file:
+        json.dump(data, save_file, indent=4, ensure_ascii=False)
+
+
+def stdlib_load(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as save_file:
+        return json.load(save_file)
+
+
+def measure(function: Callable) -> float:
+    """
+    Get the best time of 3 runs of the function, in milliseconds.
+    """
+
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    songs = make_songs(size)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cases = {
+            "json indent=4": (stdlib_save, stdlib_load),
+            f"{JSON_BACKEND}": (lambda path, data: save_json(path, data), load_json),
+            f"{JSON_BACKEND} compact": (
+                lambda path, data: save_json(path, data, compact=True),
+                load_json,
+            ),
+        }
+
+        print(f"{size} songs")
+        print(f"{'':16}{'save':>10}{'load':>10}{'size':>12}")
+        for index, (name, (save, load)) in enumerate(cases.items()):
+            path = Path(temp_dir, f"{index}.spotdl")
+            save_time = measure(lambda: save(path, songs))
+            load_time = measure(lambda: load(path))
+            size_mib = path.stat().st_size / 1024 / 1024
+
+            print(f"{name:16}{save_time:7.0f} ms{load_time:7.0f} ms{size_mib:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
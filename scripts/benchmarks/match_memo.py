@@ -0,0 +1,84 @@
+"""
+Compare the hit rate of the slugify and ratio memos, and the matching
+throughput, with the previous `lru_cache` size (128) and the default size,
+when 16 threads match the songs of a playlist against 100 results each.
+
+The candidates are generated locally, so the benchmark runs offline.
+
+Usage: python scripts/benchmarks/match_memo.py [songs] [threads]
+"""
+
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from order_results import make_results, make_song
+
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.matching import order_results
+from spotdl.utils.memo import (
+    DEFAULT_MEMO_SIZE,
+    MEMOIZED_FUNCTIONS,
+    get_memo_stats,
+    set_memo_size,
+)
+
+
+def match(song: Song, results: List[Result]) -> None:
+    """
+    Match the results like `AudioProvider.search`,
+    with one pass for the songs and one for the videos.
+    """
+
+    order_results(results[:50], song)
+    order_results(results[50:], song)
+
+
+def run(songs: List[Tuple[Song, List[Result]]], threads: int, size: int) -> float:
+    """
+    Match all songs with the given memo size, in songs per second.
+    """
+
+    set_memo_size(size)
+    for memoized in MEMOIZED_FUNCTIONS.values():
+        memoized.clear()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lambda item: match(*item), songs))
+
+    return len(songs) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    generator = random.Random(0)
+
+    songs = []
+    for index in range(size):
+        song = make_song(index)
+        songs.append((song, make_results(song, 100, generator)))
+
+    print(f"{size} songs, 100 results each, {threads} threads")
+    print(f"{'':8}{'songs/s':>10}{'slugify':>10}{'ratio':>10}{'evictions':>12}")
+    for memo_size in (128, DEFAULT_MEMO_SIZE):
+        speed = run(songs, threads, memo_size)
+        stats = get_memo_stats()
+        rates = [
+            stats[name]["hits"] / (stats[name]["hits"] + stats[name]["misses"]) * 100
+            for name in ("slugify", "ratio")
+        ]
+        evictions = sum(stats[name]["evictions"] for name in ("slugify", "ratio"))
+
+        print(
+            f"{memo_size:<8}{speed:10.1f}{rates[0]:9.1f}%{rates[1]:9.1f}%"
+            f"{evictions:12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
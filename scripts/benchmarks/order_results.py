@@ -0,0 +1,106 @@
+"""
+Measure how many songs per second `order_results` can score,
+and how many when skipping results that can't be picked (`score_threshold=8`).
+
+The candidates are generated locally, so the benchmark runs offline.
+
+Usage: python scripts/benchmarks/order_results.py [songs] [results]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.matching import order_results
+
+
+def make_song(index: int) -> Song:
+    return Song.from_missing_data(
+        name=f"Song Title {index} (feat. Guest {index % 7})",
+        artists=[f"Main Artist {index % 31}", f"Guest {index % 7}"],
+        artist=f"Main Artist {index % 31}",
+        album_name=f"Album Name {index % 13}",
+        duration=180 + index % 60,
+        song_id=f"{index:022d}",
+        explicit=False,
+    )
+
+
+def make_results(song: Song, count: int, generator: random.Random) -> List[Result]:
+    """
+    Create `count` candidates for the song, a mix of close and poor matches.
+    Every candidate has its own title and artists, like real search results,
+    so that the slugify cache doesn't hide the string work.
+    """
+
+    names = [
+        song.name,
+        f"{song.artist} - {song.name}",
+        f"{song.name} (Official Video)",
+        f"{song.name} (Live)",
+        f"Cover of {song.name}",
+    ]
+    artists = [
+        (song.artist,),
+        tuple(song.artists),
+        (f"{song.artist} Tribute",),
+        ("Unrelated Artist",),
+    ]
+
+    return [
+        Result(
+            source="youtube-music",
+            url=f"https://music.youtube.com/watch?v={song.song_id}{index}",
+            verified=generator.random() > 0.5,
+            name=f"{generator.choice(names)} {index}",
+            duration=song.duration + generator.randint(-30, 30),
+            author=generator.choice([song.artist, "Topic", "Lyrics"]),
+            result_id=f"{song.song_id}{index}",
+            artists=tuple(
+                f"{artist} {index % 9}" if index % 3 else artist
+                for artist in generator.choice(artists)
+            ),
+            album=generator.choice([None, song.album_name, "Greatest Hits"]),
+        )
+        for index in range(count)
+    ]
+
+
+def measure(function: Callable, songs: List[Tuple[Song, List[Result]]]) -> float:
+    """
+    Get the best of 3 runs, in songs per second.
+    """
+
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for song, results in songs:
+            function(song, results)
+        times.append(time.perf_counter() - start)
+
+    return len(songs) / min(times)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    result_count = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    generator = random.Random(0)
+
+    songs = []
+    for index in range(size):
+        song = make_song(index)
+        songs.append((song, make_results(song, result_count, generator)))
+
+    scalar = measure(lambda s, r: order_results(r, s), songs)
+    pruned = measure(lambda s, r: order_results(r, s, score_threshold=8), songs)
+
+    print(f"{size} songs, {result_count} results each")
+    print(f"scalar:  {scalar:8.1f} songs/s")
+    print(f"pruned:  {pruned:8.1f} songs/s ({pruned / scalar:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
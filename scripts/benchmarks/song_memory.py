@@ -0,0 +1,135 @@
+"""
+Measure the memory used by a synthetic library of songs and the time
+it takes to serialize it, comparing `Song` with a plain dataclass
+with the same fields (the previous Song model).
+
+Usage: python scripts/benchmarks/song_memory.py [songs]
+"""
+
+import dataclasses
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from spotdl.types.song import Song
+
+# Same fields as Song, without slots and interning
+PlainSong = dataclasses.make_dataclass(
+    "PlainSong",
+    [
+        (field.name, field.type, field)
+        for field in dataclasses.fields(Song)  # type: ignore
+    ],
+)
+
+
+def make_library(size: int) -> List[Dict[str, Any]]:
+    """
+    Create the raw data of `size` songs, 12 songs per album and 5 albums per artist.
+    The data goes through json so that equal strings are separate objects,
+    like when they are parsed from API responses.
+    """
+
+    library = []
+    for index in range(size):
+        album = index // 12
+        artist = album // 5
+        library.append(
+            {
+                "name": f"Song {index}",
+                "artists": [f"Artist {artist}", f"Featured Artist {index % 50}"],
+                "artist": f"Artist {artist}",
+                "genres": ["pop", "dance pop", "electropop"],
+                "disc_number": 1,
+                "disc_count": 1,
+                "album_name": f"Album {album}",
+                "album_artist": f"Artist {artist}",
+                "duration": 200,
+                "year": 2020,
+                "date": "2020-01-01",
+                "track_number": index % 12 + 1,
+                "tracks_count": 12,
+                "song_id": f"{index:022d}",
+                "explicit": False,
+                "publisher": f"Label {artist % 20}",
+                "url": f"https://open.spotify.com/track/{index:022d}",
+                "isrc": f"USABC{index:07d}",
+                "cover_url": f"https://i.scdn.co/image/{album:040d}",
+                "copyright_text": f"2020 Label {artist % 20}",
+                "album_id": f"{album:022d}",
+                "list_name": "Library",
+                "list_url": "https://open.spotify.com/playlist/library",
+                "list_length": size,
+                "list_position": index + 1,
+                "artist_id": f"{artist:022d}",
+                "album_type": "album",
+            }
+        )
+
+    return json.loads(json.dumps(library))
+
+
+def measure_memory(song_type: Callable, size: int) -> float:
+    """
+    Get the memory kept by the songs once the raw data is freed, in MiB.
+    """
+
+    tracemalloc.start()
+    library = make_library(size)
+    songs = [song_type(**song) for song in library]
+    del library
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del songs
+
+    return used / 1024 / 1024
+
+
+def measure_time(function: Callable) -> float:
+    """
+    Get the time it takes to run the function, in milliseconds.
+    """
+
+    start = time.perf_counter()
+    function()
+
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    plain_memory = measure_memory(PlainSong, size)
+    song_memory = measure_memory(Song, size)
+
+    library = make_library(size)
+    plain_songs = [PlainSong(**song) for song in library]
+    songs = [Song(**song) for song in library]
+
+    plain_json = measure_time(lambda: [dataclasses.asdict(s) for s in plain_songs])
+    song_json = measure_time(lambda: [song.json for song in songs])
+
+    plain_copy = measure_time(
+        lambda: [
+            PlainSong(**{**dataclasses.asdict(s), "list_position": 1})
+            for s in plain_songs
+        ]
+    )
+    song_copy = measure_time(
+        lambda: [dataclasses.replace(song, list_position=1) for song in songs]
+    )
+
+    print(f"{size} songs")
+    print(f"{'':16}{'memory':>12}{'serialize':>12}{'copy':>12}")
+    print(
+        f"{'plain dataclass':16}{plain_memory:9.1f} MiB"
+        f"{plain_json:9.0f} ms{plain_copy:9.0f} ms"
+    )
+    print(f"{'Song':16}{song_memory:9.1f} MiB{song_json:9.0f} ms{song_copy:9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
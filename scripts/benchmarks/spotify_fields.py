@@ -0,0 +1,180 @@
+"""
+Compare the size and parse time of a full playlist items page
+with the page projected with `PLAYLIST_ITEMS_FIELDS`.
+
+The page is generated locally to mirror the shape of a real
+`playlists/{id}/tracks` response, so the benchmark runs offline.
+
+Usage: python scripts/benchmarks/spotify_fields.py [pages]
+"""
+
+import json
+import sys
+import timeit
+from typing import Any, Dict, List, Tuple
+
+from spotdl.types.playlist import PLAYLIST_ITEMS_FIELDS
+
+# Spotify lists ~185 markets for most tracks and albums
+MARKETS = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(185)]
+
+
+def make_artist(index: int) -> Dict[str, Any]:
+    artist_id = f"artist{index:018d}"
+    return {
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/{artist_id}"},
+        "href": f"https://api.spotify.com/v1/artists/{artist_id}",
+        "id": artist_id,
+        "name": f"Artist {index}",
+        "type": "artist",
+        "uri": f"spotify:artist:{artist_id}",
+    }
+
+
+def make_item(index: int) -> Dict[str, Any]:
+    track_id = f"track{index:017d}"
+    album_id = f"album{index:017d}"
+    artists = [make_artist(index), make_artist(index + 1)]
+    return {
+        "added_at": "2023-01-01T00:00:00Z",
+        "added_by": {"id": "user", "type": "user", "uri": "spotify:user:user"},
+        "is_local": False,
+        "primary_color": None,
+        "video_thumbnail": {"url": None},
+        "track": {
+            "album": {
+                "album_type": "album",
+                "artists": artists[:1],
+                "available_markets": MARKETS,
+                "external_urls": {
+                    "spotify": f"https://open.spotify.com/album/{album_id}"
+                },
+                "href": f"https://api.spotify.com/v1/albums/{album_id}",
+                "id": album_id,
+                "images": [
+                    {"height": size, "width": size, "url": f"https://i.scdn.co/{size}"}
+                    for size in (640, 300, 64)
+                ],
+                "name": f"Album {index}",
+                "release_date": "2020-01-01",
+                "release_date_precision": "day",
+                "total_tracks": 12,
+                "type": "album",
+                "uri": f"spotify:album:{album_id}",
+            },
+            "artists": artists,
+            "available_markets": MARKETS,
+            "disc_number": 1,
+            "duration_ms": 200000,
+            "episode": False,
+            "explicit": False,
+            "external_ids": {"isrc": f"USABC{index:07d}"},
+            "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+            "href": f"https://api.spotify.com/v1/tracks/{track_id}",
+            "id": track_id,
+            "is_local": False,
+            "name": f"Track {index}",
+            "popularity": 50,
+            "preview_url": f"https://p.scdn.co/mp3-preview/{track_id}",
+            "track": True,
+            "track_number": index % 12 + 1,
+            "type": "track",
+            "uri": f"spotify:track:{track_id}",
+        },
+    }
+
+
+def parse_fields(fields: str) -> Dict[str, Any]:
+    """
+    Parse a `fields` expression, e.g. `items(track(id,name)),total`,
+    into a tree of selected keys.
+    """
+
+    def parse(position: int) -> Tuple[Dict[str, Any], int]:
+        tree: Dict[str, Any] = {}
+        name = ""
+        while position < len(fields):
+            char = fields[position]
+            if char == "(":
+                tree[name], position = parse(position + 1)
+                name = ""
+            elif char == ")":
+                break
+            elif char == ",":
+                if name:
+                    tree[name] = None
+                name = ""
+            else:
+                name += char
+
+            position += 1
+
+        if name:
+            tree[name] = None
+
+        return tree, position
+
+    return parse(0)[0]
+
+
+def apply_fields(data: Any, tree: Dict[str, Any]) -> Any:
+    """
+    Keep only the selected keys, like the API does for `fields=`.
+    """
+
+    if isinstance(data, list):
+        return [apply_fields(item, tree) for item in data]
+
+    return {
+        key: data[key] if subtree is None else apply_fields(data[key], subtree)
+        for key, subtree in tree.items()
+        if key in data
+    }
+
+
+def measure(pages: List[str]) -> float:
+    """
+    Get the time it takes to parse all pages, in milliseconds.
+    """
+
+    timer = timeit.Timer(lambda: [json.loads(page) for page in pages])
+    loops, _ = timer.autorange()
+
+    return min(timer.repeat(3, loops)) / loops * 1000
+
+
+def main() -> None:
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    tree = parse_fields(PLAYLIST_ITEMS_FIELDS)
+
+    full_pages = []
+    projected_pages = []
+    for page in range(page_count):
+        response = {
+            "href": "https://api.spotify.com/v1/playlists/abc/tracks",
+            "items": [make_item(page * 100 + index) for index in range(100)],
+            "limit": 100,
+            "next": None,
+            "offset": page * 100,
+            "previous": None,
+            "total": page_count * 100,
+        }
+        full_pages.append(json.dumps(response))
+        projected_pages.append(json.dumps(apply_fields(response, tree)))
+
+    full_size = sum(len(page) for page in full_pages)
+    projected_size = sum(len(page) for page in projected_pages)
+    full_time = measure(full_pages)
+    projected_time = measure(projected_pages)
+
+    print(f"{page_count * 100} playlist items in {page_count} pages")
+    print(f"full:      {full_size / 1024:10.1f} KiB {full_time:8.2f} ms")
+    print(f"projected: {projected_size / 1024:10.1f} KiB {projected_time:8.2f} ms")
+    print(
+        f"saved:     {100 - projected_size / full_size * 100:9.1f} % "
+        f"{100 - projected_time / full_time * 100:8.1f} %"
+    )
+
+
+if __name__ == "__main__":
+    main()
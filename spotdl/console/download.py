@@ -5,7 +5,7 @@
 from typing import List
 
 from spotdl.download.downloader import Downloader
-from spotdl.utils.search import get_simple_songs
+from spotdl.utils.search import iter_simple_songs
 
 __all__ = ["download"]
 
@@ -21,8 +21,9 @@ def download(
     - query: list of strings to search for.
     """
 
-    # Parse the query
-    songs = get_simple_songs(
+    # Parse the query lazily, so that songs start downloading
+    # as soon as their list is fetched
+    songs = iter_simple_songs(
         query,
         use_ytm_data=downloader.settings["ytm_data"],
         playlist_numbering=downloader.settings["playlist_numbering"],
@@ -32,4 +33,4 @@ def download(
     )
 
     # Download the songs
-    downloader.download_multiple_songs(songs)
+    downloader.download_songs_incrementally(songs)
@@ -16,13 +16,22 @@
 from spotdl.console.url import url
 from spotdl.console.web import web
 from spotdl.download.downloader import Downloader, DownloaderError
+from spotdl.providers.audio.base import INFO_CACHE
 from spotdl.utils.arguments import parse_arguments
 from spotdl.utils.config import create_settings
 from spotdl.utils.console import ACTIONS, generate_initial_config, is_executable
 from spotdl.utils.downloader import check_ytmusic_connection
 from spotdl.utils.ffmpeg import FFmpegError, download_ffmpeg, is_ffmpeg_installed
+from spotdl.utils.jsonio import SAVE_FILE_EXTENSIONS
 from spotdl.utils.logging import init_logging
-from spotdl.utils.spotify import SpotifyClient, SpotifyError, save_spotify_cache
+from spotdl.utils.memo import get_memo_stats
+from spotdl.utils.spotify import (
+    ENTITY_MEMO,
+    SpotifyClient,
+    SpotifyError,
+    save_spotify_cache,
+)
+from spotdl.utils.ytmusic import YTM_POOL
 
 __all__ = ["console_entry_point", "OPERATIONS"]
 
@@ -49,6 +58,9 @@ def console_entry_point():
         stats = pstats.Stats(profile)
         stats.sort_stats(pstats.SortKey.TIME)
         stats.dump_stats("spotdl.profile")
+
+        for name, memo_stats in get_memo_stats().items():
+            logger.info("Memoized %s: %s", name, memo_stats)
     else:
         entry_point()
 
@@ -122,10 +134,10 @@ def entry_point():
 
     # Check if save file is present and if it's valid
     if isinstance(downloader_settings["save_file"], str) and (
-        not downloader_settings["save_file"].endswith(".spotdl")
+        not downloader_settings["save_file"].endswith(SAVE_FILE_EXTENSIONS)
         and not downloader_settings["save_file"] == "-"
     ):
-        raise DownloaderError("Save file has to end with .spotdl")
+        raise DownloaderError("Save file has to end with .spotdl or .spotdl.jsonl")
 
     # Check if the user is logged in
     if (
@@ -180,6 +192,13 @@ def graceful_exit(_signal, _frame):
 
     end_time = time.perf_counter()
     logger.debug("Took %d seconds", end_time - start_time)
+    logger.debug("Spotify entity memo: %s", ENTITY_MEMO.stats)
+    logger.debug("Spotify rate limiter: %s", spotify_client.rate_limiter.stats)
+    logger.debug("Memoized functions: %s", get_memo_stats())
+    logger.debug("Video info cache: %s", INFO_CACHE.stats)
+    logger.debug("YouTube Music clients: %s", YTM_POOL.stats)
+    if downloader.match_store is not None:
+        logger.debug("Match store: %s", downloader.match_store.stats)
 
     if spotify_settings["use_cache_file"]:
         save_spotify_cache(spotify_client.cache)
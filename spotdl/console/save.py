@@ -3,12 +3,12 @@
 """
 
 import asyncio
-import json
 import logging
 from typing import List
 
 from spotdl.download.downloader import Downloader, DownloaderError
 from spotdl.types.song import Song
+from spotdl.utils.jsonio import JsonLinesWriter, dumps, is_json_lines, save_json
 from spotdl.utils.m3u import gen_m3u_files
 from spotdl.utils.search import parse_query
 
@@ -51,6 +51,13 @@ def save(
     )
     save_data = [song.json for song in songs]
 
+    # JSON Lines files are written song by song, as the workers finish
+    writer = (
+        JsonLinesWriter(save_path)
+        if save_path and not to_stdout and is_json_lines(save_path)
+        else None
+    )
+
     def process_song(song: Song):
         download_url = None
         if downloader.settings["preload"]:
@@ -81,7 +88,13 @@ def process_song(song: Song):
         except Exception as exception:
             logger.debug("Could not search for lyrics: %s", exception)
 
-        return {**song.json, "download_url": download_url, "lyrics": lyrics}
+        song_data = {**song.json, "download_url": download_url, "lyrics": lyrics}
+
+        # Write the song as soon as it's processed
+        if writer is not None:
+            writer.write(song_data)
+
+        return song_data
 
     async def pool_worker(song: Song):
         async with downloader.semaphore:
@@ -94,15 +107,18 @@ async def pool_worker(song: Song):
     tasks = [pool_worker(song) for song in songs]
 
     # call all task asynchronously, and wait until all are finished
-    save_data = list(downloader.loop.run_until_complete(asyncio.gather(*tasks)))
+    try:
+        save_data = list(downloader.loop.run_until_complete(asyncio.gather(*tasks)))
+    finally:
+        if writer is not None:
+            writer.close()
 
     if to_stdout:
         # Print the songs to stdout
-        print(json.dumps(save_data, indent=4, ensure_ascii=False))
-    elif save_path:
+        print(dumps(save_data, downloader.settings["compact_json"]))
+    elif save_path and writer is None:
         # Save the songs to a file
-        with open(save_path, "w", encoding="utf-8") as save_file:
-            json.dump(save_data, save_file, indent=4, ensure_ascii=False)
+        save_json(save_path, save_data, downloader.settings["compact_json"])
 
     if m3u_file:
         gen_m3u_files(
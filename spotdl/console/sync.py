@@ -2,18 +2,26 @@
 Sync module for the console.
 """
 
-import json
+import itertools
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 from spotdl.download.downloader import Downloader
 from spotdl.types.song import Song
 from spotdl.utils.formatter import create_file_name
+from spotdl.utils.jsonio import (
+    SAVE_FILE_EXTENSIONS,
+    is_json_lines,
+    iter_json_lines,
+    load_json,
+    save_json,
+    save_json_lines,
+)
 from spotdl.utils.m3u import gen_m3u_files
 from spotdl.utils.search import parse_query
 
-__all__ = ["sync"]
+__all__ = ["sync", "load_sync_file", "save_sync_file"]
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +50,7 @@ def sync(
     # Query and save file
     # Create initial sync file
     if query and save_path:
-        if any(req for req in query if req.endswith(".spotdl")):
+        if any(req for req in query if req.endswith(SAVE_FILE_EXTENSIONS)):
             # If the query contains a .spotdl file, and we are about to create
             # .spotdl file, raise an error.
             raise ValueError(
@@ -62,17 +70,9 @@ def sync(
         )
 
         # Create sync file
-        with open(save_path, "w", encoding="utf-8") as save_file:
-            json.dump(
-                {
-                    "type": "sync",
-                    "query": query,
-                    "songs": [song.json for song in songs_list],
-                },
-                save_file,
-                indent=4,
-                ensure_ascii=False,
-            )
+        save_sync_file(
+            save_path, query, songs_list, downloader.settings["compact_json"]
+        )
 
         # Perform initial download
         downloader.download_multiple_songs(songs_list)
@@ -93,24 +93,15 @@ def sync(
     # If the query is a single file, download it
     if (  # pylint: disable=R1702
         len(query) == 1  # pylint: disable=R1702
-        and query[0].endswith(".spotdl")  # pylint: disable=R1702
+        and query[0].endswith(SAVE_FILE_EXTENSIONS)  # pylint: disable=R1702
         and not save_path  # pylint: disable=R1702
     ):
         # Load the sync file
-        with open(query[0], "r", encoding="utf-8") as sync_file:
-            sync_data = json.load(sync_file)
-
-        # Verify the sync file
-        if (
-            not isinstance(sync_data, dict)
-            or sync_data.get("type") != "sync"
-            or sync_data.get("songs") is None
-        ):
-            raise ValueError("Sync file is not a valid sync file.")
+        sync_query, old_songs = load_sync_file(query[0])
 
         # Parse the query
         songs_playlist = parse_query(
-            query=sync_data["query"],
+            query=sync_query,
             threads=downloader.settings["threads"],
             use_ytm_data=downloader.settings["ytm_data"],
             playlist_numbering=downloader.settings["playlist_numbering"],
@@ -122,7 +113,7 @@ def sync(
 
         # Get the names and URLs of previously downloaded songs from the sync file
         old_files = []
-        for entry in sync_data["songs"]:
+        for entry in old_songs:
             file_name = create_file_name(
                 Song.from_dict(entry),
                 downloader.settings["output"],
@@ -239,17 +230,9 @@ def sync(
             )
 
         # Write the new sync file
-        with open(query[0], "w", encoding="utf-8") as save_file:
-            json.dump(
-                {
-                    "type": "sync",
-                    "query": sync_data["query"],
-                    "songs": [song.json for song in songs_playlist],
-                },
-                save_file,
-                indent=4,
-                ensure_ascii=False,
-            )
+        save_sync_file(
+            query[0], sync_query, songs_playlist, downloader.settings["compact_json"]
+        )
 
         downloader.download_multiple_songs(songs_playlist)
 
@@ -259,3 +242,64 @@ def sync(
         "Wrong combination of arguments. "
         "Either provide a query and a save path. Or a single sync file in the query"
     )
+
+
+def load_sync_file(path: str) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+    """
+    Load a sync file. JSON Lines sync files start with a header line
+    (type and query) followed by one song per line, their songs are read lazily.
+
+    ### Arguments
+    - path: The path to the sync file.
+
+    ### Returns
+    - The query of the sync file and an iterator of its songs' data.
+    """
+
+    if is_json_lines(path):
+        lines = iter_json_lines(path)
+        header = next(lines, None)
+        if not isinstance(header, dict) or header.get("type") != "sync":
+            raise ValueError("Sync file is not a valid sync file.")
+
+        return header["query"], lines
+
+    sync_data = load_json(path)
+
+    # Verify the sync file
+    if (
+        not isinstance(sync_data, dict)
+        or sync_data.get("type") != "sync"
+        or sync_data.get("songs") is None
+    ):
+        raise ValueError("Sync file is not a valid sync file.")
+
+    return sync_data["query"], iter(sync_data["songs"])
+
+
+def save_sync_file(
+    path: str, query: List[str], songs: List[Song], compact: bool = False
+) -> None:
+    """
+    Save a sync file, in the JSON Lines format if the path ends with `.jsonl`.
+
+    ### Arguments
+    - path: The path to the sync file.
+    - query: The query to sync.
+    - songs: The songs found for the query.
+    - compact: Whether to skip indentation (JSON files only).
+    """
+
+    if is_json_lines(path):
+        save_json_lines(
+            path,
+            itertools.chain(
+                [{"type": "sync", "query": query}], (song.json for song in songs)
+            ),
+        )
+    else:
+        save_json(
+            path,
+            {"type": "sync", "query": query, "songs": [song.json for song in songs]},
+            compact,
+        )
@@ -2,17 +2,32 @@
 Downloader module, this is where all the downloading pre/post processing happens etc.
 """
 
+# pylint: disable=too-many-lines
+
 import asyncio
+import concurrent.futures
 import datetime
-import json
 import logging
 import re
 import shutil
 import sys
+import threading
 import traceback
 from argparse import Namespace
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from yt_dlp.postprocessor.modify_chapters import ModifyChaptersPP
 from yt_dlp.postprocessor.sponsorblock import SponsorBlockPP
@@ -20,6 +35,7 @@
 from spotdl.download.progress_handler import ProgressHandler
 from spotdl.providers.audio import (
     AudioProvider,
+    AudioProviderError,
     BandCamp,
     Piped,
     SoundCloud,
@@ -28,6 +44,7 @@
 )
 from spotdl.providers.lyrics import AzLyrics, Genius, LyricsProvider, MusixMatch, Synced
 from spotdl.types.options import DownloaderOptionalOptions, DownloaderOptions
+from spotdl.types.result import Result
 from spotdl.types.song import Song
 from spotdl.utils.archive import Archive
 from spotdl.utils.config import (
@@ -35,21 +52,32 @@
     GlobalConfig,
     create_settings_type,
     get_errors_path,
+    get_match_store_path,
     get_temp_path,
     modernize_settings,
 )
 from spotdl.utils.ffmpeg import FFmpegError, convert, get_ffmpeg_path
 from spotdl.utils.formatter import create_file_name
+from spotdl.utils.jsonio import is_json_lines, save_json, save_json_lines
 from spotdl.utils.lrc import generate_lrc
 from spotdl.utils.m3u import gen_m3u_files
+from spotdl.utils.match_store import MatchStore
+from spotdl.utils.memo import set_memo_size
 from spotdl.utils.metadata import MetadataError, embed_metadata
-from spotdl.utils.search import gather_known_songs, reinit_song, songs_from_albums
+from spotdl.utils.search import (
+    gather_known_songs,
+    reinit_song,
+    reinit_songs,
+    songs_from_albums,
+)
 
 __all__ = [
     "AUDIO_PROVIDERS",
     "LYRICS_PROVIDERS",
     "Downloader",
     "DownloaderError",
+    "EARLY_MATCH_SCORE",
+    "PRODUCER_CHUNK_SIZE",
     "SPONSOR_BLOCK_CATEGORIES",
 ]
 
@@ -68,6 +96,12 @@
     "synced": Synced,
 }
 
+# Songs produced by queries are reinitialized in batches of this size
+PRODUCER_CHUNK_SIZE = 50
+
+# Verified results with this score are used without waiting for other providers
+EARLY_MATCH_SCORE = 80
+
 SPONSOR_BLOCK_CATEGORIES = {
     "sponsor": "Sponsor",
     "intro": "Intermission/Intro Animation",
@@ -158,6 +192,9 @@ def __init__(
         # semaphore is required to limit concurrent asyncio executions
         self.semaphore = asyncio.Semaphore(self.settings["threads"])
 
+        # Size the slugify and ratio caches used when matching results
+        set_memo_size(self.settings["match_cache_size"])
+
         self.progress_handler = ProgressHandler(self.settings["simple_tui"])
 
         # Gather already present songs
@@ -209,6 +246,7 @@ def __init__(
                     search_query=self.settings["search_query"],
                     filter_results=self.settings["filter_results"],
                     yt_dlp_args=self.settings["yt_dlp_args"],
+                    speculative_search=self.settings["speculative_search"],
                 )
             )
 
@@ -236,6 +274,17 @@ def __init__(
 
         logger.debug("Archive: %d urls", len(self.url_archive))
 
+        # Initialize match store
+        self.match_store: Optional[MatchStore] = None
+        if self.settings["match_store"]:
+            self.match_store = MatchStore(get_match_store_path())
+            logger.debug("Match store: %d entries", len(self.match_store.cache))
+
+        # Audio downloaders are created once per thread and reused for every song
+        self.audio_downloaders = threading.local()
+        self.audio_downloader_count = 0
+        self._audio_downloader_lock = threading.Lock()
+
         logger.debug("Downloader initialized")
 
     def download_song(self, song: Song) -> Tuple[Song, Optional[Path]]:
@@ -268,6 +317,8 @@ def download_multiple_songs(
         - list of tuples with the song and the path to the downloaded file if successful.
         """
 
+        songs = self.reinit_missing_songs(songs)
+
         if self.settings["fetch_albums"]:
             albums = set(song.album_id for song in songs if song.album_id is not None)
             logger.info(
@@ -297,6 +348,167 @@ def download_multiple_songs(
         # Call all task asynchronously, and wait until all are finished
         results = list(self.loop.run_until_complete(asyncio.gather(*tasks)))
 
+        self.finish_download(results)
+
+        return results
+
+    def reinit_missing_songs(self, songs: List[Song]) -> List[Song]:
+        """
+        Reinitialize the songs that are missing metadata in batches,
+        or all of them if we are fetching albums.
+
+        ### Arguments
+        - songs: The songs to reinitialize.
+
+        ### Returns
+        - The songs, songs that couldn't be reinitialized are returned as they were
+            and retried in `search_and_download`.
+        """
+
+        to_reinit = [
+            index
+            for index, song in enumerate(songs)
+            if self.settings["fetch_albums"] or self.is_missing_metadata(song)
+        ]
+        if not to_reinit:
+            return songs
+
+        logger.debug("Reinitializing %d songs", len(to_reinit))
+        new_songs = reinit_songs(
+            [songs[index] for index in to_reinit], self.settings["threads"]
+        )
+
+        songs = list(songs)
+        for index, new_song in zip(to_reinit, new_songs):
+            if new_song is not None:
+                songs[index] = new_song
+
+        return songs
+
+    def download_songs_incrementally(
+        self, songs: Iterable[Song]
+    ) -> List[Tuple[Song, Optional[Path]]]:
+        """
+        Download songs as they are produced by an iterable, e.g. `iter_simple_songs`,
+        so that downloads start before the whole query is parsed.
+        Songs with the same url are downloaded only once.
+
+        ### Arguments
+        - songs: The songs to download.
+
+        ### Returns
+        - list of tuples with the song and the path to the downloaded file if successful.
+
+        ### Notes
+        - With `fetch_albums` the whole iterable has to be consumed first,
+            so this falls back to `download_multiple_songs`.
+        """
+
+        if self.settings["fetch_albums"]:
+            return self.download_multiple_songs(list(songs))
+
+        # Iterate over the songs in a separate thread, they
+        # are usually fetched from the network while we download
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as producer:
+            results = self.loop.run_until_complete(
+                self._download_from_iterator(iter(songs), producer)
+            )
+
+        self.finish_download(results)
+
+        return results
+
+    async def _download_from_iterator(
+        self, songs: Iterator[Song], producer: concurrent.futures.Executor
+    ) -> List[Tuple[Song, Optional[Path]]]:
+        """
+        Create a download task for every new song produced by the iterator.
+        Songs are taken from the iterator in chunks of `PRODUCER_CHUNK_SIZE`,
+        so that the songs missing metadata can be reinitialized in batches.
+
+        ### Arguments
+        - songs: The iterator of songs to download.
+        - producer: The executor used to get the next songs.
+
+        ### Returns
+        - list of tuples with the song and the path to the downloaded file if successful.
+
+        ### Notes
+        - If the iterator fails, the error is logged
+            and the songs produced until then are still downloaded.
+        """
+
+        tasks: List[asyncio.Task] = []
+        seen_urls = set()
+        try:
+            error = None
+            while error is None:
+                chunk, error = await self.loop.run_in_executor(
+                    producer, self._next_songs, songs
+                )
+                if not chunk and error is None:
+                    break
+
+                for song in chunk:
+                    # Songs from YouTube Music queries don't have a Spotify url
+                    song_url = song.url or song.download_url
+                    if song_url:
+                        if song_url in seen_urls:
+                            continue
+
+                        seen_urls.add(song_url)
+
+                    if self.settings["archive"] and song.url in self.url_archive:
+                        logger.debug("Skipping %s (archived)", song.display_name)
+                        continue
+
+                    self.progress_handler.set_song_count(len(tasks) + 1)
+                    tasks.append(self.loop.create_task(self.pool_download(song)))
+
+            if error is not None:
+                raise error
+        except Exception as exception:  # pylint: disable=broad-except
+            logger.error("Failed to get the next songs to download: %s", exception)
+            self.errors.append(f"Failed to get the next songs to download: {exception}")
+        finally:
+            logger.debug("Downloading %d songs", len(tasks))
+            results = list(await asyncio.gather(*tasks))
+
+        return results
+
+    def _next_songs(
+        self, songs: Iterator[Song]
+    ) -> Tuple[List[Song], Optional[Exception]]:
+        """
+        Get the next chunk of songs from the iterator and reinitialize
+        the ones that are missing metadata.
+
+        ### Arguments
+        - songs: The iterator of songs.
+
+        ### Returns
+        - The next songs, an empty list once the iterator is exhausted,
+            and the error of the iterator if it failed.
+        """
+
+        chunk: List[Song] = []
+        error = None
+        try:
+            chunk.extend(islice(songs, PRODUCER_CHUNK_SIZE))
+        except Exception as exception:  # pylint: disable=broad-except
+            error = exception
+
+        return self.reinit_missing_songs(chunk), error
+
+    def finish_download(self, results: List[Tuple[Song, Optional[Path]]]) -> None:
+        """
+        Print and save the errors, update the archive, create the m3u files
+        and save the results once all songs are downloaded.
+
+        ### Arguments
+        - results: The results of the downloads.
+        """
+
         # Print errors
         if self.settings["print_errors"]:
             for error in self.errors:
@@ -348,13 +560,19 @@ def download_multiple_songs(
 
         # Save results to a file
         if self.settings["save_file"]:
-            with open(self.settings["save_file"], "w", encoding="utf-8") as save_file:
-                json.dump([song.json for song, _ in results], save_file, indent=4)
+            if is_json_lines(self.settings["save_file"]):
+                save_json_lines(
+                    self.settings["save_file"], (song.json for song, _ in results)
+                )
+            else:
+                save_json(
+                    self.settings["save_file"],
+                    [song.json for song, _ in results],
+                    self.settings["compact_json"],
+                )
 
             logger.info("Saved results to %s", self.settings["save_file"])
 
-        return results
-
     async def pool_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         """
         Run asynchronous task in a pool to make sure that all processes.
@@ -374,6 +592,30 @@ async def pool_download(self, song: Song) -> Tuple[Song, Optional[Path]]:
         async with self.semaphore:
             return await self.loop.run_in_executor(None, self.search_and_download, song)
 
+    @staticmethod
+    def is_missing_metadata(song: Song) -> bool:
+        """
+        Check if the song object has to be reinitialized before downloading.
+
+        ### Arguments
+        - song: The song to check.
+
+        ### Returns
+        - True if the song is missing metadata.
+        """
+
+        return (song.name is None and bool(song.url)) or any(
+            x is None
+            for x in [
+                song.genres,
+                song.disc_count,
+                song.tracks_count,
+                song.track_number,
+                song.album_id,
+                song.album_artist,
+            ]
+        )
+
     def search(self, song: Song) -> str:
         """
         Search for a song using all available providers.
@@ -383,16 +625,258 @@ def search(self, song: Song) -> str:
 
         ### Returns
         - tuple with download url and audio provider if successful.
+
+        ### Notes
+        - If the match store is enabled, songs matched in previous runs
+            by one of the audio providers aren't searched again
+            and new matches are added to it.
+            Providers whose best match is blacklisted are skipped.
+        - If parallel search is enabled, all providers are searched at the same time.
+        """
+
+        blacklist: List[str] = []
+        if self.match_store is not None:
+            stored_match = self.match_store.get(song)
+
+            # Matches of providers that aren't used anymore are searched again,
+            # pinned matches are always used
+            providers = [audio_provider.name for audio_provider in self.audio_providers]
+            if stored_match is not None and (
+                stored_match["pinned"] or stored_match["provider"] in providers
+            ):
+                logger.debug(
+                    "Using stored match for %s: %s",
+                    song.display_name,
+                    stored_match["url"],
+                )
+
+                return stored_match["url"]
+
+            blacklist = self.match_store.get_blacklist(song)
+
+        if self.settings["parallel_search"] and len(self.audio_providers) > 1:
+            match = self.search_providers_parallel(song, blacklist)
+        else:
+            match = self.search_providers(song, blacklist)
+
+        if match is None:
+            raise LookupError(f"No results found for song: {song.display_name}")
+
+        audio_provider, result, score = match
+        if self.match_store is not None:
+            self.match_store.set(song, result.url, audio_provider.name, score)
+
+        return result.url
+
+    def search_providers(
+        self, song: Song, blacklist: List[str]
+    ) -> Optional[Tuple[AudioProvider, Result, float]]:
+        """
+        Search for a song with the audio providers one after another,
+        until one of them finds a match.
+
+        ### Arguments
+        - song: The song to search for.
+        - blacklist: The urls that shouldn't be used for the song.
+
+        ### Returns
+        - tuple with the audio provider, the best result and its score if successful.
         """
 
         for audio_provider in self.audio_providers:
-            url = audio_provider.search(song, self.settings["only_verified_results"])
-            if url:
-                return url
+            match = self.check_match(
+                audio_provider,
+                song,
+                audio_provider.find_match(song, self.settings["only_verified_results"]),
+                blacklist,
+            )
+            if match is not None:
+                return audio_provider, match[0], match[1]
+
+        return None
+
+    def search_providers_parallel(
+        self, song: Song, blacklist: List[str]
+    ) -> Optional[Tuple[AudioProvider, Result, float]]:
+        """
+        Search for a song with all audio providers at the same time.
+        The first verified result with a score of at least 80 is used right away,
+        otherwise the result with the best score is used once all providers finished.
+
+        ### Arguments
+        - song: The song to search for.
+        - blacklist: The urls that shouldn't be used for the song.
+
+        ### Returns
+        - tuple with the audio provider, the best result and its score if successful.
+
+        ### Notes
+        - Searches that didn't start yet are cancelled once a match is used,
+            the ones that already started finish in the background.
+        - Errors of a provider are only raised if no provider found a match.
+        """
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.audio_providers),
+            thread_name_prefix="spotdl-search",
+        )
+        futures = {
+            executor.submit(
+                audio_provider.find_match,
+                song,
+                self.settings["only_verified_results"],
+            ): audio_provider
+            for audio_provider in self.audio_providers
+        }
+
+        matches: Dict[AudioProvider, Tuple[Result, float]] = {}
+        error: Optional[Exception] = None
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                audio_provider = futures[future]
+                try:
+                    match = self.check_match(
+                        audio_provider, song, future.result(), blacklist
+                    )
+                except Exception as exception:  # pylint: disable=broad-except
+                    logger.debug(
+                        "%s failed to search for %s: %s",
+                        audio_provider.name,
+                        song.display_name,
+                        exception,
+                    )
+                    error = error or exception
+                    continue
+
+                if match is None:
+                    continue
+
+                result, score = match
+                if result.verified and score >= EARLY_MATCH_SCORE:
+                    logger.debug(
+                        "%s found verified match for %s: %s with score %s",
+                        audio_provider.name,
+                        song.display_name,
+                        result.url,
+                        score,
+                    )
+
+                    return audio_provider, result, score
+
+                matches[audio_provider] = match
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not matches:
+            if error is not None:
+                raise error
+
+            return None
+
+        # Ties go to the provider that comes first in the settings
+        audio_provider = max(
+            (provider for provider in self.audio_providers if provider in matches),
+            key=lambda provider: matches[provider][1],
+        )
+        result, score = matches[audio_provider]
+
+        logger.debug(
+            "Best match for %s is from %s: %s with score %s",
+            song.display_name,
+            audio_provider.name,
+            result.url,
+            score,
+        )
+
+        return audio_provider, result, score
+
+    @staticmethod
+    def check_match(
+        audio_provider: AudioProvider,
+        song: Song,
+        match: Optional[Tuple[Result, float]],
+        blacklist: List[str],
+    ) -> Optional[Tuple[Result, float]]:
+        """
+        Check the match an audio provider found for a song.
+
+        ### Arguments
+        - audio_provider: The audio provider that searched for the song.
+        - song: The song.
+        - match: The best result and its score, or None if nothing was found.
+        - blacklist: The urls that shouldn't be used for the song.
 
+        ### Returns
+        - The match, or None if nothing was found or the url is blacklisted.
+        """
+
+        if match is None:
             logger.debug("%s failed to find %s", audio_provider.name, song.display_name)
 
-        raise LookupError(f"No results found for song: {song.display_name}")
+            return None
+
+        if match[0].url in blacklist:
+            logger.debug(
+                "%s found blacklisted url for %s: %s",
+                audio_provider.name,
+                song.display_name,
+                match[0].url,
+            )
+
+            return None
+
+        return match
+
+    def get_audio_downloader(
+        self, progress_hook: Callable[[Dict[str, Any]], None]
+    ) -> Union[AudioProvider, Piped]:
+        """
+        Get the audio provider used to download songs in the current thread.
+        It's created on first use and reused for the next songs,
+        so that yt-dlp's options and extractors are only set up once per thread.
+
+        ### Arguments
+        - progress_hook: The yt-dlp progress hook of the song that will be downloaded.
+
+        ### Returns
+        - The audio provider.
+        """
+
+        # yt-dlp can't remove progress hooks, so every audio downloader
+        # gets a single hook that calls the one of the current song
+        self.audio_downloaders.progress_hook = progress_hook
+
+        audio_downloader = getattr(self.audio_downloaders, "audio_downloader", None)
+        if audio_downloader is not None:
+            return audio_downloader
+
+        audio_class = (
+            Piped if self.settings["audio_providers"][0] == "piped" else AudioProvider
+        )
+        audio_downloader = audio_class(
+            output_format=self.settings["format"],
+            cookie_file=self.settings["cookie_file"],
+            search_query=self.settings["search_query"],
+            filter_results=self.settings["filter_results"],
+            yt_dlp_args=self.settings["yt_dlp_args"],
+        )
+
+        audio_downloaders = self.audio_downloaders
+
+        def progress_hook_proxy(data: Dict[str, Any]) -> None:
+            audio_downloaders.progress_hook(data)
+
+        audio_downloader.audio_handler.add_progress_hook(progress_hook_proxy)
+
+        self.audio_downloaders.audio_downloader = audio_downloader
+        with self._audio_downloader_lock:
+            self.audio_downloader_count += 1
+
+        logger.debug(
+            "Created audio downloader for thread %s", threading.current_thread().name
+        )
+
+        return audio_downloader
 
     def search_lyrics(self, song: Song) -> Optional[str]:
         """
@@ -446,23 +930,9 @@ def search_and_download(  # pylint: disable=R0911
             self.errors.append(f"Song is missing required fields: {song.display_name}")
             return song, None
 
-        # Reinitialize the song object if it's missing metadata
-        # Or if we are fetching albums
-        if (
-            (song.name is None and song.url)
-            or self.settings["fetch_albums"]
-            or any(
-                x is None
-                for x in [
-                    song.genres,
-                    song.disc_count,
-                    song.tracks_count,
-                    song.track_number,
-                    song.album_id,
-                    song.album_artist,
-                ]
-            )
-        ):
+        # Reinitialize the song object if it's still missing metadata
+        # (songs are reinitialized in batches by download_multiple_songs)
+        if self.is_missing_metadata(song):
             song = reinit_song(song)
 
         # Create the output file path
@@ -649,32 +1119,13 @@ def search_and_download(  # pylint: disable=R0911
             else:
                 download_url = song.download_url
 
-            # Initialize audio downloader
-            audio_downloader: Union[AudioProvider, Piped]
-            if self.settings["audio_providers"][0] == "piped":
-                audio_downloader = Piped(
-                    output_format=self.settings["format"],
-                    cookie_file=self.settings["cookie_file"],
-                    search_query=self.settings["search_query"],
-                    filter_results=self.settings["filter_results"],
-                    yt_dlp_args=self.settings["yt_dlp_args"],
-                )
-            else:
-                audio_downloader = AudioProvider(
-                    output_format=self.settings["format"],
-                    cookie_file=self.settings["cookie_file"],
-                    search_query=self.settings["search_query"],
-                    filter_results=self.settings["filter_results"],
-                    yt_dlp_args=self.settings["yt_dlp_args"],
-                )
-
-            logger.debug("Downloading %s using %s", song.display_name, download_url)
-
-            # Add progress hook to the audio provider
-            audio_downloader.audio_handler.add_progress_hook(
+            # Get the audio downloader of this thread
+            audio_downloader = self.get_audio_downloader(
                 display_progress_tracker.yt_dlp_progress_hook
             )
 
+            logger.debug("Downloading %s using %s", song.display_name, download_url)
+
             download_info = audio_downloader.get_download_metadata(
                 download_url, download=True
             )
@@ -846,6 +1297,12 @@ def search_and_download(  # pylint: disable=R0911
 
             return song, output_file
         except (Exception, UnicodeEncodeError) as exception:
+            # The stored url may not be available anymore, search again next time
+            if self.match_store is not None and isinstance(
+                exception, AudioProviderError
+            ):
+                self.match_store.invalidate(song, pinned=False)
+
             if isinstance(exception, UnicodeEncodeError):
                 exception_cause = exception
                 exception = DownloaderError(
@@ -190,7 +190,14 @@ def set_song_count(self, count: int) -> None:
         self.overall_total = 100 * count
 
         if not self.simple_tui:
-            if self.song_count > 4:
+            # Songs can be added while others are downloading,
+            # update the existing overall progress bar in that case
+            if self.overall_task_id is not None:
+                self.rich_progress_bar.update(
+                    self.overall_task_id, total=self.overall_total
+                )
+                self.update_overall()
+            elif self.song_count > 4:
                 self.overall_task_id = self.rich_progress_bar.add_task(
                     description="Total",
                     message=(
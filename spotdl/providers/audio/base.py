@@ -5,7 +5,12 @@
 import logging
 import re
 import shlex
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 from yt_dlp import YoutubeDL
 
@@ -19,7 +24,18 @@
 )
 from spotdl.utils.matching import get_best_matches, order_results
 
-__all__ = ["AudioProviderError", "AudioProvider", "ISRC_REGEX", "YTDLLogger"]
+__all__ = [
+    "AudioProviderError",
+    "AudioProvider",
+    "ISRC_REGEX",
+    "SCORE_THRESHOLD",
+    "ISRC_MATCH_SCORE",
+    "VIEWS_THREADS",
+    "INFO_CACHE",
+    "VideoInfoCache",
+    "get_video_id",
+    "YTDLLogger",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +75,137 @@ def error(self, msg):
 
 ISRC_REGEX = re.compile(r"^[A-Z]{2}-?\w{3}-?\d{2}-?\d{5}$")
 
+# Results within this score of the best one are compared by views,
+# results further away are never picked
+SCORE_THRESHOLD = 8
+
+# Score of ISRC matches that are trusted without scoring them
+ISRC_MATCH_SCORE = 100.0
+
+# Maximum number of views fetched at the same time by a provider
+VIEWS_THREADS = 8
+
+
+def get_video_id(url: str) -> str:
+    """
+    Get the id of a video from its url.
+
+    ### Arguments
+    - url: The url of the video.
+
+    ### Returns
+    - The `v` query parameter for YouTube urls, the url itself otherwise.
+    """
+
+    video_ids = parse_qs(urlsplit(url).query).get("v")
+
+    return video_ids[0] if video_ids else url
+
+
+class VideoInfoCache:
+    """
+    Thread-safe, bounded LRU cache of the info extracted by yt-dlp, keyed by video id.
+    Entries expire after `ttl` seconds, before the stream urls in them do.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30 * 60):
+        """
+        Initializes the cache.
+
+        ### Arguments
+        - maxsize: The maximum number of videos to keep.
+        - ttl: The number of seconds after which an entry expires.
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the info of a video from the cache.
+
+        ### Arguments
+        - url: The url of the video.
+
+        ### Returns
+        - The info or None if it's not cached or expired.
+        """
+
+        video_id = get_video_id(url)
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self._entries.pop(video_id, None)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(video_id)
+
+            return entry[1]
+
+    def set(self, url: str, info: Dict[str, Any]):
+        """
+        Add the info of a video to the cache, evicting the least recently used one if full.
+
+        ### Arguments
+        - url: The url of the video.
+        - info: The info extracted by yt-dlp.
+        """
+
+        video_id = get_video_id(url)
+        with self._lock:
+            self._entries[video_id] = (time.monotonic(), info)
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, url: str):
+        """
+        Remove the info of a video from the cache.
+
+        ### Arguments
+        - url: The url of the video.
+        """
+
+        with self._lock:
+            self._entries.pop(get_video_id(url), None)
+
+    def clear(self):
+        """
+        Remove all entries and reset the counters.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache statistics.
+
+        ### Returns
+        - Dictionary with the hits, misses and size of the cache.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+# Shared by the providers used to search and the ones used to download
+INFO_CACHE = VideoInfoCache()
+
 
 class AudioProvider:
     """
@@ -76,6 +223,7 @@ def __init__(
         search_query: Optional[str] = None,
         filter_results: bool = True,
         yt_dlp_args: Optional[str] = None,
+        speculative_search: bool = False,
     ) -> None:
         """
         Base class for audio providers.
@@ -86,12 +234,14 @@ def __init__(
         - cookie_file: The path to a file containing cookies to be used by YTDL.
         - search_query: The query to use when searching for songs.
         - filter_results: Whether to filter results.
+        - speculative_search: Whether to run all searches for a song at the same time.
         """
 
         self.output_format = output_format
         self.cookie_file = cookie_file
         self.search_query = search_query
         self.filter_results = filter_results
+        self.speculative_search = speculative_search
 
         if self.output_format == "m4a":
             ytdl_format = "bestaudio[ext=m4a]/bestaudio/best"
@@ -117,7 +267,30 @@ def __init__(
                 shlex.split(yt_dlp_args), yt_dlp_options
             )
 
+        # YoutubeDL changes the options it's given, keep a copy for the other instances
+        self.yt_dlp_options = dict(yt_dlp_options)
         self.audio_handler = YoutubeDL(yt_dlp_options)
+        self.info_handlers = threading.local()
+        self.views_executor = ThreadPoolExecutor(
+            VIEWS_THREADS, thread_name_prefix="spotdl-views"
+        )
+
+    def get_info_handler(self) -> YoutubeDL:
+        """
+        Get the yt-dlp instance used to get metadata in the current thread.
+        YoutubeDL isn't thread-safe, so every thread gets its own instance,
+        `audio_handler` is only used for downloads.
+
+        ### Returns
+        - The YoutubeDL instance of the current thread.
+        """
+
+        info_handler = getattr(self.info_handlers, "info_handler", None)
+        if info_handler is None:
+            info_handler = YoutubeDL(dict(self.yt_dlp_options))
+            self.info_handlers.info_handler = info_handler
+
+        return info_handler
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
         """
@@ -154,11 +327,31 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
 
         ### Arguments
         - song: The song to search for.
+        - only_verified: Whether to only use verified results.
 
         ### Returns
         - The url of the best match or None if no match was found.
         """
 
+        match = self.find_match(song, only_verified)
+
+        return match[0].url if match else None
+
+    def find_match(
+        self, song: Song, only_verified: bool = False
+    ) -> Optional[Tuple[Result, float]]:
+        """
+        Search for a song and return best match with its score.
+
+        ### Arguments
+        - song: The song to search for.
+        - only_verified: Whether to only use verified results.
+
+        ### Returns
+        - The best result and its score or None if no match was found.
+        ISRC matches that are trusted without scoring them have a score of 100.
+        """
+
         # Create initial search query
         search_query = create_song_title(song.name, song.artists).lower()
         if self.search_query:
@@ -168,11 +361,71 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
 
         logger.debug("[%s] Searching for %s", song.song_id, search_query)
 
+        searches: List[Tuple[str, Dict[str, Any]]] = [
+            (search_query, options) for options in self.GET_RESULTS_OPTS
+        ]
+        if song.isrc and self.SUPPORTS_ISRC and not self.search_query:
+            searches.insert(0, (song.isrc, {}))
+
+        if not self.speculative_search or len(searches) < 2:
+            return self.match_results(
+                song, search_query, only_verified, self.get_results
+            )
+
+        # Start all searches right away, the results are still used in the same order,
+        # so a video match doesn't have to wait for the songs search to finish first
+        executor = ThreadPoolExecutor(
+            max_workers=len(searches), thread_name_prefix="spotdl-search"
+        )
+        futures = {
+            (search_term, tuple(sorted(options.items()))): executor.submit(
+                self.get_results, search_term, **options
+            )
+            for search_term, options in searches
+        }
+
+        def get_results(search_term: str, **options: Any) -> List[Result]:
+            future = futures.get((search_term, tuple(sorted(options.items()))))
+            if future is None:
+                return self.get_results(search_term, **options)
+
+            return future.result()
+
+        try:
+            return self.match_results(song, search_query, only_verified, get_results)
+        finally:
+            # Searches whose results aren't needed anymore are cancelled if they
+            # didn't start yet, the others finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def match_results(
+        self,
+        song: Song,
+        search_query: str,
+        only_verified: bool,
+        get_results: Callable[..., List[Result]],
+    ) -> Optional[Tuple[Result, float]]:
+        """
+        Find the best match for a song in the search results.
+        The ISRC results are checked first, then the results of every
+        search in `GET_RESULTS_OPTS`, until a good enough match is found.
+
+        ### Arguments
+        - song: The song to search for.
+        - search_query: The search query of the song.
+        - only_verified: Whether to only use verified results.
+        - get_results: Function used to get the results of a search,
+            with the same arguments as `get_results`.
+
+        ### Returns
+        - The best result and its score or None if no match was found.
+        """
+
         isrc_urls: List[str] = []
 
         # search for song using isrc if it's available
         if song.isrc and self.SUPPORTS_ISRC and not self.search_query:
-            isrc_results = self.get_results(song.isrc)
+            isrc_results = get_results(song.isrc)
 
             if only_verified:
                 isrc_results = [result for result in isrc_results if result.verified]
@@ -199,11 +452,14 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
                     isrc_results[0].url,
                 )
 
-                return isrc_results[0].url
+                return isrc_results[0], ISRC_MATCH_SCORE
 
             if len(isrc_results) > 0:
                 sorted_isrc_results = order_results(
-                    isrc_results, song, self.search_query
+                    isrc_results,
+                    song,
+                    self.search_query,
+                    score_threshold=SCORE_THRESHOLD,
                 )
 
                 # get the best result, if the score is above 80 return it
@@ -227,13 +483,14 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
                             best_isrc[1],
                         )
 
-                        return best_isrc[0].url
+                        return best_isrc
 
         results: Dict[Result, float] = {}
+        searched_urls: Set[str] = set()
         for options in self.GET_RESULTS_OPTS:
             # Query YTM by songs only first, this way if we get correct result on the first try
             # we don't have to make another request
-            search_results = self.get_results(search_query, **options)
+            search_results = get_results(search_query, **options)
 
             if only_verified:
                 search_results = [
@@ -261,7 +518,22 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
                     "[%s] Best ISRC result is %s", song.song_id, isrc_result.url
                 )
 
-                return isrc_result.url
+                return isrc_result, ISRC_MATCH_SCORE
+
+            # Skip the results that were already scored in a previous search,
+            # e.g. videos that were also returned as songs
+            new_search_results = [
+                result for result in search_results if result.url not in searched_urls
+            ]
+            if len(new_search_results) != len(search_results):
+                logger.debug(
+                    "[%s] Skipping %s results found in previous searches",
+                    song.song_id,
+                    len(search_results) - len(new_search_results),
+                )
+
+            search_results = new_search_results
+            searched_urls.update(result.url for result in search_results)
 
             logger.debug(
                 "[%s] Have to filter results: %s", song.song_id, self.filter_results
@@ -269,7 +541,12 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
 
             if self.filter_results:
                 # Order results
-                new_results = order_results(search_results, song, self.search_query)
+                new_results = order_results(
+                    search_results,
+                    song,
+                    self.search_query,
+                    score_threshold=SCORE_THRESHOLD,
+                )
             else:
                 new_results = {}
                 if len(search_results) > 0:
@@ -298,7 +575,7 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
                         best_score,
                     )
 
-                    return best_result.url
+                    return best_result, best_score
 
                 # Update final results with new results
                 results.update(new_results)
@@ -317,7 +594,7 @@ def search(self, song: Song, only_verified: bool = False) -> Optional[str]:
             best_score,
         )
 
-        return best_result.url
+        return best_result, best_score
 
     def get_best_result(self, results: Dict[Result, float]) -> Tuple[Result, float]:
         """
@@ -331,7 +608,7 @@ def get_best_result(self, results: Dict[Result, float]) -> Tuple[Result, float]:
         - The best match URL and its score
         """
 
-        best_results = get_best_matches(results, 8)
+        best_results = get_best_matches(results, SCORE_THRESHOLD)
 
         # If we have only one result, return it
         if len(best_results) == 1:
@@ -349,12 +626,23 @@ def get_best_result(self, results: Dict[Result, float]) -> Tuple[Result, float]:
         # return the one with the highest score
         # and most views
         if len(best_results) > 1:
-            views: List[int] = []
-            for best_result in best_results:
-                if best_result[0].views:
-                    views.append(best_result[0].views)
-                else:
-                    views.append(self.get_views(best_result[0].url))
+            # Fetch the missing views at the same time
+            missing_urls = [
+                result.url for result, _ in best_results if not result.views
+            ]
+            fetched_views: Dict[str, int] = {}
+            if missing_urls:
+                fetched_views = dict(
+                    zip(
+                        missing_urls,
+                        self.views_executor.map(self.get_views, missing_urls),
+                    )
+                )
+
+            views: List[int] = [
+                result.views if result.views else fetched_views[result.url]
+                for result, _ in best_results
+            ]
 
             highest_views = max(views)
             lowest_views = min(views)
@@ -382,15 +670,43 @@ def get_download_metadata(self, url: str, download: bool = False) -> Dict:
 
         ### Arguments
         - url: The url to get metadata for.
+        - download: Whether to download the video.
 
         ### Returns
         - A dictionary containing the metadata.
+
+        ### Notes
+        - The metadata is cached in `INFO_CACHE`, e.g. when getting the views
+            of the results, and reused for the download instead of extracting it again.
+            Cached metadata is shared and shouldn't be modified.
         """
 
+        info = INFO_CACHE.get(url)
+        if info is not None and not download:
+            return info
+
+        if info is not None:
+            try:
+                # Same as yt-dlp's --load-info-json, the formats are selected again
+                return self.audio_handler.process_ie_result(
+                    self.audio_handler.sanitize_info(info, True), download=True
+                )
+            except Exception as exception:  # pylint: disable=broad-except
+                logger.debug(
+                    "Could not download %s with the cached metadata: %s",
+                    url,
+                    exception,
+                )
+                INFO_CACHE.delete(url)
+
         try:
-            data = self.audio_handler.extract_info(url, download=download)
+            audio_handler = self.audio_handler if download else self.get_info_handler()
+            data = audio_handler.extract_info(url, download=download)
 
             if data:
+                if not download:
+                    INFO_CACHE.set(url, data)
+
                 return data
         except Exception as exception:
             logger.debug(exception)
@@ -4,6 +4,8 @@
 
 import logging
 import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -11,6 +13,7 @@
 
 from spotdl.providers.audio.base import (
     ISRC_REGEX,
+    VIEWS_THREADS,
     AudioProvider,
     AudioProviderError,
     YTDLLogger,
@@ -45,6 +48,7 @@ def __init__(  # pylint: disable=super-init-not-called
         search_query: Optional[str] = None,
         filter_results: bool = True,
         yt_dlp_args: Optional[str] = None,
+        speculative_search: bool = False,
     ) -> None:
         """
         Pipe audio provider class
@@ -55,12 +59,14 @@ def __init__(  # pylint: disable=super-init-not-called
         - cookie_file: The path to a file containing cookies to be used by YTDL.
         - search_query: The query to use when searching for songs.
         - filter_results: Whether to filter results.
+        - speculative_search: Whether to run all searches for a song at the same time.
         """
 
         self.output_format = output_format
         self.cookie_file = cookie_file
         self.search_query = search_query
         self.filter_results = filter_results
+        self.speculative_search = speculative_search
 
         if self.output_format == "m4a":
             ytdl_format = "best[ext=m4a]/best"
@@ -84,7 +90,13 @@ def __init__(  # pylint: disable=super-init-not-called
             user_options = args_to_ytdlp_options(shlex.split(yt_dlp_args))
             yt_dlp_options.update(user_options)
 
+        # YoutubeDL changes the options it's given, keep a copy for the other instances
+        self.yt_dlp_options = dict(yt_dlp_options)
         self.audio_handler = YoutubeDL(yt_dlp_options)
+        self.info_handlers = threading.local()
+        self.views_executor = ThreadPoolExecutor(
+            VIEWS_THREADS, thread_name_prefix="spotdl-views"
+        )
         self.session = requests.Session()
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
@@ -192,4 +204,6 @@ def get_download_metadata(self, url: str, download: bool = False) -> Dict:
                 }
             )
 
-        return self.audio_handler.process_video_result(yt_dlp_json, download=download)
+        audio_handler = self.audio_handler if download else self.get_info_handler()
+
+        return audio_handler.process_video_result(yt_dlp_json, download=download)
@@ -4,11 +4,10 @@
 
 from typing import Any, Dict, List
 
-from ytmusicapi import YTMusic
-
 from spotdl.providers.audio.base import ISRC_REGEX, AudioProvider
 from spotdl.types.result import Result
 from spotdl.utils.formatter import parse_duration
+from spotdl.utils.ytmusic import ytm_client
 
 __all__ = ["YouTubeMusic"]
 
@@ -24,19 +23,6 @@ class YouTubeMusic(AudioProvider):
         {"filter": "videos", "ignore_spelling": True, "limit": 50},
     ]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """
-        Initialize the YouTube Music API
-
-        ### Arguments
-        - args: Arguments passed to the `AudioProvider` class.
-        - kwargs: Keyword arguments passed to the `AudioProvider` class.
-        """
-
-        super().__init__(*args, **kwargs)
-
-        self.client = YTMusic(language="de")
-
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
         """
         Get results from YouTube Music API and simplify them
@@ -54,7 +40,8 @@ def get_results(self, search_term: str, **kwargs) -> List[Result]:
         #     print("FORCEFULLY SETTING FILTER TO SONGS")
         #     kwargs["filter"] = "songs"
 
-        search_results = self.client.search(search_term, **kwargs)
+        with ytm_client("de") as client:
+            search_results = client.search(search_term, **kwargs)
 
         # Simplify results
         results = []
@@ -6,7 +6,7 @@
 from typing import Any, Dict, List, Tuple
 
 from spotdl.types.song import Song, SongList
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import SpotifyClient, get_album, get_all_items
 
 __all__ = ["Album", "AlbumError"]
 
@@ -37,9 +37,7 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
         - A dictionary with metadata.
         """
 
-        spotify_client = SpotifyClient()
-
-        album_metadata = spotify_client.album(url)
+        album_metadata = get_album(url)
         if album_metadata is None:
             raise AlbumError(
                 "Couldn't get metadata, check if you have passed correct album id"
@@ -51,26 +49,35 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
             "url": url,
         }
 
-        album_response = spotify_client.album_tracks(url)
+        return metadata, Album.get_songs(album_metadata)
+
+    @staticmethod
+    def get_songs(album_metadata: Dict[str, Any]) -> List[Song]:
+        """
+        Get songs from raw album metadata.
+        Remaining pages of tracks are fetched if the album has more
+        tracks than the album object contains.
+
+        ### Arguments
+        - album_metadata: The raw album metadata.
+
+        ### Returns
+        - The list of songs.
+        """
+
+        # The album object already contains the first page of tracks
+        album_response = album_metadata.get("tracks") or SpotifyClient().album_tracks(
+            album_metadata["id"]
+        )
         if album_response is None:
             raise AlbumError(
                 "Couldn't get metadata, check if you have passed correct album id"
             )
 
-        tracks = album_response["items"]
-
         # Get all tracks from album
-        while album_response["next"]:
-            album_response = spotify_client.next(album_response)
-
-            # Failed to get response, break the loop
-            if album_response is None:
-                break
-
-            tracks.extend(album_response["items"])
-
-        if album_response is None:
-            raise AlbumError(f"Failed to get album response: {url}")
+        tracks = get_all_items(album_response)
+        if len(tracks) < album_response.get("total", 0):
+            raise AlbumError(f"Failed to get album response: {album_metadata['id']}")
 
         songs = []
         for track in tracks:
@@ -115,4 +122,4 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
 
             songs.append(song)
 
-        return metadata, songs
+        return songs
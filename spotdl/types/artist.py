@@ -2,16 +2,31 @@
 Artist module for retrieving artist data from Spotify.
 """
 
+import concurrent.futures
+import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from spotipy.exceptions import SpotifyException
 
 from spotdl.types.album import Album
 from spotdl.types.song import Song, SongList
 from spotdl.utils.formatter import slugify
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import (
+    ALBUMS_BATCH_SIZE,
+    REQUEST_THREADS,
+    SpotifyClient,
+    get_album,
+    get_albums,
+    get_all_items,
+    get_artist,
+    get_spotify_id,
+)
 
 __all__ = ["Artist", "ArtistError"]
 
+logger = logging.getLogger(__name__)
+
 
 class ArtistError(Exception):
     """
@@ -28,7 +43,7 @@ class Artist(SongList):
     """
 
     genres: List[str]
-    albums: List[Album]
+    albums: List[str]
 
     @staticmethod
     def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
@@ -42,11 +57,30 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
         - Dict with metadata for artist.
         """
 
+        metadata, _ = Artist.get_discography(url)
+        songs_list = list(Artist.get_songs(metadata["albums"]))
+
+        return metadata, songs_list
+
+    @staticmethod
+    def get_discography(url: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Get metadata for artist and the URLs of their albums,
+        without fetching the albums.
+
+        ### Arguments
+        - url: The URL of the artist.
+
+        ### Returns
+        - Dict with metadata for artist.
+        - The number of tracks of the albums, before the songs are deduplicated.
+        """
+
         # query spotify for artist details
         spotify_client = SpotifyClient()
 
         # get artist info
-        raw_artist_meta = spotify_client.artist(url)
+        raw_artist_meta = get_artist(url)
 
         if raw_artist_meta is None:
             raise ArtistError(
@@ -68,36 +102,14 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
         # different countries
         albums: List[str] = []
         known_albums: Set[str] = set()
-        for album in artist_albums["items"]:
-            albums.append(album["external_urls"]["spotify"])
-            known_albums.add(slugify(album["name"]))
-
-        # Fetch all artist albums
-        while artist_albums and artist_albums["next"]:
-            artist_albums = spotify_client.next(artist_albums)
-            if artist_albums is None:
-                break
+        track_count = 0
+        for album in get_all_items(artist_albums):
+            album_name = slugify(album["name"])
 
-            for album in artist_albums["items"]:
-                album_name = slugify(album["name"])
-
-                if album_name not in known_albums:
-                    albums.append(album["external_urls"]["spotify"])
-                    known_albums.add(album_name)
-
-        songs = []
-        for album in albums:
-            album_obj = Album.from_url(album, fetch_songs=False)
-            songs.extend(album_obj.songs)
-
-        # Very aggressive deduplication
-        songs_list = []
-        songs_names = set()
-        for song in songs:
-            slug_name = slugify(song.name)
-            if song.name not in songs_names:
-                songs_list.append(song)
-                songs_names.add(slug_name)
+            if album_name not in known_albums:
+                albums.append(album["external_urls"]["spotify"])
+                known_albums.add(album_name)
+                track_count += album.get("total_tracks") or 0
 
         metadata = {
             "name": raw_artist_meta["name"],
@@ -106,4 +118,53 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
             "albums": albums,
         }
 
-        return metadata, songs_list
+        return metadata, track_count
+
+    @staticmethod
+    def get_songs(albums: List[str], threads: int = REQUEST_THREADS) -> Iterator[Song]:
+        """
+        Get songs from artist albums.
+        Albums are fetched in batches using Spotify's multi-id endpoint,
+        and songs are yielded as soon as their album arrives.
+        Albums missing from a batch are fetched one by one,
+        the ones that still can't be fetched are skipped.
+
+        ### Arguments
+        - albums: The URLs of the albums.
+        - threads: The number of batches to fetch concurrently.
+
+        ### Returns
+        - Iterator over the deduplicated songs, in the order of the albums.
+        """
+
+        album_ids = list(dict.fromkeys(get_spotify_id(album) for album in albums))
+        batches = [
+            album_ids[index : index + ALBUMS_BATCH_SIZE]
+            for index in range(0, len(album_ids), ALBUMS_BATCH_SIZE)
+        ]
+
+        # Very aggressive deduplication
+        songs_names: Set[str] = set()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            for batch, raw_albums in zip(batches, executor.map(get_albums, batches)):
+                for album_id in batch:
+                    album_metadata = raw_albums.get(album_id)
+                    if album_metadata is None:
+                        # The whole batch is missing when its request failed,
+                        # retry the album on its own
+                        try:
+                            album_metadata = get_album(album_id)
+                        except SpotifyException as exception:
+                            logger.debug(
+                                "Failed to get album %s: %s", album_id, exception
+                            )
+
+                    if album_metadata is None:
+                        logger.warning("Couldn't get album %s, skipping it", album_id)
+                        continue
+
+                    for song in Album.get_songs(album_metadata):
+                        slug_name = slugify(song.name)
+                        if slug_name not in songs_names:
+                            songs_names.add(slug_name)
+                            yield song
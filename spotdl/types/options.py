@@ -34,6 +34,7 @@ class SpotifyOptions(TypedDict):
     no_cache: bool
     max_retries: int
     use_cache_file: bool
+    requests_per_second: Optional[float]
 
 
 class DownloaderOptions(TypedDict):
@@ -56,9 +57,12 @@ class DownloaderOptions(TypedDict):
     ffmpeg_args: Optional[str]
     format: str
     save_file: Optional[str]
+    compact_json: bool
     filter_results: bool
     album_type: Optional[str]
     threads: int
+    match_cache_size: int
+    match_store: bool
     cookie_file: Optional[str]
     restrict: Optional[str]
     print_errors: bool
@@ -75,6 +79,8 @@ class DownloaderOptions(TypedDict):
     generate_lrc: bool
     force_update_metadata: bool
     only_verified_results: bool
+    parallel_search: bool
+    speculative_search: bool
     sync_without_deleting: bool
     max_filename_length: Optional[int]
     yt_dlp_args: Optional[str]
@@ -131,6 +137,7 @@ class SpotifyOptionalOptions(TypedDict, total=False):
     no_cache: bool
     max_retries: int
     use_cache_file: bool
+    requests_per_second: Optional[float]
 
 
 class DownloaderOptionalOptions(TypedDict, total=False):
@@ -153,9 +160,12 @@ class DownloaderOptionalOptions(TypedDict, total=False):
     ffmpeg_args: Optional[str]
     format: str
     save_file: Optional[str]
+    compact_json: bool
     filter_results: bool
     album_type: Optional[str]
     threads: int
+    match_cache_size: int
+    match_store: bool
     cookie_file: Optional[str]
     restrict: Optional[str]
     print_errors: bool
@@ -172,6 +182,8 @@ class DownloaderOptionalOptions(TypedDict, total=False):
     generate_lrc: bool
     force_update_metadata: bool
     only_verified_results: bool
+    parallel_search: bool
+    speculative_search: bool
     sync_without_deleting: bool
     max_filename_length: Optional[int]
     yt_dlp_args: Optional[str]
@@ -7,12 +7,23 @@
 from typing import Any, Dict, List, Tuple
 
 from spotdl.types.song import Song, SongList
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import ENTITY_MEMO, SpotifyClient, get_all_items
 
-__all__ = ["Playlist", "PlaylistError"]
+__all__ = ["Playlist", "PlaylistError", "PLAYLIST_FIELDS", "PLAYLIST_ITEMS_FIELDS"]
 
 logger = logging.getLogger(__name__)
 
+# Fields requested from the playlist endpoints, only what `get_metadata` reads.
+# Leaves out the first page of tracks embedded in the playlist object,
+# available markets and the full album objects of the tracks
+PLAYLIST_FIELDS = "name,description,external_urls,owner(display_name),images"
+PLAYLIST_ITEMS_FIELDS = (
+    "href,limit,next,offset,total,"
+    "items(track(id,name,type,is_local,duration_ms,disc_number,track_number,"
+    "explicit,external_urls,external_ids,artists(name),"
+    "album(id,name,album_type,release_date,total_tracks,images,artists(name))))"
+)
+
 
 class PlaylistError(Exception):
     """
@@ -45,7 +56,7 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
 
         spotify_client = SpotifyClient()
 
-        playlist = spotify_client.playlist(url)
+        playlist = spotify_client.playlist(url, fields=PLAYLIST_FIELDS)
         if playlist is None:
             raise PlaylistError("Invalid playlist URL.")
 
@@ -69,21 +80,16 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
             ),
         }
 
-        playlist_response = spotify_client.playlist_items(url)
+        playlist_response = spotify_client.playlist_items(
+            url, fields=PLAYLIST_ITEMS_FIELDS
+        )
         if playlist_response is None:
             raise PlaylistError(f"Wrong playlist id: {url}")
 
         # Get all tracks from playlist
-        tracks = playlist_response["items"]
-        while playlist_response["next"]:
-            playlist_response = spotify_client.next(playlist_response)
-
-            # Failed to get response, break the loop
-            if playlist_response is None:
-                break
-
-            # Add tracks to the list
-            tracks.extend(playlist_response["items"])
+        tracks = get_all_items(
+            playlist_response, params={"fields": PLAYLIST_ITEMS_FIELDS}
+        )
 
         songs = []
         for track_no, track in enumerate(tracks):
@@ -107,6 +113,13 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
 
             album_meta = track_meta.get("album", {})
             release_date = album_meta.get("release_date")
+
+            # Use the full album object if it was already fetched during this run
+            full_album_meta = (
+                ENTITY_MEMO.peek("album", album_meta["id"])
+                if album_meta.get("id")
+                else None
+            ) or {}
             artists = [artist["name"] for artist in track_meta.get("artists", [])]
             song = Song.from_missing_data(
                 name=track_meta["name"],
@@ -138,6 +151,17 @@ def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
                     else None
                 ),
                 list_position=track_no + 1,
+                disc_count=(
+                    int(full_album_meta["tracks"]["items"][-1]["disc_number"])
+                    if full_album_meta.get("tracks", {}).get("items")
+                    else None
+                ),
+                publisher=full_album_meta.get("label"),
+                copyright_text=(
+                    full_album_meta["copyrights"][0]["text"]
+                    if full_album_meta.get("copyrights")
+                    else None
+                ),
             )
 
             songs.append(song)
@@ -3,12 +3,20 @@
 """
 
 import json
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass, fields
 from typing import Any, Dict, List, Optional, Tuple
 
 from rapidfuzz import fuzz
 
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import (
+    SpotifyClient,
+    get_album,
+    get_albums,
+    get_artist,
+    get_artists,
+    get_tracks,
+)
 
 __all__ = ["Song", "SongList", "SongError"]
 
@@ -25,10 +33,29 @@ class SongListError(Exception):
     """
 
 
-@dataclass
+# Fields usually shared by many songs (same album, artist or list),
+# their values are interned to keep a single copy in large libraries
+INTERNED_FIELDS = (
+    "artist",
+    "album_name",
+    "album_artist",
+    "date",
+    "publisher",
+    "cover_url",
+    "copyright_text",
+    "album_id",
+    "list_name",
+    "list_url",
+    "artist_id",
+    "album_type",
+)
+
+
+@dataclass(slots=True)
 class Song:
     """
     Song class. Contains all the information about a song.
+    Uses slots and interned strings to keep large libraries compact.
     """
 
     name: str
@@ -62,6 +89,28 @@ class Song:
     artist_id: Optional[str] = None
     album_type: Optional[str] = None
 
+    def __post_init__(self):
+        """
+        Intern the strings shared by many songs.
+        """
+
+        for field_name in INTERNED_FIELDS:
+            value = getattr(self, field_name)
+            if isinstance(value, str):
+                setattr(self, field_name, sys.intern(value))
+
+        if self.artists:
+            self.artists = [
+                sys.intern(artist) if isinstance(artist, str) else artist
+                for artist in self.artists
+            ]
+
+        if self.genres:
+            self.genres = [
+                sys.intern(genre) if isinstance(genre, str) else genre
+                for genre in self.genres
+            ]
+
     @classmethod
     def from_url(cls, url: str) -> "Song":
         """
@@ -93,19 +142,110 @@ def from_url(cls, url: str) -> "Song":
 
         # get artist info
         primary_artist_id = raw_track_meta["artists"][0]["id"]
-        raw_artist_meta: Dict[str, Any] = spotify_client.artist(primary_artist_id)  # type: ignore
+        raw_artist_meta: Dict[str, Any] = get_artist(primary_artist_id)  # type: ignore
 
         # get album info
         album_id = raw_track_meta["album"]["id"]
-        raw_album_meta: Dict[str, Any] = spotify_client.album(album_id)  # type: ignore
+        raw_album_meta: Dict[str, Any] = get_album(album_id)  # type: ignore
 
         # create song object
+        return cls.from_raw_metadata(raw_track_meta, raw_artist_meta, raw_album_meta)
+
+    @classmethod
+    def list_from_urls(
+        cls, urls: List[str], threads: int = 1
+    ) -> "List[Optional[Song]]":
+        """
+        Creates a list of Song objects from a list of URLs.
+        Tracks, albums and artists are fetched in batches using
+        Spotify's multi-id endpoints, every album and artist is fetched only once.
+
+        ### Arguments
+        - urls: The URLs of the songs.
+        - threads: The number of requests to run concurrently.
+
+        ### Returns
+        - The list of Song objects in the same order as `urls`,
+        with `None` in place of songs that couldn't be fetched.
+        """
+
+        track_ids: List[Optional[str]] = []
+        for url in urls:
+            if "open.spotify.com" not in url or "track/" not in url:
+                track_ids.append(None)
+                continue
+
+            track_ids.append(url.split("track/", 1)[1].split("?")[0].split("/")[0])
+
+        raw_tracks = get_tracks(
+            [track_id for track_id in track_ids if track_id], threads
+        )
+
+        album_ids: List[str] = []
+        artist_ids: List[str] = []
+        for raw_track_meta in raw_tracks.values():
+            if raw_track_meta is None:
+                continue
+
+            album_ids.append(raw_track_meta["album"]["id"])
+            artist_ids.append(raw_track_meta["artists"][0]["id"])
+
+        raw_albums = get_albums(album_ids, threads)
+        raw_artists = get_artists(artist_ids, threads)
+
+        songs: List[Optional[Song]] = []
+        for track_id in track_ids:
+            raw_track_meta = raw_tracks.get(track_id) if track_id else None
+            if (
+                raw_track_meta is None
+                or raw_track_meta["duration_ms"] == 0
+                or raw_track_meta["name"].strip() == ""
+            ):
+                songs.append(None)
+                continue
+
+            raw_artist_meta = raw_artists.get(raw_track_meta["artists"][0]["id"])
+            raw_album_meta = raw_albums.get(raw_track_meta["album"]["id"])
+            if raw_artist_meta is None or raw_album_meta is None:
+                songs.append(None)
+                continue
+
+            try:
+                songs.append(
+                    cls.from_raw_metadata(
+                        raw_track_meta, raw_artist_meta, raw_album_meta
+                    )
+                )
+            except (KeyError, IndexError, TypeError, ValueError):
+                songs.append(None)
+
+        return songs
+
+    @classmethod
+    def from_raw_metadata(
+        cls,
+        raw_track_meta: Dict[str, Any],
+        raw_artist_meta: Dict[str, Any],
+        raw_album_meta: Dict[str, Any],
+    ) -> "Song":
+        """
+        Creates a Song object from raw Spotify metadata.
+
+        ### Arguments
+        - raw_track_meta: The track object.
+        - raw_artist_meta: The primary artist object.
+        - raw_album_meta: The album object.
+
+        ### Returns
+        - The Song object.
+        """
+
         return cls(
             name=raw_track_meta["name"],
             artists=[artist["name"] for artist in raw_track_meta["artists"]],
             artist=raw_track_meta["artists"][0]["name"],
-            artist_id=primary_artist_id,
-            album_id=album_id,
+            artist_id=raw_track_meta["artists"][0]["id"],
+            album_id=raw_track_meta["album"]["id"],
             album_name=raw_album_meta["name"],
             album_artist=raw_album_meta["artists"][0]["name"],
             album_type=raw_album_meta.get("album_type"),
@@ -274,9 +414,21 @@ def json(self) -> Dict[str, Any]:
 
         ### Returns
         - The dictionary.
+
+        ### Notes
+        - Values are only strings, numbers and lists of strings,
+        so a shallow copy is enough (unlike `dataclasses.asdict`).
         """
 
-        return asdict(self)
+        data = {}
+        for field_name in SONG_FIELDS:
+            value = getattr(self, field_name)
+            data[field_name] = list(value) if isinstance(value, list) else value
+
+        return data
+
+
+SONG_FIELDS = tuple(field.name for field in fields(Song))
 
 
 @dataclass(frozen=True)
@@ -367,7 +519,11 @@ def json(self) -> Dict[str, Any]:
         - The dictionary.
         """
 
-        return asdict(self)
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        data["urls"] = list(self.urls)
+        data["songs"] = [song.json for song in self.songs]
+
+        return data
 
     @staticmethod
     def get_metadata(url: str) -> Tuple[Dict[str, Any], List[Song]]:
@@ -177,6 +177,28 @@ def parse_main_options(parser: _ArgumentGroup):
         help="Use only verified results. (Not all providers support this)",
     )
 
+    # Add parallel search argument
+    parser.add_argument(
+        "--parallel-search",
+        action="store_const",
+        const=True,
+        help=(
+            "Search with all audio providers at the same time and use the best match, "
+            "instead of trying them one after another."
+        ),
+    )
+
+    # Add speculative search argument
+    parser.add_argument(
+        "--speculative-search",
+        action="store_const",
+        const=True,
+        help=(
+            "Run the ISRC, songs and videos searches of a provider at the same time, "
+            "instead of waiting for each search to finish. Makes more requests."
+        ),
+    )
+
 
 def parse_spotify_options(parser: _ArgumentGroup):
     """
@@ -252,14 +274,26 @@ def parse_spotify_options(parser: _ArgumentGroup):
         const=True,
         help=(
             "Use the cache file to get metadata. "
-            "It's located under C:\\Users\\user\\.spotdl\\.spotify_cache "
-            "or ~/.spotdl/.spotify_cache under linux. "
-            "It only caches tracks and "
+            "It's located under C:\\Users\\user\\.spotdl\\.spotify_cache.db "
+            "or ~/.spotdl/.spotify_cache.db under linux. "
+            "It caches tracks, albums, artists and playlists, "
+            "entries expire after a while depending on their type and the file "
             "gets updated whenever spotDL gets metadata from Spotify. "
             "(It may provide outdated metadata use with caution)"
         ),
     )
 
+    # Add requests per second argument
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        help=(
+            "The maximum number of requests per second made to Spotify, "
+            "shared by all threads. Requests are also paused when Spotify "
+            "responds with 429 (Too Many Requests)."
+        ),
+    )
+
 
 def parse_ffmpeg_options(parser: _ArgumentGroup):
     """
@@ -283,6 +317,16 @@ def parse_ffmpeg_options(parser: _ArgumentGroup):
         help="The number of threads to use when downloading songs.",
     )
 
+    # Add match cache size argument
+    parser.add_argument(
+        "--match-cache-size",
+        type=int,
+        help=(
+            "The number of entries kept in the caches used "
+            "when matching search results, 0 disables them."
+        ),
+    )
+
     # Add constant bit rate argument
     parser.add_argument(
         "--bitrate",
@@ -347,13 +391,25 @@ def parse_output_options(parser: _ArgumentGroup):
         type=str,
         help=(
             "The file to save/load the songs data from/to. "
-            "It has to end with .spotdl. "
+            "It has to end with .spotdl, or .spotdl.jsonl to write and read "
+            "one song per line (written as soon as each song is processed). "
             "If combined with the download operation, it will save the songs data to the file. "
             "Required for save/sync (use - to print to stdout when using save). "
         ),
         required=len(sys.argv) > 1 and sys.argv[1] in ["save"],
     )
 
+    # Add compact json argument
+    parser.add_argument(
+        "--compact-json",
+        action="store_const",
+        const=True,
+        help=(
+            "Write the save and sync files without indentation, "
+            "smaller and faster to write for big libraries."
+        ),
+    )
+
     # Add preload argument
     parser.add_argument(
         "--preload",
@@ -362,6 +418,19 @@ def parse_output_options(parser: _ArgumentGroup):
         help="Preload the download url to speed up the download process.",
     )
 
+    # Add match store argument
+    parser.add_argument(
+        "--match-store",
+        action="store_const",
+        const=True,
+        help=(
+            "Remember the download url chosen for each song between runs. "
+            "It's located under C:\\Users\\user\\.spotdl\\.match_store.db "
+            "or ~/.spotdl/.match_store.db under linux. "
+            "Songs found in it aren't searched again, matches expire after 30 days."
+        ),
+    )
+
     # Add name format argument
     parser.add_argument(
         "--output",
@@ -0,0 +1,357 @@
+"""
+Module with cache backends used to store responses between requests and runs.
+
+```python
+from spotdl.utils.cache import SQLiteCache
+
+cache = SQLiteCache("cache.db", ttls={"tracks": 60 * 60 * 24})
+cache.set("key", {"value": 1}, "tracks")
+cache.get("key")
+```
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from spotdl.utils.jsonio import dumps, loads
+
+__all__ = [
+    "CacheError",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class CacheError(Exception):
+    """
+    Base class for all exceptions related to cache backends.
+    """
+
+
+class CacheBackend:
+    """
+    Base class for all cache backends.
+    Entries are grouped in namespaces (e.g. api endpoints),
+    backends may use them to apply different expiration times.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+
+        ### Returns
+        - The cached value or None if it's missing or expired.
+        """
+
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, namespace: str = "") -> None:
+        """
+        Add an entry to the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+        - value: The JSON serializable value to cache.
+        - namespace: The namespace of the entry.
+        """
+
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+        """
+
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """
+        Make sure that all entries are persisted.
+        """
+
+    def close(self) -> None:
+        """
+        Flush and release the resources used by the cache.
+        """
+
+        self.flush()
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+        """
+
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-memory cache backend, entries live only for the duration of the run.
+    """
+
+    def __init__(self):
+        """
+        Initializes the memory cache.
+        """
+
+        self._entries: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+
+        ### Returns
+        - The cached value or None if it's missing.
+        """
+
+        return self._entries.get(key)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        namespace: str = "",  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Add an entry to the cache, entries never expire so the namespace is ignored.
+
+        ### Arguments
+        - key: The key of the entry.
+        - value: The value to cache.
+        - namespace: The namespace of the entry.
+        """
+
+        self._entries[key] = value
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+        """
+
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        ### Returns
+        - The number of entries.
+        """
+
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache backend stored in a SQLite database.
+    Entries are written as soon as they are added, expire after the
+    time-to-live of their namespace, and the oldest entries are evicted
+    once the cache grows over `max_entries`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initializes the SQLite cache.
+
+        ### Arguments
+        - path: The path to the database file.
+        - ttls: Time-to-live in seconds for each namespace,
+            `None` means that entries never expire and `0` that they aren't stored.
+        - default_ttl: Time-to-live for namespaces missing from `ttls`.
+        - max_entries: The maximum number of entries to keep.
+        """
+
+        self.path = Path(path)
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        try:
+            self._connection = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, "
+                "namespace TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "expires_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_stored_at ON cache (stored_at)"
+            )
+        except sqlite3.DatabaseError as exception:
+            raise CacheError(
+                f"Couldn't open cache database: {self.path}"
+            ) from exception
+
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+
+        ### Returns
+        - The cached value or None if it's missing or expired.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            self.delete(key)
+            return None
+
+        return loads(value)
+
+    def set(self, key: str, value: Any, namespace: str = "") -> None:
+        """
+        Add an entry to the cache, it expires after the time-to-live
+        of its namespace.
+
+        ### Arguments
+        - key: The key of the entry.
+        - value: The JSON serializable value to cache.
+        - namespace: The namespace of the entry.
+        """
+
+        ttl = self.ttls.get(namespace, self.default_ttl)
+        if ttl == 0:
+            return None
+
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    namespace,
+                    dumps(value, compact=True),
+                    now,
+                    None if ttl is None else now + ttl,
+                ),
+            )
+
+            # Check the size of the cache from time to time,
+            # counting rows on every write would be too slow
+            self._writes += 1
+            if self.max_entries is not None and self._writes % 100 == 0:
+                self._evict()
+
+        return None
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        ### Arguments
+        - key: The key of the entry.
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge_expired(self) -> None:
+        """
+        Remove all expired entries from the cache.
+        """
+
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),),
+            )
+
+    def _evict(self) -> None:
+        """
+        Remove the oldest entries if the cache has more than `max_entries`.
+        Has to be called with the lock held.
+        """
+
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        overflow = count - (self.max_entries or count)
+        if overflow <= 0:
+            return None
+
+        logger.debug("Evicting %s entries from %s", overflow, self.path)
+        self._connection.execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache ORDER BY stored_at LIMIT ?)",
+            (overflow,),
+        )
+
+        return None
+
+    def flush(self) -> None:
+        """
+        Evict the entries over `max_entries` and write the pending
+        changes of the write-ahead log to the database.
+        """
+
+        with self._lock:
+            if self.max_entries is not None:
+                self._evict()
+
+            self._connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        """
+        Flush the cache and close the database connection.
+        """
+
+        self.flush()
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        ### Returns
+        - The number of entries, including the expired ones.
+        """
+
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+
+        return count
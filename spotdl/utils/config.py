@@ -26,6 +26,7 @@
     "get_spotdl_path",
     "get_config_file",
     "get_cache_path",
+    "get_match_store_path",
     "get_temp_path",
     "get_errors_path",
     "get_web_ui_path",
@@ -96,13 +97,24 @@ def get_cache_path() -> Path:
 
 def get_spotify_cache_path() -> Path:
     """
-    Get the path to the spotify cache folder.
+    Get the path to the spotify cache database.
 
     ### Returns
-    - The path to the spotipy cache file.
+    - The path to the spotify cache database.
+    """
+
+    return get_spotdl_path() / ".spotify_cache.db"
+
+
+def get_match_store_path() -> Path:
+    """
+    Get the path to the match store database.
+
+    ### Returns
+    - The path to the match store database.
     """
 
-    return get_spotdl_path() / ".spotify_cache"
+    return get_spotdl_path() / ".match_store.db"
 
 
 def get_temp_path() -> Path:
@@ -302,6 +314,7 @@ def get_parameter(cls, key):
     "no_cache": False,
     "max_retries": 3,
     "use_cache_file": False,
+    "requests_per_second": None,
 }
 
 DOWNLOADER_OPTIONS: DownloaderOptions = {
@@ -320,9 +333,12 @@ def get_parameter(cls, key):
     "ffmpeg_args": None,
     "format": "mp3",
     "save_file": None,
+    "compact_json": False,
     "filter_results": True,
     "album_type": None,
     "threads": 4,
+    "match_cache_size": 16384,
+    "match_store": False,
     "cookie_file": None,
     "restrict": None,
     "print_errors": False,
@@ -339,6 +355,8 @@ def get_parameter(cls, key):
     "generate_lrc": False,
     "force_update_metadata": False,
     "only_verified_results": False,
+    "parallel_search": False,
+    "speculative_search": False,
     "sync_without_deleting": False,
     "max_filename_length": None,
     "yt_dlp_args": None,
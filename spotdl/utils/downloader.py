@@ -2,7 +2,7 @@
 Module for functions related to downloading songs.
 """
 
-from spotdl.providers.audio import YouTubeMusic
+from spotdl.utils.ytmusic import ytm_client
 
 __all__ = ["check_ytmusic_connection"]
 
@@ -16,10 +16,14 @@ def check_ytmusic_connection() -> bool:
     - `False` if we can't connect to YouTube Music API
     """
 
-    # Check if we are getting results from YouTube Music
-    ytm = YouTubeMusic()
-    test_results = ytm.get_results("a")
-    if len(test_results) == 0:
-        return False
+    # Check if we are getting results from YouTube Music,
+    # with the client the YouTube Music provider uses for searching
+    with ytm_client("de") as client:
+        test_results = client.search("a")
 
-    return True
+    return any(
+        result is not None
+        and result.get("videoId") is not None
+        and result.get("artists") not in [[], None]
+        for result in test_results
+    )
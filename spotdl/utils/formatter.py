@@ -7,7 +7,7 @@
 import copy
 import logging
 import re
-from functools import lru_cache
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unicodedata import normalize
@@ -19,6 +19,7 @@
 from yt_dlp.utils import sanitize_filename
 
 from spotdl.types.song import Song
+from spotdl.utils.memo import memoize
 
 __all__ = [
     "VARS",
@@ -27,6 +28,8 @@
     "create_song_title",
     "sanitize_string",
     "slugify",
+    "get_kakasi",
+    "transliterate",
     "format_query",
     "create_search_query",
     "create_file_name",
@@ -62,7 +65,9 @@
     "{output-ext}",
 ]
 
-KKS = pykakasi.kakasi()
+# Created on first use, loading its dictionaries takes almost half a second
+_KKS: Optional[Any] = None
+_KKS_LOCK = threading.Lock()
 
 JAP_REGEX = re.compile(
     "[\u3000-\u303f\u3040-\u309f\u30a0-\u30ff\uff00-\uff9f\u4e00-\u9faf\u3400-\u4dbf]"
@@ -119,7 +124,7 @@ def sanitize_string(string: str) -> str:
     return output
 
 
-@lru_cache()
+@memoize()
 def slugify(string: str) -> str:
     """
     Slugify the string.
@@ -145,7 +150,45 @@ def slugify(string: str) -> str:
         regex_pattern=JAP_REGEX.pattern,
     )
 
-    results = KKS.convert(normal_slug)
+    # Most japanese characters are already converted by py_slugify,
+    # don't fill the transliteration memo with strings that have none left
+    if JAP_REGEX.search(normal_slug):
+        normal_slug = transliterate(normal_slug)
+
+    return py_slugify(normal_slug, regex_pattern=DISALLOWED_REGEX.pattern)
+
+
+def get_kakasi() -> Any:
+    """
+    Get the japanese transliterator, it's created on first use.
+
+    ### Returns
+    - the `pykakasi.kakasi` instance
+    """
+
+    global _KKS  # pylint: disable=global-statement
+
+    if _KKS is None:
+        with _KKS_LOCK:
+            if _KKS is None:
+                _KKS = pykakasi.kakasi()
+
+    return _KKS
+
+
+@memoize()
+def transliterate(string: str) -> str:
+    """
+    Transliterate the japanese characters of a string to latin characters.
+
+    ### Arguments
+    - string: the string to transliterate
+
+    ### Returns
+    - the transliterated string, with words separated by dashes
+    """
+
+    results = get_kakasi().convert(string)
 
     result = ""
     for index, item in enumerate(results):
@@ -160,7 +203,7 @@ def slugify(string: str) -> str:
         ):
             result += "-"
 
-    return py_slugify(result, regex_pattern=DISALLOWED_REGEX.pattern)
+    return result
 
 
 def format_query(
@@ -527,11 +570,11 @@ def restrict_filename(pathobj: Path, strict: bool = True) -> Path:
     return pathobj.with_name(result)
 
 
-@lru_cache()
+@memoize()
 def ratio(string1: str, string2: str) -> float:
     """
     Wrapper for fuzz.ratio
-    with lru_cache
+    with memoization
 
     ### Arguments
     - string1: the first string
@@ -0,0 +1,241 @@
+"""
+Module for reading and writing JSON data (save files, sync files, caches).
+Uses orjson when it's installed, which is a lot faster than the standard library
+for big files, and falls back to the standard `json` module otherwise.
+
+```python
+from spotdl.utils.jsonio import load_json, save_json
+
+save_json("songs.spotdl", [song.json for song in songs], compact=True)
+songs = load_json("songs.spotdl")
+
+with JsonLinesWriter("songs.spotdl.jsonl") as writer:
+    for song in songs:
+        writer.write(song)
+
+songs = list(iter_json_lines("songs.spotdl.jsonl"))
+```
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore # pylint: disable=invalid-name
+
+__all__ = [
+    "JSON_BACKEND",
+    "SAVE_FILE_EXTENSIONS",
+    "dumps",
+    "loads",
+    "load_json",
+    "save_json",
+    "is_json_lines",
+    "iter_json_lines",
+    "save_json_lines",
+    "JsonLinesWriter",
+]
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+# Save files are either a single JSON document or JSON Lines, one song per line
+SAVE_FILE_EXTENSIONS = (".spotdl", ".spotdl.jsonl")
+
+
+def dumps(data: Any, compact: bool = False) -> str:
+    """
+    Serialize data to a JSON string.
+
+    ### Arguments
+    - data: The data to serialize.
+    - compact: Whether to skip indentation and extra whitespace.
+
+    ### Returns
+    - The JSON string, non-ASCII characters are not escaped.
+
+    ### Notes
+    - orjson only supports an indentation of 2 spaces,
+    the standard library uses 4 spaces like before.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode(
+            "utf-8"
+        )
+
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    return json.dumps(data, indent=4, ensure_ascii=False)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON string.
+
+    ### Arguments
+    - data: The JSON string or bytes.
+
+    ### Returns
+    - The deserialized data.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Load a JSON file.
+
+    ### Arguments
+    - path: The path to the file.
+
+    ### Returns
+    - The deserialized data.
+    """
+
+    with open(path, "rb") as json_file:
+        return loads(json_file.read())
+
+
+def save_json(path: Union[str, Path], data: Any, compact: bool = False) -> None:
+    """
+    Save data to a JSON file.
+
+    ### Arguments
+    - path: The path to the file.
+    - data: The data to save.
+    - compact: Whether to skip indentation and extra whitespace.
+    """
+
+    if orjson is not None:
+        with open(path, "wb") as json_file:
+            json_file.write(
+                orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+            )
+
+        return None
+
+    with open(path, "w", encoding="utf-8") as json_file:
+        json_file.write(dumps(data, compact))
+
+    return None
+
+
+def is_json_lines(path: Union[str, Path]) -> bool:
+    """
+    Check if a file uses the JSON Lines format, based on its extension.
+
+    ### Arguments
+    - path: The path to the file.
+
+    ### Returns
+    - True if the file ends with `.jsonl`.
+    """
+
+    return str(path).endswith(".jsonl")
+
+
+def iter_json_lines(path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Read a JSON Lines file one line at a time.
+    Invalid lines, like the last line of an interrupted write, are skipped.
+
+    ### Arguments
+    - path: The path to the file.
+
+    ### Returns
+    - Iterator of the deserialized lines.
+    """
+
+    with open(path, "rb") as json_file:
+        for line_number, line in enumerate(json_file, 1):
+            if not line.strip():
+                continue
+
+            try:
+                yield loads(line)
+            except ValueError:
+                logger.warning("Skipping invalid line %s in %s", line_number, path)
+
+
+def save_json_lines(path: Union[str, Path], items: Iterable[Any]) -> None:
+    """
+    Save items to a JSON Lines file, one item per line.
+
+    ### Arguments
+    - path: The path to the file.
+    - items: The items to save.
+    """
+
+    with JsonLinesWriter(path) as writer:
+        for item in items:
+            writer.write(item)
+
+
+class JsonLinesWriter:
+    """
+    Thread-safe JSON Lines writer. Every item is flushed as soon as it's
+    written, so the file holds all finished items if the process is interrupted.
+    """
+
+    def __init__(self, path: Union[str, Path], append: bool = False):
+        """
+        Open the file for writing.
+
+        ### Arguments
+        - path: The path to the file.
+        - append: Whether to keep the lines already in the file.
+        """
+
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file: Optional[Any] = open(  # pylint: disable=consider-using-with
+            self.path, "ab" if append else "wb"
+        )
+
+    def write(self, item: Any) -> None:
+        """
+        Write an item as a single line.
+
+        ### Arguments
+        - item: The item to write.
+        """
+
+        if orjson is not None:
+            line = orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (dumps(item, compact=True) + "\n").encode("utf-8")
+
+        with self._lock:
+            if self._file is None:
+                raise ValueError(f"{self.path} is already closed")
+
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Close the file.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "JsonLinesWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -0,0 +1,235 @@
+"""
+Module with a persistent store of the download urls chosen for songs,
+so that songs matched in a previous run don't have to be searched again.
+Matches are stored under the Spotify track id and the ISRC of the song.
+
+```python
+from spotdl.utils.match_store import MatchStore
+
+store = MatchStore("match_store.db")
+store.set(song, "https://music.youtube.com/watch?v=...", "YouTubeMusic", 95.0)
+store.get(song)
+
+# Always use this url for the song
+store.pin(song, "https://music.youtube.com/watch?v=...")
+
+# Never use this url for the song
+store.blacklist(song, "https://music.youtube.com/watch?v=...")
+```
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from spotdl.types.song import Song
+from spotdl.utils.cache import SQLiteCache
+
+__all__ = ["MATCH_TTL", "MatchStore"]
+
+logger = logging.getLogger(__name__)
+
+# Search results change over time, so matches are searched again after a while
+MATCH_TTL = 30 * 24 * 60 * 60
+
+
+class MatchStore:
+    """
+    Persistent store of the matches between songs and download urls.
+    Matches expire after `ttl` seconds, pinned matches and blacklisted urls never do.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[float] = MATCH_TTL,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initializes the match store.
+
+        ### Arguments
+        - path: The path to the database file.
+        - ttl: Time-to-live of the matches in seconds, `None` means they never expire.
+        - max_entries: The maximum number of entries to keep.
+        """
+
+        self.cache = SQLiteCache(
+            path,
+            ttls={"match": ttl, "pinned": None, "blacklist": None},
+            max_entries=max_entries,
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_keys(song: Song) -> List[str]:
+        """
+        Get the keys a song is stored under.
+
+        ### Arguments
+        - song: The song.
+
+        ### Returns
+        - The track id key and the ISRC key, for the ones the song has.
+        Songs without either aren't stored.
+        """
+
+        keys = []
+        if song.song_id:
+            keys.append(f"track:{song.song_id}")
+        if song.isrc:
+            keys.append(f"isrc:{song.isrc}")
+
+        return keys
+
+    def get(self, song: Song) -> Optional[Dict[str, Any]]:
+        """
+        Get the match of a song.
+
+        ### Arguments
+        - song: The song.
+
+        ### Returns
+        - The match with the url, provider, score and time it was matched at,
+        or None if the song wasn't matched, the match expired or its url is blacklisted.
+        """
+
+        keys = self.get_keys(song)
+        if not keys:
+            return None
+
+        blacklist = self.get_blacklist(song)
+        for key in keys:
+            match = self.cache.get(key)
+            if match is not None and match["url"] not in blacklist:
+                with self._lock:
+                    self.hits += 1
+
+                return match
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def set(
+        self,
+        song: Song,
+        url: str,
+        provider: str,
+        score: Optional[float] = None,
+        pinned: bool = False,
+    ) -> None:
+        """
+        Store the match of a song, pinned matches are only replaced by other pinned ones.
+
+        ### Arguments
+        - song: The song.
+        - url: The download url chosen for the song.
+        - provider: The name of the audio provider that found the url.
+        - score: The match score of the url.
+        - pinned: Whether the match never expires.
+        """
+
+        match = {
+            "url": url,
+            "provider": provider,
+            "score": score,
+            "matched_at": time.time(),
+            "pinned": pinned,
+        }
+
+        for key in self.get_keys(song):
+            if not pinned:
+                stored_match = self.cache.get(key)
+                if stored_match is not None and stored_match["pinned"]:
+                    continue
+
+            self.cache.set(key, match, "pinned" if pinned else "match")
+
+    def pin(self, song: Song, url: str, provider: str = "manual") -> None:
+        """
+        Always use the url for the song.
+
+        ### Arguments
+        - song: The song.
+        - url: The download url to use.
+        - provider: The name of the audio provider of the url.
+        """
+
+        self.set(song, url, provider, pinned=True)
+
+    def blacklist(self, song: Song, url: str) -> None:
+        """
+        Never use the url for the song, removes the match if it uses the url.
+
+        ### Arguments
+        - song: The song.
+        - url: The download url to avoid.
+        """
+
+        for key in self.get_keys(song):
+            match = self.cache.get(key)
+            if match is not None and match["url"] == url:
+                self.cache.delete(key)
+
+            blacklist = self.cache.get(f"blacklist:{key}") or []
+            if url not in blacklist:
+                self.cache.set(f"blacklist:{key}", blacklist + [url], "blacklist")
+
+    def get_blacklist(self, song: Song) -> List[str]:
+        """
+        Get the blacklisted urls of a song.
+
+        ### Arguments
+        - song: The song.
+
+        ### Returns
+        - The urls that shouldn't be used for the song.
+        """
+
+        blacklist: List[str] = []
+        for key in self.get_keys(song):
+            blacklist.extend(self.cache.get(f"blacklist:{key}") or [])
+
+        return blacklist
+
+    def invalidate(self, song: Song, pinned: bool = True) -> None:
+        """
+        Remove the match of a song, blacklisted urls are kept.
+
+        ### Arguments
+        - song: The song.
+        - pinned: Whether to remove pinned matches too.
+        """
+
+        for key in self.get_keys(song):
+            if not pinned:
+                match = self.cache.get(key)
+                if match is not None and match["pinned"]:
+                    continue
+
+            self.cache.delete(key)
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+
+        self.cache.close()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the store statistics.
+
+        ### Returns
+        - Dictionary with the hits and misses of this run and the size of the store.
+        """
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.cache)}
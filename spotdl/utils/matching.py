@@ -2,7 +2,10 @@
 Module for all things matching related
 """
 
+# pylint: disable=too-many-lines
+
 import logging
+from dataclasses import dataclass, field
 from itertools import product, zip_longest
 from math import exp
 from typing import Dict, List, Optional, Tuple
@@ -19,10 +22,13 @@
 
 __all__ = [
     "FORBIDDEN_WORDS",
+    "SongMatchContext",
     "fill_string",
+    "fill_slug_string",
     "create_clean_string",
     "sort_string",
     "based_sort",
+    "get_match_context",
     "check_common_word",
     "check_forbidden_words",
     "create_match_strings",
@@ -35,6 +41,8 @@
     "calc_name_match",
     "calc_time_match",
     "calc_album_match",
+    "calc_max_score",
+    "order_results",
 ]
 
 logger = logging.getLogger(__name__)
@@ -86,12 +94,33 @@ def fill_string(strings: List[str], main_string: str, string_to_check: str) -> s
     - string with strings from `strings` list
     """
 
+    return fill_slug_string(
+        [slugify(string).replace("-", "") for string in strings],
+        main_string,
+        string_to_check,
+    )
+
+
+def fill_slug_string(
+    slug_strings: List[str], main_string: str, string_to_check: str
+) -> str:
+    """
+    Same as `fill_string`, but with strings that are already slugified
+    and without dashes
+
+    ### Arguments
+    - slug_strings: slugified strings to check
+    - main_string: string to add strings to
+    - string_to_check: string to check if strings are present in
+
+    ### Returns
+    - string with strings from `slug_strings` list
+    """
+
     final_str = main_string
     test_str = final_str.replace("-", "")
     simple_test_str = string_to_check.replace("-", "")
-    for string in strings:
-        slug_str = slugify(string).replace("-", "")
-
+    for slug_str in slug_strings:
         if slug_str in simple_test_str and slug_str not in test_str:
             final_str += f"-{slug_str}"
             test_str += slug_str
@@ -179,41 +208,160 @@ def based_sort(strings: List[str], based_on: List[str]) -> Tuple[List[str], List
     return strings, based_on
 
 
-def check_common_word(song: Song, result: Result) -> bool:
+@dataclass
+class SongMatchContext:
+    """
+    Song data used to match every result, slugified once per song
+    instead of once per result.
+    """
+
+    song: Song
+    search_query: Optional[str]
+    slug_name: str
+    name_words: List[str]
+    flat_name: str
+    slug_title: str
+    slug_query_title: str
+    slug_main_title: str
+    slug_artist: str
+    slug_artists: List[str]
+    sorted_slug_artists: List[str]
+    flat_artists: List[str]
+    sorted_artist_words: List[str]
+    artist_words: Tuple[str, ...]
+    clean_artists: str
+    slug_album: str
+    match_strings: Dict[Tuple[Result, Optional[str]], Tuple[str, str]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def from_song(
+        cls, song: Song, search_query: Optional[str] = None
+    ) -> "SongMatchContext":
+        """
+        Create the match context of a song.
+
+        ### Arguments
+        - song: song to match
+        - search_query: search query used to create the match strings
+
+        ### Returns
+        - The match context.
+        """
+
+        slug_name = slugify(song.name)
+        slug_title = slugify(create_song_title(song.name, song.artists))
+        slug_artists = list(map(slugify, song.artists))
+
+        return cls(
+            song=song,
+            search_query=search_query,
+            slug_name=slug_name,
+            name_words=slug_name.split("-"),
+            flat_name=slug_name.replace("-", ""),
+            slug_title=slug_title,
+            slug_query_title=(
+                slugify(create_search_query(song, search_query, False, None, True))
+                if search_query
+                else slug_title
+            ),
+            slug_main_title=slugify(create_song_title(song.name, [song.artist])),
+            slug_artist=slugify(song.artist),
+            slug_artists=slug_artists,
+            sorted_slug_artists=sorted(slug_artists),
+            flat_artists=[artist.replace("-", "") for artist in slug_artists],
+            sorted_artist_words=[
+                sort_string(slugify(artist).split("-"), "-") for artist in slug_artists
+            ],
+            artist_words=tuple(
+                word for artist in slug_artists for word in artist.split("-")
+            ),
+            clean_artists=create_clean_string(song.artists, slug_name, True),
+            slug_album=slugify(song.album_name) if song.album_name else "",
+        )
+
+    def get_slug_title(self, search_query: Optional[str] = None) -> str:
+        """
+        Get the slugified song title, or search query if one is used.
+
+        ### Arguments
+        - search_query: search query used to create the title
+
+        ### Returns
+        - The slugified title.
+        """
+
+        if not search_query:
+            return self.slug_title
+
+        if search_query == self.search_query:
+            return self.slug_query_title
+
+        return slugify(create_search_query(self.song, search_query, False, None, True))
+
+
+def get_match_context(
+    song: Song, context: Optional[SongMatchContext] = None
+) -> SongMatchContext:
+    """
+    Get the match context of a song, creating it if it wasn't passed in.
+
+    ### Arguments
+    - song: song to match
+    - context: match context created by the caller
+
+    ### Returns
+    - The match context.
+    """
+
+    if context is not None:
+        return context
+
+    return SongMatchContext.from_song(song)
+
+
+def check_common_word(
+    song: Song, result: Result, context: Optional[SongMatchContext] = None
+) -> bool:
     """
     Check if a word is present in a sentence
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - True if word is present in sentence, False otherwise
     """
 
-    sentence_words = slugify(song.name).split("-")
+    context = get_match_context(song, context)
     to_check = slugify(result.name).replace("-", "")
 
-    for word in sentence_words:
+    for word in context.name_words:
         if word != "" and word in to_check:
             return True
 
     return False
 
 
-def check_forbidden_words(song: Song, result: Result) -> Tuple[bool, List[str]]:
+def check_forbidden_words(
+    song: Song, result: Result, context: Optional[SongMatchContext] = None
+) -> Tuple[bool, List[str]]:
     """
     Check if a forbidden word is present in the result name
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - True if forbidden word is present in result name, False otherwise
     """
 
-    song_name = slugify(song.name).replace("-", "")
+    song_name = get_match_context(song, context).flat_name
     to_check = slugify(result.name).replace("-", "")
 
     words = []
@@ -225,7 +373,10 @@ def check_forbidden_words(song: Song, result: Result) -> Tuple[bool, List[str]]:
 
 
 def create_match_strings(
-    song: Song, result: Result, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    search_query: Optional[str] = None,
+    context: Optional[SongMatchContext] = None,
 ) -> Tuple[str, str]:
     """
     Create strings based on song and result to match
@@ -234,30 +385,33 @@ def create_match_strings(
     ### Arguments
     - song: song to match
     - result: result to match
+    - search_query: search query used instead of the song title
+    - context: match context of the song, the strings are cached in it
 
     ### Returns
     - tuple of strings to match
     """
 
-    slug_song_name = slugify(song.name)
-    slug_song_title = slugify(
-        create_song_title(song.name, song.artists)
-        if not search_query
-        else create_search_query(song, search_query, False, None, True)
-    )
+    context = get_match_context(song, context)
+    match_strings = context.match_strings.get((result, search_query))
+    if match_strings is not None:
+        return match_strings
 
     test_str1 = slugify(result.name)
-    test_str2 = slug_song_name if result.verified else slug_song_title
+    test_str2 = (
+        context.slug_name if result.verified else context.get_slug_title(search_query)
+    )
 
     # Fill strings with missing artists
-    test_str1 = fill_string(song.artists, test_str1, test_str2)
-    test_str2 = fill_string(song.artists, test_str2, test_str1)
+    test_str1 = fill_slug_string(context.flat_artists, test_str1, test_str2)
+    test_str2 = fill_slug_string(context.flat_artists, test_str2, test_str1)
 
     # Sort both strings and then join them
     test_list1, test_list2 = based_sort(test_str1.split("-"), test_str2.split("-"))
-    test_str1, test_str2 = "-".join(test_list1), "-".join(test_list2)
+    match_strings = "-".join(test_list1), "-".join(test_list2)
+    context.match_strings[(result, search_query)] = match_strings
 
-    return test_str1, test_str2
+    return match_strings
 
 
 def get_best_matches(
@@ -288,13 +442,18 @@ def get_best_matches(
     ]
 
 
-def calc_main_artist_match(song: Song, result: Result) -> float:
+def calc_main_artist_match(
+    song: Song,
+    result: Result,
+    context: Optional[SongMatchContext] = None,
+) -> float:
     """
     Check if main artist is present in list of artists
 
     ### Arguments
     - main_artist: main artist to check
     - artists: list of artists to check
+    - context: match context of the song
 
     ### Returns
     - True if main artist is present in list of artists, False otherwise
@@ -306,25 +465,22 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
     if not result.artists:
         return main_artist_match
 
-    song_artists, result_artists = list(map(slugify, song.artists)), list(
-        map(slugify, result.artists)
-    )
+    context = get_match_context(song, context)
+    song_artists = context.sorted_slug_artists
     sorted_song_artists, sorted_result_artists = based_sort(
-        song_artists, result_artists
+        list(context.slug_artists), list(map(slugify, result.artists))
     )
 
     debug(song.song_id, result.result_id, f"Song artists: {sorted_song_artists}")
     debug(song.song_id, result.result_id, f"Result artists: {sorted_result_artists}")
 
-    slug_song_main_artist = slugify(song.artists[0])
+    slug_song_main_artist = context.slug_artists[0]
     slug_result_main_artist = sorted_result_artists[0]
 
     # Result has only one artist, but song has multiple artists
     # we can assume that other artists are in the main artist name
     if len(song.artists) > 1 and len(result.artists) == 1:
-        for artist in map(slugify, song.artists[1:]):
-            artist = sort_string(slugify(artist).split("-"), "-")
-
+        for artist in context.sorted_artist_words[1:]:
             res_main_artist = sort_string(slug_result_main_artist.split("-"), "-")
 
             if artist in res_main_artist:
@@ -357,7 +513,9 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
     return main_artist_match
 
 
-def calc_artists_match(song: Song, result: Result) -> float:
+def calc_artists_match(
+    song: Song, result: Result, context: Optional[SongMatchContext] = None
+) -> float:
     """
     Check if all artists are present in list of artists
 
@@ -376,7 +534,8 @@ def calc_artists_match(song: Song, result: Result) -> float:
         return artist_match_number
 
     artist1_list, artist2_list = based_sort(
-        list(map(slugify, song.artists)), list(map(slugify, result.artists))
+        list(get_match_context(song, context).slug_artists),
+        list(map(slugify, result.artists)),
     )
 
     # Remove main artist from the lists
@@ -392,7 +551,12 @@ def calc_artists_match(song: Song, result: Result) -> float:
     return artist_match_number
 
 
-def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
+def artists_match_fixup1(
+    song: Song,
+    result: Result,
+    score: float,
+    context: Optional[SongMatchContext] = None,
+) -> float:
     """
     Multiple fixes to the artists score for
     not verified results to improve the accuracy
@@ -410,10 +574,12 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     if result.verified or score > 50:
         return score
 
+    context = get_match_context(song, context)
+
     # If we didn't find any artist match,
     # we fallback to channel name match
     channel_name_match = ratio(
-        slugify(song.artist),
+        context.slug_artist,
         slugify(", ".join(result.artists)) if result.artists else "",
     )
 
@@ -425,9 +591,7 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     if score <= 70:
         artist_title_match = 0.0
         result_name = slugify(result.name).replace("-", "")
-        for artist in song.artists:
-            slug_artist = slugify(artist).replace("-", "")
-
+        for slug_artist in context.flat_artists:
             if slug_artist in result_name:
                 artist_title_match += 1.0
 
@@ -442,18 +606,13 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
         # Song artists: ['charlie-moncler', 'fukaj', 'mata', 'pedro']
         # Result artists: ['fukaj-mata-charlie-moncler-und-pedro']
 
-        # For artist_list1
-        artist_list1 = []
-        for artist in song.artists:
-            artist_list1.extend(slugify(artist).split("-"))
-
         # For artist_list2
         artist_list2 = []
         if result.artists:
             for artist in result.artists:
                 artist_list2.extend(slugify(artist).split("-"))
 
-        artist_tuple1 = tuple(artist_list1)
+        artist_tuple1 = context.artist_words
         artist_tuple2 = tuple(artist_list2)
 
         artist_title_match = ratio(artist_tuple1, artist_tuple2)
@@ -464,7 +623,11 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
 
 
 def artists_match_fixup2(
-    song: Song, result: Result, score: float, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    score: float,
+    search_query: Optional[str] = None,
+    context: Optional[SongMatchContext] = None,
 ) -> float:
     """
     Multiple fixes to the artists score for
@@ -485,21 +648,19 @@ def artists_match_fixup2(
         # or if the result is not verified
         return score
 
-    # Slugify some variables
-    slug_song_name = slugify(song.name)
+    context = get_match_context(song, context)
     slug_result_name = slugify(result.name)
 
     # # Check if the main artist is simlar
     has_main_artist = (score / (2 if len(song.artists) > 1 else 1)) > 50
 
-    _, match_str2 = create_match_strings(song, result, search_query)
+    _, match_str2 = create_match_strings(song, result, search_query, context)
 
     # Check if other song artists are in the result name
     # if they are, we increase the artist match
     # (main artist is already checked, so we skip it)
-    artists_to_check = song.artists[int(has_main_artist) :]
+    artists_to_check = context.flat_artists[int(has_main_artist) :]
     for artist in artists_to_check:
-        artist = slugify(artist).replace("-", "")
         if artist in match_str2.replace("-", ""):
             score += 5
 
@@ -508,7 +669,7 @@ def artists_match_fixup2(
     # with the result's artists
     if score <= 70:
         # Artists from song/result name without the song/result name words
-        artist_list1 = create_clean_string(song.artists, slug_song_name, True)
+        artist_list1 = context.clean_artists
         artist_list2 = create_clean_string(
             list(result.artists) if result.artists else [result.author],
             slug_result_name,
@@ -522,7 +683,12 @@ def artists_match_fixup2(
     return score
 
 
-def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
+def artists_match_fixup3(
+    song: Song,
+    result: Result,
+    score: float,
+    context: Optional[SongMatchContext] = None,
+) -> float:
     """
     Calculate match percentage based result's name
     and song's title if the result has exactly one artist
@@ -551,7 +717,7 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
 
     artists_score_fixup = ratio(
         slugify(result.name),
-        slugify(create_song_title(song.name, [song.artist])),
+        get_match_context(song, context).slug_main_title,
     )
 
     if artists_score_fixup >= 80:
@@ -564,7 +730,10 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
 
 
 def calc_name_match(
-    song: Song, result: Result, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    search_query: Optional[str] = None,
+    context: Optional[SongMatchContext] = None,
 ) -> float:
     """
     Calculate name match percentage
@@ -572,17 +741,21 @@ def calc_name_match(
     ### Arguments
     - song: song to match
     - result: result to match
+    - search_query: search query used to create the match strings
+    - context: match context of the song
 
     ### Returns
     - name match percentage
     """
 
+    context = get_match_context(song, context)
+
     # Create match strings that will be used
     # to calculate name match value
-    match_str1, match_str2 = create_match_strings(song, result, search_query)
-    result_name, song_name = slugify(result.name), slugify(song.name)
+    match_str1, match_str2 = create_match_strings(song, result, search_query, context)
+    result_name = slugify(result.name)
 
-    res_list, song_list = based_sort(result_name.split("-"), song_name.split("-"))
+    res_list, song_list = based_sort(result_name.split("-"), list(context.name_words))
     result_name, song_name = "-".join(res_list), "-".join(song_list)
 
     # Calculate initial name match
@@ -632,13 +805,18 @@ def calc_time_match(song: Song, result: Result) -> float:
     return score * 100
 
 
-def calc_album_match(song: Song, result: Result) -> float:
+def calc_album_match(
+    song: Song,
+    result: Result,
+    context: Optional[SongMatchContext] = None,
+) -> float:
     """
     Calculate album match percentage
 
     ### Arguments
     - song: song to match
     - result: result to match
+    - context: match context of the song
 
     ### Returns
     - album match percentage
@@ -647,13 +825,50 @@ def calc_album_match(song: Song, result: Result) -> float:
     if not result.album:
         return 0.0
 
-    return ratio(slugify(song.album_name), slugify(result.album))
+    return ratio(get_match_context(song, context).slug_album, slugify(result.album))
+
+
+def calc_max_score(
+    song: Song, result: Result, name_match: float, time_match: float
+) -> float:
+    """
+    Calculate the highest score that `order_results` can give to a result,
+    knowing only its name and time match.
+
+    ### Arguments
+    - song: song to match
+    - result: result to match
+    - name_match: final name match of the result
+    - time_match: time match of the result
+
+    ### Returns
+    - the highest possible score
+    """
+
+    # artists_match_fixup2 adds 5 for each song artist found in the result name
+    max_artists_match = max(100, 70 + 5 * len(song.artists))
+    max_average = (max_artists_match + name_match) / 2
+
+    # Averaging with an album match of up to 80 can raise low scores
+    max_average = max(max_average, (max_average + 80) / 2)
+
+    if result.source == "slider.kz" or time_match < 0:
+        max_score = (max_average + time_match) / 2
+    elif result.isrc_search:
+        max_score = max_average
+    elif max_average > 85:
+        max_score = max(max_average, (85 + time_match) / 2)
+    else:
+        max_score = (max_average + time_match) / 2
+
+    return min(max_score, 100)
 
 
 def order_results(
     results: List[Result],
     song: Song,
     search_query: Optional[str] = None,
+    score_threshold: Optional[float] = None,
 ) -> Dict[Result, float]:
     """
     Order results.
@@ -662,36 +877,128 @@ def order_results(
     - results: The results to order.
     - song: The song to order for.
     - search_query: The search query.
+    - score_threshold: Skip the artist matching of results that can't score
+        within `score_threshold` of the best result, they are left out.
+        If None, all results are scored.
 
     ### Returns
     - The ordered results.
+
+    ### Notes
+    - Results are scored in stages, the cheap checks that always reject
+        a result (time match, forbidden words, name match) run first.
     """
 
     # Assign an overall avg match value to each result
     links_with_match_value = {}
 
-    # Iterate over all results
+    # Slugify the song data once for all results
+    context = SongMatchContext.from_song(song, search_query)
+
+    candidates = []
+    time_matches = {}
+    found_forbidden_words = {}
     for result in results:
+        # Result.json copies the whole result, skip it when it won't be logged
+        if logger.isEnabledFor(MATCH):
+            debug(
+                song.song_id,
+                result.result_id,
+                f"Calculating match value for {result.url} - {result.json}",
+            )
+
+        # skip results that have no common words in their name
+        if not check_common_word(song, result, context):
+            debug(
+                song.song_id, result.result_id, "Skipping result due to no common words"
+            )
+
+            continue
+
+        # Calculate time match
+        time_match = calc_time_match(song, result)
+        debug(song.song_id, result.result_id, f"Final time match: {time_match}")
+
+        # Skip results with time match lower than 25%
+        if time_match < 25:
+            debug(
+                song.song_id,
+                result.result_id,
+                "Skipping result due to time match lower than 25%",
+            )
+            continue
+
+        # Check if result contains forbidden words
+        contains_fwords, found_fwords = check_forbidden_words(song, result, context)
         debug(
             song.song_id,
             result.result_id,
-            f"Calculating match value for {result.url} - {result.json}",
+            f"Contains forbidden words: {contains_fwords}, {found_fwords}",
         )
 
-        # skip results that have no common words in their name
-        if not check_common_word(song, result):
+        # Each forbidden word lowers the name match by 15,
+        # with 3 of them the name match can't be higher than 60%
+        if 100 - 15 * len(found_fwords) <= 60:
             debug(
-                song.song_id, result.result_id, "Skipping result due to no common words"
+                song.song_id,
+                result.result_id,
+                "Skipping result due to name match lower than 60%",
             )
+            continue
+
+        time_matches[result] = time_match
+        found_forbidden_words[result] = found_fwords
+        candidates.append(result)
+
+    name_matches = {}
+    max_scores = {}
+    for result in candidates:
+        # Calculate name match
+        name_match = calc_name_match(song, result, search_query, context)
+        debug(song.song_id, result.result_id, f"Initial name match: {name_match}")
+
+        name_match -= 15 * len(found_forbidden_words[result])
+        debug(song.song_id, result.result_id, f"Final name match: {name_match}")
 
+        # Ignore results with name match lower than 60%
+        if name_match <= 60:
+            debug(
+                song.song_id,
+                result.result_id,
+                "Skipping result due to name match lower than 60%",
+            )
             continue
 
+        max_score = calc_max_score(song, result, name_match, time_matches[result])
+        debug(song.song_id, result.result_id, f"Max average match: {max_score}")
+
+        name_matches[result] = name_match
+        max_scores[result] = max_score
+
+    # Score the most promising results first,
+    # so that the others can be skipped as soon as possible
+    best_score = 0.0
+    for result in sorted(max_scores, key=max_scores.__getitem__, reverse=True):
+        if score_threshold is not None and max_scores[result] < (
+            best_score - score_threshold
+        ):
+            debug(
+                song.song_id,
+                result.result_id,
+                "Skipping result and the next ones, "
+                f"they can't score within {score_threshold} of {best_score}",
+            )
+            break
+
+        name_match = name_matches[result]
+        time_match = time_matches[result]
+
         # Calculate match value for main artist
-        artists_match = calc_main_artist_match(song, result)
+        artists_match = calc_main_artist_match(song, result, context)
         debug(song.song_id, result.result_id, f"Main artist match: {artists_match}")
 
         # Calculate match value for all artists
-        other_artists_match = calc_artists_match(song, result)
+        other_artists_match = calc_artists_match(song, result, context)
         debug(
             song.song_id,
             result.result_id,
@@ -706,7 +1013,7 @@ def order_results(
         debug(song.song_id, result.result_id, f"First artists match: {artists_match}")
 
         # First attempt to fix artist match
-        artists_match = artists_match_fixup1(song, result, artists_match)
+        artists_match = artists_match_fixup1(song, result, artists_match, context)
         debug(
             song.song_id,
             result.result_id,
@@ -714,7 +1021,9 @@ def order_results(
         )
 
         # Second attempt to fix artist match
-        artists_match = artists_match_fixup2(song, result, artists_match)
+        artists_match = artists_match_fixup2(
+            song, result, artists_match, context=context
+        )
         debug(
             song.song_id,
             result.result_id,
@@ -722,7 +1031,7 @@ def order_results(
         )
 
         # Third attempt to fix artist match
-        artists_match = artists_match_fixup3(song, result, artists_match)
+        artists_match = artists_match_fixup3(song, result, artists_match, context)
         debug(
             song.song_id,
             result.result_id,
@@ -731,40 +1040,10 @@ def order_results(
 
         debug(song.song_id, result.result_id, f"Final artists match: {artists_match}")
 
-        # Calculate name match
-        name_match = calc_name_match(song, result, search_query)
-        debug(song.song_id, result.result_id, f"Initial name match: {name_match}")
-
-        # Check if result contains forbidden words
-        contains_fwords, found_fwords = check_forbidden_words(song, result)
-        if contains_fwords:
-            for _ in found_fwords:
-                name_match -= 15
-
-        debug(
-            song.song_id,
-            result.result_id,
-            f"Contains forbidden words: {contains_fwords}, {found_fwords}",
-        )
-        debug(song.song_id, result.result_id, f"Final name match: {name_match}")
-
         # Calculate album match
-        album_match = calc_album_match(song, result)
+        album_match = calc_album_match(song, result, context)
         debug(song.song_id, result.result_id, f"Final album match: {album_match}")
 
-        # Calculate time match
-        time_match = calc_time_match(song, result)
-        debug(song.song_id, result.result_id, f"Final time match: {time_match}")
-
-        # Ignore results with name match lower than 60%
-        if name_match <= 60:
-            debug(
-                song.song_id,
-                result.result_id,
-                "Skipping result due to name match lower than 60%",
-            )
-            continue
-
         # Ignore results with artists match lower than 70%
         if artists_match < 70 and result.source != "slider.kz":
             debug(
@@ -793,15 +1072,6 @@ def order_results(
                 f"Average match /w album match: {average_match}",
             )
 
-        # Skip results with time match lower than 25%
-        if time_match < 25:
-            debug(
-                song.song_id,
-                result.result_id,
-                "Skipping result due to time match lower than 25%",
-            )
-            continue
-
         # If the time match is lower than 50%
         # and the average match is lower than 75%
         # we skip the result
@@ -845,5 +1115,11 @@ def order_results(
 
         # the results along with the avg Match
         links_with_match_value[result] = average_match
-
-    return links_with_match_value
+        best_score = max(best_score, average_match)
+
+    # Keep the order of the results
+    return {
+        result: links_with_match_value[result]
+        for result in results
+        if result in links_with_match_value
+    }
@@ -0,0 +1,174 @@
+"""
+Module with bounded memoization for the small, hot functions
+used when matching results (`slugify`, `ratio`, `transliterate`).
+The memoized functions are registered by name, so that their size can be
+configured and their statistics logged at the end of a run.
+
+```python
+from spotdl.utils.memo import get_memo_stats, memoize, set_memo_size
+
+@memoize()
+def slugify(string: str) -> str:
+    ...
+
+set_memo_size(32768)
+get_memo_stats()["slugify"]
+```
+"""
+
+import threading
+from functools import lru_cache, update_wrapper
+from typing import Any, Callable, Dict, Iterable, Optional
+
+__all__ = [
+    "DEFAULT_MEMO_SIZE",
+    "MEMOIZED_FUNCTIONS",
+    "MemoizedFunction",
+    "memoize",
+    "set_memo_size",
+    "get_memo_stats",
+]
+
+# Enough for 16 threads matching songs against 100 results each
+DEFAULT_MEMO_SIZE = 16384
+
+MEMOIZED_FUNCTIONS: Dict[str, "MemoizedFunction"] = {}
+
+
+class MemoizedFunction:
+    """
+    Thread-safe LRU memo of a function's results, that can be resized at runtime.
+    Backed by `functools.lru_cache`, with counters that survive resizing.
+    """
+
+    def __init__(self, function: Callable, maxsize: int = DEFAULT_MEMO_SIZE):
+        """
+        Initializes the memoized function.
+
+        ### Arguments
+        - function: The function to memoize, its arguments must be hashable.
+        - maxsize: The maximum number of results to keep.
+        """
+
+        update_wrapper(self, function)
+
+        self.function = function
+        self._cached = lru_cache(maxsize)(function)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, *args: Any) -> Any:
+        return self._cached(*args)
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Get the maximum number of results kept.
+        """
+
+        return self._cached.cache_info().maxsize or 0
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of results kept, this clears the memo.
+
+        ### Arguments
+        - maxsize: The maximum number of results to keep.
+        """
+
+        with self._lock:
+            if maxsize == self.maxsize:
+                return None
+
+            self._count()
+            self._cached = lru_cache(maxsize)(self.function)
+
+        return None
+
+    def clear(self) -> None:
+        """
+        Remove all results and reset the counters.
+        """
+
+        with self._lock:
+            self._cached.cache_clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _count(self) -> None:
+        """
+        Add the counters of the current lru_cache to the totals.
+        """
+
+        info = self._cached.cache_info()
+        self._hits += info.hits
+        self._misses += info.misses
+        self._evictions += info.misses - info.currsize
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the memo statistics.
+
+        ### Returns
+        - Dictionary with the hits, misses, evictions and size of the memo.
+        """
+
+        with self._lock:
+            info = self._cached.cache_info()
+
+            return {
+                "hits": self._hits + info.hits,
+                "misses": self._misses + info.misses,
+                # Every miss adds a result, so the ones that are gone were evicted
+                "evictions": self._evictions + info.misses - info.currsize,
+                "size": info.currsize,
+                "maxsize": info.maxsize or 0,
+            }
+
+
+def memoize(
+    maxsize: int = DEFAULT_MEMO_SIZE,
+) -> Callable[[Callable], MemoizedFunction]:
+    """
+    Decorator that memoizes a function and registers it by name.
+
+    ### Arguments
+    - maxsize: The maximum number of results to keep.
+
+    ### Returns
+    - The decorator.
+    """
+
+    def decorator(function: Callable) -> MemoizedFunction:
+        memoized = MemoizedFunction(function, maxsize)
+        MEMOIZED_FUNCTIONS[function.__name__] = memoized
+
+        return memoized
+
+    return decorator
+
+
+def set_memo_size(maxsize: int, names: Optional[Iterable[str]] = None) -> None:
+    """
+    Resize the memoized functions.
+
+    ### Arguments
+    - maxsize: The maximum number of results to keep, 0 disables memoization.
+    - names: The names of the functions to resize, all of them if None.
+    """
+
+    for name in MEMOIZED_FUNCTIONS if names is None else names:
+        MEMOIZED_FUNCTIONS[name].resize(maxsize)
+
+
+def get_memo_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the statistics of all memoized functions.
+
+    ### Returns
+    - Dictionary with the statistics of each memoized function.
+    """
+
+    return {name: memoized.stats for name, memoized in MEMOIZED_FUNCTIONS.items()}
@@ -0,0 +1,161 @@
+"""
+Module with a thread-safe rate limiter shared by all threads
+making requests to the same service.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Union
+
+__all__ = ["RATE_WINDOW", "RateLimiter"]
+
+logger = logging.getLogger(__name__)
+
+# Number of seconds over which the current rate is measured
+RATE_WINDOW = 10
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter.
+    Every request has to `acquire` a token first, tokens are refilled at
+    `rate` tokens per second. When the service tells us to back off,
+    `pause` blocks all threads until the given time has passed.
+    """
+
+    def __init__(
+        self, rate: Optional[float] = None, burst: Optional[int] = None
+    ) -> None:
+        """
+        Initializes the rate limiter.
+
+        ### Arguments
+        - rate: Target number of requests per second, `None` for no limit.
+        - burst: Maximum number of requests that can be made at once,
+            defaults to one second worth of requests.
+        """
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._waiting = 0
+        self._history: Deque[float] = deque()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Block until a request can be made.
+        """
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._paused_until - now
+                    if wait <= 0 and self.rate is None:
+                        break
+
+                    if wait <= 0 and self.rate is not None:
+                        self._tokens = min(
+                            self.burst,
+                            self._tokens + (now - self._last_refill) * self.rate,
+                        )
+                        self._last_refill = now
+
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            break
+
+                        wait = (1 - self._tokens) / self.rate
+
+                    self._condition.wait(wait)
+            finally:
+                self._waiting -= 1
+
+            self._history.append(now)
+            self._trim_history(now)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Block all requests for the given number of seconds.
+
+        ### Arguments
+        - seconds: The number of seconds to wait, e.g. the `Retry-After` header.
+        """
+
+        with self._condition:
+            paused_until = time.monotonic() + seconds
+            if paused_until > self._paused_until:
+                logger.debug("Pausing requests for %s seconds", seconds)
+                self._paused_until = paused_until
+
+                # Don't let the tokens accumulated before the pause
+                # cause a burst of requests when it ends
+                self._tokens = min(self._tokens, 1.0)
+
+            self._condition.notify_all()
+
+    def _trim_history(self, now: float) -> None:
+        """
+        Forget the requests made before the rate window.
+        Must be called with the lock held.
+
+        ### Arguments
+        - now: The current monotonic time.
+        """
+
+        window_start = now - RATE_WINDOW
+        while self._history and self._history[0] < window_start:
+            self._history.popleft()
+
+    @property
+    def current_rate(self) -> float:
+        """
+        Get the number of requests made per second over the last 10 seconds.
+
+        ### Returns
+        - The observed request rate.
+        """
+
+        with self._condition:
+            self._trim_history(time.monotonic())
+
+            return len(self._history) / RATE_WINDOW
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of threads waiting to make a request.
+
+        ### Returns
+        - The number of waiting threads.
+        """
+
+        with self._condition:
+            return self._waiting
+
+    @property
+    def stats(self) -> Dict[str, Union[float, int, None]]:
+        """
+        Get the rate limiter statistics.
+
+        ### Returns
+        - Dictionary with the target and current rate, queue depth
+        and the remaining pause time.
+        """
+
+        with self._condition:
+            paused_for = max(0.0, self._paused_until - time.monotonic())
+
+        return {
+            "target_rate": self.rate,
+            "current_rate": self.current_rate,
+            "queue_depth": self.queue_depth,
+            "paused_for": paused_for,
+        }
@@ -5,55 +5,74 @@
 To use this module you must first initialize the SpotifyClient.
 """
 
+# pylint: disable=too-many-lines
+
 import concurrent.futures
-import json
+import dataclasses
 import logging
 import re
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import requests
-from ytmusicapi import YTMusic
 
 from spotdl.types.album import Album
 from spotdl.types.artist import Artist
 from spotdl.types.playlist import Playlist
 from spotdl.types.saved import Saved
 from spotdl.types.song import Song, SongList
+from spotdl.utils.jsonio import iter_json_lines, load_json
 from spotdl.utils.metadata import get_file_metadata
-from spotdl.utils.spotify import SpotifyClient, SpotifyError
+from spotdl.utils.spotify import (
+    REQUEST_THREADS,
+    SpotifyClient,
+    SpotifyError,
+    get_all_items,
+)
+from spotdl.utils.ytmusic import ytm_client
 
 __all__ = [
     "QueryError",
     "get_search_results",
     "parse_query",
     "get_simple_songs",
+    "iter_simple_songs",
+    "iter_song_groups",
+    "iter_artist_songs",
+    "parse_requests",
+    "songs_from_list",
+    "add_list_info",
     "reinit_song",
+    "reinit_songs",
+    "merge_song_data",
     "get_song_from_file_metadata",
     "gather_known_songs",
     "create_ytm_album",
     "create_ytm_playlist",
     "get_all_user_playlists",
     "get_user_saved_albums",
+    "get_user_followed_artists",
+    "get_all_saved_playlists",
+    "lists_from_urls",
 ]
 
 logger = logging.getLogger(__name__)
-client = None  # pylint: disable=invalid-name
-
-
-def get_ytm_client() -> YTMusic:
-    """
-    Lazily initialize the YTMusic client.
-
-    ### Returns
-    - the YTMusic client
-    """
 
-    global client  # pylint: disable=global-statement
-    if client is None:
-        client = YTMusic()
+SongListT = TypeVar("SongListT", bound=SongList)
 
-    return client
+ARTIST_URL_REGEX = re.compile(r"^https?://open\.spotify\.com/(intl-\w+/)?artist/")
 
 
 class QueryError(Exception):
@@ -103,17 +122,7 @@ def parse_query(
         playlist_retain_track_cover=playlist_retain_track_cover,
     )
 
-    results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-        future_to_song = {executor.submit(reinit_song, song): song for song in songs}
-        for future in concurrent.futures.as_completed(future_to_song):
-            song = future_to_song[future]
-            try:
-                results.append(future.result())
-            except Exception as exc:
-                logger.error("%s generated an exception: %s", song.display_name, exc)
-
-    return results
+    return [song for song in reinit_songs(songs, threads) if song is not None]
 
 
 def get_simple_songs(
@@ -134,8 +143,172 @@ def get_simple_songs(
     - List of simple song objects
     """
 
-    songs: List[Song] = []
-    lists: List[SongList] = []
+    return list(
+        iter_simple_songs(
+            query,
+            use_ytm_data=use_ytm_data,
+            playlist_numbering=playlist_numbering,
+            albums_to_ignore=albums_to_ignore,
+            album_type=album_type,
+            playlist_retain_track_cover=playlist_retain_track_cover,
+        )
+    )
+
+
+def iter_simple_songs(
+    query: List[str],
+    use_ytm_data: bool = False,
+    playlist_numbering: bool = False,
+    albums_to_ignore=None,
+    album_type=None,
+    playlist_retain_track_cover: bool = False,
+) -> Iterator[Song]:
+    """
+    Parse query and yield simple song objects as soon as each
+    request (song, playlist, album, etc.) is fetched.
+
+    ### Arguments
+    - query: List of strings containing query
+
+    ### Returns
+    - Iterator of simple song objects
+    """
+
+    found = 0
+    lists = 0
+    ignored = 0
+    skipped_type = 0
+    for is_list, songs in iter_song_groups(
+        query, use_ytm_data, playlist_numbering, playlist_retain_track_cover
+    ):
+        lists += is_list
+
+        for song in songs:
+            found += 1
+
+            # removing songs for --ignore-albums
+            if albums_to_ignore and any(
+                keyword in song.album_name.lower() for keyword in albums_to_ignore
+            ):
+                ignored += 1
+                continue
+
+            if album_type and song.album_type != album_type:
+                skipped_type += 1
+                continue
+
+            yield song
+
+    if albums_to_ignore:
+        logger.info("Skipped %s songs (Ignored albums)", ignored)
+
+    if album_type:
+        logger.info(
+            "Skipped %s songs for Album Type %s", ignored + skipped_type, album_type
+        )
+
+    logger.debug("Found %s songs in %s lists", found - ignored - skipped_type, lists)
+
+
+def iter_song_groups(
+    query: List[str],
+    use_ytm_data: bool = False,
+    playlist_numbering: bool = False,
+    playlist_retain_track_cover: bool = False,
+) -> Iterator[Tuple[bool, Iterable[Song]]]:
+    """
+    Parse query and yield the simple songs of each request (song, playlist, album, etc.).
+    The songs of artists are yielded album by album, while the albums are fetched.
+
+    ### Arguments
+    - query: List of strings containing query
+    - use_ytm_data: Use YouTube Music data instead of Spotify data
+    - playlist_numbering: Use the list position as the track number
+        and the list as the album.
+    - playlist_retain_track_cover: Same as `playlist_numbering`
+        but keep the cover of the song.
+
+    ### Returns
+    - Iterator of tuples with whether the songs come from a list, and the songs
+    """
+
+    for request in query:
+        if ARTIST_URL_REGEX.match(request):
+            logger.info("Processing query: %s", request)
+            yield True, iter_artist_songs(
+                request, playlist_numbering, playlist_retain_track_cover
+            )
+            continue
+
+        for result in parse_requests([request], use_ytm_data):
+            if isinstance(result, SongList):
+                yield True, songs_from_list(
+                    result, playlist_numbering, playlist_retain_track_cover
+                )
+            else:
+                yield False, [result]
+
+
+def iter_artist_songs(
+    url: str,
+    playlist_numbering: bool = False,
+    playlist_retain_track_cover: bool = False,
+) -> Iterator[Song]:
+    """
+    Get the simple songs of an artist, with the list info filled in.
+    Unlike `Artist.from_url`, songs are yielded as soon as their album is fetched.
+    The list length is the number of tracks of the artist's albums,
+    since the songs aren't deduplicated until all albums are fetched.
+
+    ### Arguments
+    - url: The URL of the artist.
+    - playlist_numbering: Use the list position as the track number
+        and the list as the album.
+    - playlist_retain_track_cover: Same as `playlist_numbering`
+        but keep the cover of the song.
+
+    ### Returns
+    - Iterator of simple song objects
+    """
+
+    # Remove /intl-xxx/ from Spotify URLs with regex
+    url = re.sub(r"\/intl-\w+\/", "/", url)
+
+    metadata, track_count = Artist.get_discography(url)
+    artist = Artist(**metadata, urls=[], songs=[])
+
+    logger.info(
+        "Found %s albums with up to %s songs in %s (Artist)",
+        len(artist.albums),
+        track_count,
+        artist.name,
+    )
+
+    for song in Artist.get_songs(artist.albums):
+        yield add_list_info(
+            song,
+            artist,
+            track_count,
+            playlist_numbering,
+            playlist_retain_track_cover,
+        )
+
+
+def parse_requests(
+    query: List[str], use_ytm_data: bool = False
+) -> Iterator[Union[Song, SongList]]:
+    """
+    Parse query and yield the songs and song lists it refers to, one by one.
+    Lists are yielded without fetching the metadata of their songs.
+
+    ### Arguments
+    - query: List of strings containing query
+    - use_ytm_data: Use YouTube Music data instead of Spotify data
+
+    ### Returns
+    - Iterator of songs and song lists
+    """
+
     for request in query:
         logger.info("Processing query: %s", request)
 
@@ -168,11 +341,10 @@ def get_simple_songs(
                     'Incorrect format used, please use "YouTubeURL|SpotifyURL"'
                 )
 
-            songs.append(
-                Song.from_missing_data(url=split_urls[1], download_url=split_urls[0])
-            )
+            yield Song.from_missing_data(url=split_urls[1], download_url=split_urls[0])
         elif "music.youtube.com/watch?v" in request:
-            track_data = get_ytm_client().get_song(request.split("?v=", 1)[1])
+            with ytm_client() as client:
+                track_data = client.get_song(request.split("?v=", 1)[1])
 
             yt_song = Song.from_search_term(
                 f"{track_data['videoDetails']['author']} - {track_data['videoDetails']['title']}"
@@ -185,7 +357,7 @@ def get_simple_songs(
                 yt_song.duration = track_data["lengthSeconds"]
 
             yt_song.download_url = request
-            songs.append(yt_song)
+            yield yt_song
         elif (
             "youtube.com/playlist?list=" in request
             or "youtube.com/browse/VLPL" in request
@@ -200,9 +372,9 @@ def get_simple_songs(
             split_urls = request.split("|")
             if len(split_urls) == 1:
                 if "?list=OLAK5uy_" in request:
-                    lists.append(create_ytm_album(request, fetch_songs=False))
+                    yield create_ytm_album(request, fetch_songs=False)
                 elif "?list=PL" in request or "browse/VLPL" in request:
-                    lists.append(create_ytm_playlist(request, fetch_songs=False))
+                    yield create_ytm_playlist(request, fetch_songs=False)
             else:
                 if ("spotify" not in split_urls[1]) or not any(
                     x in split_urls[0]
@@ -241,118 +413,135 @@ def get_simple_songs(
                     for index, song in enumerate(ytm_list.songs):
                         song.url = spot_list.songs[index].url
 
-                    lists.append(ytm_list)
+                    yield ytm_list
                 else:
                     for index, song in enumerate(spot_list.songs):
                         song.download_url = ytm_list.songs[index].download_url
 
-                    lists.append(spot_list)
+                    yield spot_list
         elif "open.spotify.com" in request and "track" in request:
-            songs.append(Song.from_url(url=request))
+            yield Song.from_url(url=request)
         elif "https://spotify.link/" in request:
             resp = requests.head(request, allow_redirects=True, timeout=10)
             full_url = resp.url
-            full_lists = get_simple_songs(
-                [full_url],
-                use_ytm_data=use_ytm_data,
-                playlist_numbering=playlist_numbering,
-                album_type=album_type,
-                playlist_retain_track_cover=playlist_retain_track_cover,
-            )
-            songs.extend(full_lists)
+            yield from parse_requests([full_url], use_ytm_data=use_ytm_data)
         elif "open.spotify.com" in request and "playlist" in request:
-            lists.append(Playlist.from_url(request, fetch_songs=False))
+            yield Playlist.from_url(request, fetch_songs=False)
         elif "open.spotify.com" in request and "album" in request:
-            lists.append(Album.from_url(request, fetch_songs=False))
+            yield Album.from_url(request, fetch_songs=False)
         elif "open.spotify.com" in request and "artist" in request:
-            lists.append(Artist.from_url(request, fetch_songs=False))
+            yield Artist.from_url(request, fetch_songs=False)
         elif "open.spotify.com" in request and "user" in request:
-            lists.extend(get_all_user_playlists(request))
+            yield from get_all_user_playlists(request)
         elif "album:" in request:
-            lists.append(Album.from_search_term(request, fetch_songs=False))
+            yield Album.from_search_term(request, fetch_songs=False)
         elif "playlist:" in request:
-            lists.append(Playlist.from_search_term(request, fetch_songs=False))
+            yield Playlist.from_search_term(request, fetch_songs=False)
         elif "artist:" in request:
-            lists.append(Artist.from_search_term(request, fetch_songs=False))
+            yield Artist.from_search_term(request, fetch_songs=False)
         elif request == "saved":
-            lists.append(Saved.from_url(request, fetch_songs=False))
+            yield Saved.from_url(request, fetch_songs=False)
         elif request == "all-user-playlists":
-            lists.extend(get_all_user_playlists())
+            yield from get_all_user_playlists()
         elif request == "all-user-followed-artists":
-            lists.extend(get_user_followed_artists())
+            yield from get_user_followed_artists()
         elif request == "all-user-saved-albums":
-            lists.extend(get_user_saved_albums())
+            yield from get_user_saved_albums()
         elif request == "all-saved-playlists":
-            lists.extend(get_all_saved_playlists())
+            yield from get_all_saved_playlists()
         elif request.endswith(".spotdl"):
-            with open(request, "r", encoding="utf-8") as save_file:
-                for track in json.load(save_file):
-                    # Append to songs
-                    songs.append(Song.from_dict(track))
+            for track in load_json(request):
+                yield Song.from_dict(track)
+        elif request.endswith(".spotdl.jsonl"):
+            for track in iter_json_lines(request):
+                # Skip the header of sync files
+                if track.get("type") != "sync":
+                    yield Song.from_dict(track)
         else:
-            songs.append(Song.from_search_term(request))
+            yield Song.from_search_term(request)
 
-    for song_list in lists:
-        logger.info(
-            "Found %s songs in %s (%s)",
-            len(song_list.urls),
-            song_list.name,
-            song_list.__class__.__name__,
-        )
 
-        for index, song in enumerate(song_list.songs):
-            song_data = song.json
-            song_data["list_name"] = song_list.name
-            song_data["list_url"] = song_list.url
-            song_data["list_position"] = song.list_position
-            song_data["list_length"] = song_list.length
+def songs_from_list(
+    song_list: SongList,
+    playlist_numbering: bool = False,
+    playlist_retain_track_cover: bool = False,
+) -> List[Song]:
+    """
+    Get the simple songs of a song list, with the list info filled in.
+
+    ### Arguments
+    - song_list: The song list.
+    - playlist_numbering: Use the list position as the track number
+        and the list as the album.
+    - playlist_retain_track_cover: Same as `playlist_numbering`
+        but keep the cover of the song.
 
-            if playlist_numbering:
-                song_data["track_number"] = song_data["list_position"]
-                song_data["tracks_count"] = song_data["list_length"]
-                song_data["album_name"] = song_data["list_name"]
-                song_data["disc_number"] = 1
-                song_data["disc_count"] = 1
-                if isinstance(song_list, Playlist):
-                    song_data["album_artist"] = song_list.author_name
-                    song_data["cover_url"] = song_list.cover_url
-
-            if playlist_retain_track_cover:
-                song_data["track_number"] = song_data["list_position"]
-                song_data["tracks_count"] = song_data["list_length"]
-                song_data["album_name"] = song_data["list_name"]
-                song_data["disc_number"] = 1
-                song_data["disc_count"] = 1
-                song_data["cover_url"] = song_data["cover_url"]
-                if isinstance(song_list, Playlist):
-                    song_data["album_artist"] = song_list.author_name
-
-            songs.append(Song.from_dict(song_data))
-
-    # removing songs for --ignore-albums
-    original_length = len(songs)
-    if albums_to_ignore:
-        songs = [
-            song
-            for song in songs
-            if all(
-                keyword not in song.album_name.lower() for keyword in albums_to_ignore
-            )
-        ]
-        logger.info("Skipped %s songs (Ignored albums)", (original_length - len(songs)))
+    ### Returns
+    - List of simple song objects
+    """
 
-    if album_type:
-        songs = [song for song in songs if song.album_type == album_type]
+    logger.info(
+        "Found %s songs in %s (%s)",
+        len(song_list.urls),
+        song_list.name,
+        song_list.__class__.__name__,
+    )
 
-        logger.info(
-            "Skipped %s songs for Album Type %s",
-            (original_length - len(songs)),
-            album_type,
+    return [
+        add_list_info(
+            song,
+            song_list,
+            song_list.length,
+            playlist_numbering,
+            playlist_retain_track_cover,
         )
+        for song in song_list.songs
+    ]
 
-    logger.debug("Found %s songs in %s lists", len(songs), len(lists))
 
-    return songs
+def add_list_info(
+    song: Song,
+    song_list: SongList,
+    list_length: int,
+    playlist_numbering: bool = False,
+    playlist_retain_track_cover: bool = False,
+) -> Song:
+    """
+    Copy a song with the info of the list it comes from.
+
+    ### Arguments
+    - song: The song.
+    - song_list: The list of the song.
+    - list_length: The number of songs in the list.
+    - playlist_numbering: Use the list position as the track number
+        and the list as the album.
+    - playlist_retain_track_cover: Same as `playlist_numbering`
+        but keep the cover of the song.
+
+    ### Returns
+    - The simple song object
+    """
+
+    song_data: Dict[str, Any] = {
+        "list_name": song_list.name,
+        "list_url": song_list.url,
+        "list_position": song.list_position,
+        "list_length": list_length,
+    }
+
+    if playlist_numbering or playlist_retain_track_cover:
+        song_data["track_number"] = song_data["list_position"]
+        song_data["tracks_count"] = song_data["list_length"]
+        song_data["album_name"] = song_data["list_name"]
+        song_data["disc_number"] = 1
+        song_data["disc_count"] = 1
+        if isinstance(song_list, Playlist):
+            song_data["album_artist"] = song_list.author_name
+            if playlist_numbering:
+                song_data["cover_url"] = song_list.cover_url
+
+    # Copy the song with the list info, cheaper than a json round-trip
+    return dataclasses.replace(song, **song_data)
 
 
 def songs_from_albums(albums: List[str]):
@@ -372,16 +561,21 @@ def songs_from_albums(albums: List[str]):
 
         songs.extend([Song.from_missing_data(**song.json) for song in album.songs])
 
-    return songs
+    # Fill in the metadata missing from album tracks (genres, isrc, etc.)
+    # keep the simple song if it couldn't be reinitialized
+    return [new_song or song for song, new_song in zip(songs, reinit_songs(songs))]
 
 
-def get_all_user_playlists(user_url: str = "") -> List[Playlist]:
+def get_all_user_playlists(
+    user_url: str = "", threads: int = REQUEST_THREADS
+) -> List[Playlist]:
     """
     Get all user playlists.
 
     ### Args (optional)
     - user_url: Spotify user profile url.
         If a url is mentioned, get all public playlists of that specific user.
+    - threads: Number of playlists to fetch concurrently.
 
     ### Returns
     - List of all user playlists
@@ -409,28 +603,27 @@ def get_all_user_playlists(user_url: str = "") -> List[Playlist]:
     if user_playlists_response is None:
         raise SpotifyError("Couldn't get user playlists")
 
-    user_playlists = user_playlists_response["items"]
-
-    # Fetch all saved tracks
-    while user_playlists_response and user_playlists_response["next"]:
-        response = spotify_client.next(user_playlists_response)
-        if response is None:
-            break
-
-        user_playlists_response = response
-        user_playlists.extend(user_playlists_response["items"])
-
-    return [
-        Playlist.from_url(playlist["external_urls"]["spotify"], fetch_songs=False)
-        for playlist in user_playlists
-        if playlist["owner"]["id"] == user_id
-    ]
+    # Fetch all user playlists
+    user_playlists = get_all_items(user_playlists_response)
+
+    return lists_from_urls(
+        Playlist,
+        [
+            playlist["external_urls"]["spotify"]
+            for playlist in user_playlists
+            if playlist["owner"]["id"] == user_id
+        ],
+        threads,
+    )
 
 
-def get_user_saved_albums() -> List[Album]:
+def get_user_saved_albums(threads: int = REQUEST_THREADS) -> List[Album]:
     """
     Get all user saved albums
 
+    ### Arguments
+    - threads: Number of albums to fetch concurrently.
+
     ### Returns
     - List of all user saved albums
     """
@@ -443,27 +636,23 @@ def get_user_saved_albums() -> List[Album]:
     if user_saved_albums_response is None:
         raise SpotifyError("Couldn't get user saved albums")
 
-    user_saved_albums = user_saved_albums_response["items"]
-
-    # Fetch all saved tracks
-    while user_saved_albums_response and user_saved_albums_response["next"]:
-        response = spotify_client.next(user_saved_albums_response)
-        if response is None:
-            break
-
-        user_saved_albums_response = response
-        user_saved_albums.extend(user_saved_albums_response["items"])
+    # Fetch all saved albums
+    user_saved_albums = get_all_items(user_saved_albums_response)
 
-    return [
-        Album.from_url(item["album"]["external_urls"]["spotify"], fetch_songs=False)
-        for item in user_saved_albums
-    ]
+    return lists_from_urls(
+        Album,
+        [item["album"]["external_urls"]["spotify"] for item in user_saved_albums],
+        threads,
+    )
 
 
-def get_user_followed_artists() -> List[Artist]:
+def get_user_followed_artists(threads: int = REQUEST_THREADS) -> List[Artist]:
     """
     Get all user playlists
 
+    ### Arguments
+    - threads: Number of artists to fetch concurrently.
+
     ### Returns
     - List of all user playlists
     """
@@ -476,31 +665,28 @@ def get_user_followed_artists() -> List[Artist]:
     if user_followed_response is None:
         raise SpotifyError("Couldn't get user followed artists")
 
-    user_followed_response = user_followed_response["artists"]
-    user_followed = user_followed_response["items"]
-
-    # Fetch all artists
-    while user_followed_response and user_followed_response["next"]:
-        response = spotify_client.next(user_followed_response)
-        if response is None:
-            break
-
-        user_followed_response = response["artists"]
-        user_followed.extend(user_followed_response["items"])
+    # Fetch all artists, followed artists use cursor-based pagination
+    # so the pages are fetched one by one
+    user_followed = get_all_items(
+        user_followed_response["artists"], response_key="artists"
+    )
 
-    return [
-        Artist.from_url(followed_artist["external_urls"]["spotify"], fetch_songs=False)
-        for followed_artist in user_followed
-    ]
+    return lists_from_urls(
+        Artist,
+        [
+            followed_artist["external_urls"]["spotify"]
+            for followed_artist in user_followed
+        ],
+        threads,
+    )
 
 
-def get_all_saved_playlists() -> List[Playlist]:
+def get_all_saved_playlists(threads: int = REQUEST_THREADS) -> List[Playlist]:
     """
     Get all user playlists.
 
     ### Args (optional)
-    - user_url: Spotify user profile url.
-        If a url is mentioned, get all public playlists of that specific user.
+    - threads: Number of playlists to fetch concurrently.
 
     ### Returns
     - List of all user playlists
@@ -515,23 +701,63 @@ def get_all_saved_playlists() -> List[Playlist]:
     if user_playlists_response is None:
         raise SpotifyError("Couldn't get user playlists")
 
-    user_playlists = user_playlists_response["items"]
     user_id = user_playlists_response["href"].split("users/")[-1].split("/")[0]
 
-    # Fetch all saved tracks
-    while user_playlists_response and user_playlists_response["next"]:
-        response = spotify_client.next(user_playlists_response)
-        if response is None:
-            break
+    # Fetch all user playlists
+    user_playlists = get_all_items(user_playlists_response)
+
+    return lists_from_urls(
+        Playlist,
+        [
+            playlist["external_urls"]["spotify"]
+            for playlist in user_playlists
+            if playlist["owner"]["id"] != user_id
+        ],
+        threads,
+    )
 
-        user_playlists_response = response
-        user_playlists.extend(user_playlists_response["items"])
 
-    return [
-        Playlist.from_url(playlist["external_urls"]["spotify"], fetch_songs=False)
-        for playlist in user_playlists
-        if playlist["owner"]["id"] != user_id
-    ]
+def lists_from_urls(
+    list_type: Type[SongListT], urls: List[str], threads: int = REQUEST_THREADS
+) -> List[SongListT]:
+    """
+    Create song lists from their urls, fetching up to `threads` lists at once.
+
+    ### Arguments
+    - list_type: The class of the lists (Playlist, Album, Artist).
+    - urls: The urls of the lists.
+    - threads: Number of lists to fetch concurrently.
+
+    ### Returns
+    - List of song lists, in the same order as the urls.
+    """
+
+    def from_url(url: str) -> SongListT:
+        start_time = time.perf_counter()
+        song_list = list_type.from_url(url, fetch_songs=False)
+
+        logger.debug(
+            "Fetched %s (%s) with %s songs in %.2f seconds",
+            song_list.name,
+            list_type.__name__,
+            len(song_list.urls),
+            time.perf_counter() - start_time,
+        )
+
+        return song_list
+
+    start_time = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+        song_lists = list(executor.map(from_url, urls))
+
+    logger.debug(
+        "Fetched %s %s lists in %.2f seconds",
+        len(song_lists),
+        list_type.__name__,
+        time.perf_counter() - start_time,
+    )
+
+    return song_lists
 
 
 def reinit_song(song: Song) -> Song:
@@ -548,16 +774,88 @@ def reinit_song(song: Song) -> Song:
 
     data = song.json
     if data.get("url"):
-        new_data = Song.from_url(data["url"]).json
+        new_song = Song.from_url(data["url"])
     elif data.get("song_id"):
-        new_data = Song.from_url(
-            "https://open.spotify.com/track/" + data["song_id"]
-        ).json
+        new_song = Song.from_url("https://open.spotify.com/track/" + data["song_id"])
     elif data.get("name") and data.get("artist"):
-        new_data = Song.from_search_term(f"{data['artist']} - {data['name']}").json
+        new_song = Song.from_search_term(f"{data['artist']} - {data['name']}")
     else:
         raise QueryError("Song object is missing required data to be reinitialized")
 
+    return merge_song_data(song, new_song)
+
+
+def reinit_songs(songs: List[Song], threads: int = 1) -> List[Optional[Song]]:
+    """
+    Update multiple song objects with new data from Spotify.
+    Songs with an url or song id are fetched in batches
+    using Spotify's multi-id endpoints, the rest is reinitialized
+    one by one using `reinit_song`.
+
+    ### Arguments
+    - songs: List of song objects
+    - threads: Number of threads to use
+
+    ### Returns
+    - List of updated song objects in the same order as `songs`,
+    `None` for songs that couldn't be reinitialized
+    """
+
+    results: List[Optional[Song]] = [None] * len(songs)
+
+    batch_urls: Dict[int, str] = {}
+    for index, song in enumerate(songs):
+        if song.url:
+            batch_urls[index] = song.url
+        elif song.song_id:
+            batch_urls[index] = "https://open.spotify.com/track/" + song.song_id
+
+    new_songs = Song.list_from_urls(list(batch_urls.values()), threads)
+    for index, new_song in zip(batch_urls, new_songs):
+        if new_song is None:
+            logger.error(
+                "Couldn't get metadata for %s: %s",
+                songs[index].display_name,
+                batch_urls[index],
+            )
+            continue
+
+        results[index] = merge_song_data(songs[index], new_song)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        future_to_index = {
+            executor.submit(reinit_song, song): index
+            for index, song in enumerate(songs)
+            if index not in batch_urls
+        }
+        for future in concurrent.futures.as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                logger.error(
+                    "%s generated an exception: %s", songs[index].display_name, exc
+                )
+
+    return results
+
+
+def merge_song_data(song: Song, new_song: Song) -> Song:
+    """
+    Fill in the missing data of a song object
+    with the data of a freshly fetched one.
+
+    ### Arguments
+    - song: Song object to update
+    - new_song: Song object with new data
+
+    ### Returns
+    - Updated song object
+    """
+
+    data = song.json
+    new_data = new_song.json
+
     for key in Song.__dataclass_fields__:  # type: ignore # pylint: disable=E1101
         val = data.get(key)
         new_val = new_data.get(key)
@@ -642,13 +940,12 @@ def create_ytm_album(url: str, fetch_songs: bool = True) -> Album:
     if "?list=" not in url or not url.startswith("https://music.youtube.com/"):
         raise ValueError(f"Invalid album url: {url}")
 
-    browse_id = get_ytm_client().get_album_browse_id(
-        url.split("?list=")[1].split("&")[0]
-    )
-    if browse_id is None:
-        raise ValueError(f"Invalid album url: {url}")
+    with ytm_client() as client:
+        browse_id = client.get_album_browse_id(url.split("?list=")[1].split("&")[0])
+        if browse_id is None:
+            raise ValueError(f"Invalid album url: {url}")
 
-    album = get_ytm_client().get_album(browse_id)
+        album = client.get_album(browse_id)
 
     if album is None:
         raise ValueError(f"Couldn't fetch album: {url}")
@@ -701,7 +998,8 @@ def create_ytm_playlist(url: str, fetch_songs: bool = True) -> Playlist:
         playlist_id = url.split("/browse/")[1]
     else:
         playlist_id = url.split("?list=")[1]
-    playlist = get_ytm_client().get_playlist(playlist_id, None)  # type: ignore
+    with ytm_client() as client:
+        playlist = client.get_playlist(playlist_id, None)  # type: ignore
 
     if playlist is None:
         raise ValueError(f"Couldn't fetch playlist: {url}")
@@ -8,25 +8,87 @@
 ```
 """
 
+import concurrent.futures
 import json
 import logging
-from typing import Dict, Optional
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 from spotipy import Spotify
 from spotipy.cache_handler import CacheFileHandler, MemoryCacheHandler
+from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
 
+from spotdl.utils.cache import CacheBackend, CacheError, MemoryCache, SQLiteCache
 from spotdl.utils.config import get_cache_path, get_spotify_cache_path
+from spotdl.utils.ratelimit import RateLimiter
 
 __all__ = [
     "SpotifyError",
     "SpotifyClient",
     "save_spotify_cache",
+    "get_cache_namespace",
+    "get_cache_key",
+    "parse_request",
+    "SPOTIFY_CACHE_TTLS",
+    "EntityMemo",
+    "ENTITY_MEMO",
+    "get_spotify_id",
+    "get_album",
+    "get_artist",
+    "get_all_items",
+    "get_tracks",
+    "get_albums",
+    "get_artists",
+    "REQUEST_THREADS",
+    "TRACKS_BATCH_SIZE",
+    "ALBUMS_BATCH_SIZE",
+    "ARTISTS_BATCH_SIZE",
+    "get_retry_after",
 ]
 
 logger = logging.getLogger(__name__)
 
+API_PREFIX_REGEX = re.compile(r"^(https?:)?//api\.spotify\.com/v1/", re.IGNORECASE)
+
+# Endpoints that accept multiple ids, their responses are cached per object
+MULTI_ID_ENDPOINTS = ("tracks", "albums", "artists")
+
+# Time-to-live (in seconds) of the cached responses for each endpoint,
+# used only by the cache file. User related endpoints are never stored
+SPOTIFY_CACHE_TTLS: Dict[str, Optional[float]] = {
+    "tracks": 60 * 60 * 24 * 30,
+    "albums": 60 * 60 * 24 * 30,
+    "albums/tracks": 60 * 60 * 24 * 30,
+    "artists": 60 * 60 * 24 * 7,
+    "artists/albums": 60 * 60 * 24,
+    "playlists": 60 * 15,
+    "playlists/tracks": 60 * 15,
+    "playlists/items": 60 * 15,
+    "search": 60 * 60 * 24,
+    "users": 0,
+    "users/playlists": 0,
+    "me": 0,
+}
+SPOTIFY_CACHE_DEFAULT_TTL = 60 * 60 * 24
+SPOTIFY_CACHE_MAX_ENTRIES = 100_000
+
+# Number of requests run concurrently when fetching
+# the pages of a list or batches of objects
+REQUEST_THREADS = 4
+
+# Maximum number of ids accepted by Spotify's multi-id endpoints
+TRACKS_BATCH_SIZE = 50
+ALBUMS_BATCH_SIZE = 20
+ARTISTS_BATCH_SIZE = 50
+
+# Seconds to wait after a 429 response without a Retry-After header
+DEFAULT_RETRY_AFTER = 5
+
 
 class SpotifyError(Exception):
     """
@@ -69,6 +131,7 @@ def init(  # pylint: disable=bad-mcs-method-argument
         use_cache_file: bool = False,
         auth_token: Optional[str] = None,
         cache_path: Optional[str] = None,
+        requests_per_second: Optional[float] = None,
     ) -> "Singleton":
         """
         Initializes the SpotifyClient.
@@ -81,6 +144,8 @@ def init(  # pylint: disable=bad-mcs-method-argument
         - cache_path: The path to the cache file.
         - no_cache: Whether or not to use the cache.
         - open_browser: Whether or not to open the browser.
+        - requests_per_second: Target number of requests per second,
+            shared by all threads. `None` for no limit.
 
         ### Returns
         - The instance of the SpotifyClient.
@@ -121,12 +186,14 @@ def init(  # pylint: disable=bad-mcs-method-argument
         self.no_cache = no_cache
         self.max_retries = max_retries
         self.use_cache_file = use_cache_file
+        self.requests_per_second = requests_per_second
 
         # Create instance
+        # 429 is handled in SpotifyClient._internal_call so that all threads back off
         self._instance = super().__call__(
             auth=auth_token,
             auth_manager=credential_manager,
-            status_forcelist=(429, 500, 502, 503, 504, 404),
+            status_forcelist=(500, 502, 503, 504, 404),
         )
 
         # Return instance
@@ -141,7 +208,6 @@ class SpotifyClient(Spotify, metaclass=Singleton):
     """
 
     _initialized = False
-    cache: Dict[str, Optional[Dict]] = {}
 
     def __init__(self, *args, **kwargs):
         """
@@ -156,19 +222,48 @@ def __init__(self, *args, **kwargs):
         self._initialized = True
 
         use_cache_file: bool = self.use_cache_file  # type: ignore # pylint: disable=E1101
-        cache_file_loc = get_spotify_cache_path()
 
-        if use_cache_file and cache_file_loc.exists():
-            with open(cache_file_loc, "r", encoding="utf-8") as cache_file:
-                self.cache = json.load(cache_file)
-        elif use_cache_file:
-            with open(cache_file_loc, "w", encoding="utf-8") as cache_file:
-                json.dump(self.cache, cache_file)
+        self.cache: CacheBackend = MemoryCache()
+        if use_cache_file:
+            try:
+                self.cache = SQLiteCache(
+                    get_spotify_cache_path(),
+                    ttls=SPOTIFY_CACHE_TTLS,
+                    default_ttl=SPOTIFY_CACHE_DEFAULT_TTL,
+                    max_entries=SPOTIFY_CACHE_MAX_ENTRIES,
+                )
+            except CacheError as exception:
+                logger.warning("%s, using in-memory cache", exception)
+
+        # Requests currently being made, keyed by their cache key
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+        # Shared by all threads, so that a 429 pauses every request
+        self.rate_limiter = RateLimiter(
+            self.requests_per_second  # type: ignore # pylint: disable=E1101
+        )
+
+    def _build_session(self):
+        """
+        Overrides the session of the SpotifyClient, so that urllib3
+        doesn't wait for the Retry-After of 429 responses by itself.
+        They are handled in `_internal_call`, where all threads back off.
+        """
+
+        super()._build_session()
+
+        adapter = self._session.get_adapter(self.prefix)
+        retry = adapter.max_retries.new(respect_retry_after_header=False)
+        adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def _get(self, url, args=None, payload=None, **kwargs):
         """
         Overrides the get method of the SpotifyClient.
-        Allows us to cache requests
+        Allows us to cache requests, concurrent requests with the same
+        canonical key are coalesced into a single request.
         """
 
         use_cache = not self.no_cache  # type: ignore # pylint: disable=E1101
@@ -176,52 +271,672 @@ def _get(self, url, args=None, payload=None, **kwargs):
         if args:
             kwargs.update(args)
 
-        cache_key = None
+        cache_key = get_cache_key(url, kwargs, payload)
         if use_cache:
-            key_obj = dict(kwargs)
-            key_obj["url"] = url
-            key_obj["data"] = json.dumps(payload)
-            cache_key = json.dumps(key_obj)
-            if cache_key is None:
-                cache_key = url
-            if self.cache.get(cache_key) is not None:
-                return self.cache[cache_key]
-
-        # Wrap in a try-except and retry up to `retries` times.
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(cache_key)
+            if in_flight is None:
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                self._in_flight[cache_key] = future
+
+        # Another thread is already making the same request, wait for its response
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            # The response may have been cached by a request
+            # that finished after our cache lookup
+            response = self.cache.get(cache_key) if use_cache else None
+            if response is None:
+                response = self._get_with_retries(url, payload, kwargs)
+                if use_cache and response is not None:
+                    self._cache_response(url, kwargs, cache_key, response)
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(cache_key, None)
+
+        future.set_result(response)
+
+        return response
+
+    def _get_with_retries(self, url: str, payload: Optional[Dict], params: Dict):
+        """
+        Make a GET request, timeouts and connection errors
+        are retried up to `max_retries` times.
+
+        ### Arguments
+        - url: The url of the request.
+        - payload: The payload of the request.
+        - params: The query parameters of the request.
+
+        ### Returns
+        - The response of the request.
+        """
+
         response = None
         retries = self.max_retries  # type: ignore # pylint: disable=E1101
         while response is None:
             try:
-                response = self._internal_call("GET", url, payload, kwargs)
+                response = self._internal_call("GET", url, payload, params)
             except (requests.exceptions.Timeout, requests.ConnectionError) as exc:
                 retries -= 1
                 if retries <= 0:
                     raise exc
 
-        if use_cache and cache_key is not None:
-            self.cache[cache_key] = response
-
         return response
 
+    def _internal_call(self, method, url, payload, params):
+        """
+        Overrides the internal call of the SpotifyClient, used by every
+        request (GET, POST, PUT and DELETE). Waits for the rate limiter
+        before every attempt, 429 responses pause all threads
+        and are retried up to `max_retries` times.
+        """
+
+        retries = self.max_retries  # type: ignore # pylint: disable=E1101
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                return super()._internal_call(method, url, payload, params)
+            except SpotifyException as exc:
+                if exc.http_status != 429:
+                    raise exc
+
+                retries -= 1
+                if retries <= 0:
+                    raise exc
+
+                self.rate_limiter.pause(get_retry_after(exc))
+
+    def _cache_response(
+        self, url: str, params: Dict[str, Any], cache_key: str, response: Dict
+    ):
+        """
+        Add a response to the cache. Responses of the multi-id endpoints
+        are split and cached as single objects, so that they can be reused
+        by both `track(id)` and `tracks([id, ...])` calls.
+
+        ### Arguments
+        - url: The url of the request.
+        - params: The query parameters of the request.
+        - cache_key: The canonical key of the request.
+        - response: The response to cache.
+        """
+
+        namespace = get_cache_namespace(url)
+        path, query_params = parse_request(url, params)
+
+        if (
+            path in MULTI_ID_ENDPOINTS
+            and "ids" in query_params
+            and "market" not in query_params
+        ):
+            for item in response.get(path) or []:
+                if item is not None and item.get("id"):
+                    self.cache.set(
+                        get_cache_key(f"{path}/{item['id']}"), item, namespace
+                    )
+
+            return None
+
+        self.cache.set(cache_key, response, namespace)
+
+        return None
+
+    def get_cached(self, url: str) -> Optional[Dict]:
+        """
+        Get a cached response without making a request.
+
+        ### Arguments
+        - url: The url of the request, e.g. `tracks/{id}`.
+
+        ### Returns
+        - The cached response or None.
+        """
+
+        if self.no_cache:  # type: ignore # pylint: disable=E1101
+            return None
+
+        return self.cache.get(get_cache_key(url))
+
+
+class EntityMemo:
+    """
+    Thread-safe, bounded LRU memo of raw album and artist objects,
+    keyed by entity type and Spotify id.
+    Shared by all Song constructors and song lists for the duration of a run.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Initializes the memo.
+
+        ### Arguments
+        - maxsize: The maximum number of entities to keep.
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entities: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, entity_type: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entity from the memo.
+
+        ### Arguments
+        - entity_type: The type of the entity (album, artist).
+        - entity_id: The Spotify id of the entity.
+
+        ### Returns
+        - The raw entity or None if it's not memoized.
+        """
+
+        key = (entity_type, entity_id)
+        with self._lock:
+            entity = self._entities.get(key)
+            if entity is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entities.move_to_end(key)
+
+            return entity
+
+    def peek(self, entity_type: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entity from the memo without updating the counters.
+
+        ### Arguments
+        - entity_type: The type of the entity (album, artist).
+        - entity_id: The Spotify id of the entity.
+
+        ### Returns
+        - The raw entity or None if it's not memoized.
+        """
+
+        with self._lock:
+            return self._entities.get((entity_type, entity_id))
+
+    def set(self, entity_type: str, entity_id: str, entity: Dict[str, Any]):
+        """
+        Add an entity to the memo, evicting the least recently used one if full.
+
+        ### Arguments
+        - entity_type: The type of the entity (album, artist).
+        - entity_id: The Spotify id of the entity.
+        - entity: The raw entity.
+        """
+
+        key = (entity_type, entity_id)
+        with self._lock:
+            self._entities[key] = entity
+            self._entities.move_to_end(key)
+            while len(self._entities) > self.maxsize:
+                self._entities.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all entities and reset the counters.
+        """
+
+        with self._lock:
+            self._entities.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the memo statistics.
+
+        ### Returns
+        - Dictionary with the hits, misses and size of the memo.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entities),
+                "maxsize": self.maxsize,
+            }
+
+
+ENTITY_MEMO = EntityMemo()
+
+
+def get_spotify_id(url: str) -> str:
+    """
+    Get the Spotify id from an url, uri or id.
+
+    ### Arguments
+    - url: The url, uri (spotify:album:id) or id.
+
+    ### Returns
+    - The Spotify id.
+    """
+
+    url = url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+
+    return url.rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+
+
+def _get_memoized(
+    entity_type: str, url: str, method: Callable[[str], Optional[Dict]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Get an entity from the memo, or fetch and memoize it.
+
+    ### Arguments
+    - entity_type: The type of the entity (album, artist).
+    - url: The url, uri or id of the entity.
+    - method: The SpotifyClient method used to fetch the entity.
+
+    ### Returns
+    - The raw entity or None if it couldn't be fetched.
+    """
+
+    entity_id = get_spotify_id(url)
+    entity = ENTITY_MEMO.get(entity_type, entity_id)
+    if entity is not None:
+        return entity
+
+    entity = method(entity_id)
+    if entity is not None:
+        ENTITY_MEMO.set(entity_type, entity_id, entity)
 
-def save_spotify_cache(cache: Dict[str, Optional[Dict]]):
+    return entity
+
+
+def get_album(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Get an album, using the entity memo if possible.
+
+    ### Arguments
+    - url: The url, uri or id of the album.
+
+    ### Returns
+    - The raw album metadata.
+    """
+
+    return _get_memoized("album", url, SpotifyClient().album)
+
+
+def get_artist(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Get an artist, using the entity memo if possible.
+
+    ### Arguments
+    - url: The url, uri or id of the artist.
+
+    ### Returns
+    - The raw artist metadata.
+    """
+
+    return _get_memoized("artist", url, SpotifyClient().artist)
+
+
+def parse_request(
+    url: str, params: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a Spotify API request into its canonical path and query parameters.
+
+    ### Arguments
+    - url: The url, relative or absolute, of the request.
+    - params: Additional query parameters of the request.
+
+    ### Returns
+    - The path without the API prefix, e.g. `tracks/{id}`.
+    - The query parameters without the empty ones.
+    """
+
+    url = API_PREFIX_REGEX.sub("", url.strip())
+    path, _, query = url.partition("?")
+    path = "/".join(segment for segment in path.split("/") if segment)
+
+    query_params = dict(parse_qsl(query, keep_blank_values=False))
+    for key, value in (params or {}).items():
+        if value is not None:
+            query_params[key] = str(value)
+
+    # offset=0 is the default, don't distinguish between the first page
+    # requested with and without it
+    if query_params.get("offset") == "0":
+        del query_params["offset"]
+
+    return path, query_params
+
+
+def get_cache_key(
+    url: str, params: Optional[Dict[str, Any]] = None, payload: Any = None
+) -> str:
     """
-    Saves the Spotify cache to a file.
+    Get the canonical cache key of a Spotify API request.
+
+    ### Arguments
+    - url: The url, relative or absolute, of the request.
+    - params: Additional query parameters of the request.
+    - payload: The payload of the request.
+
+    ### Returns
+    - The cache key, e.g. `playlists/{id}/tracks?limit=100&offset=100`.
+    """
+
+    path, query_params = parse_request(url, params)
+
+    cache_key = path
+    if query_params:
+        cache_key += "?" + urlencode(sorted(query_params.items()), safe=",")
+
+    if payload is not None:
+        cache_key += "#" + json.dumps(payload, sort_keys=True)
+
+    return cache_key
+
+
+def get_retry_after(exception: SpotifyException) -> float:
+    """
+    Get the number of seconds to wait before retrying a throttled request.
+
+    ### Arguments
+    - exception: The exception raised for the 429 response.
+
+    ### Returns
+    - The value of the Retry-After header or `DEFAULT_RETRY_AFTER`.
+    """
+
+    headers = exception.headers or {}
+    retry_after = headers.get("Retry-After") or headers.get("retry-after")
+    if retry_after is None:
+        return DEFAULT_RETRY_AFTER
+
+    try:
+        return max(0.0, float(str(retry_after)))
+    except ValueError:
+        return DEFAULT_RETRY_AFTER
+
+
+def get_cache_namespace(url: str) -> str:
+    """
+    Get the cache namespace (endpoint) of a Spotify API url.
+
+    ### Arguments
+    - url: The url, relative or absolute, of the request.
+
+    ### Returns
+    - The namespace, e.g. `tracks`, `albums/tracks` or `me`.
+
+    ### Notes
+    - `artists/{id}/albums` -> `artists/albums`
+    """
+
+    path, _ = parse_request(url)
+    segments = path.split("/")
+
+    if segments[0] != "me" and len(segments) > 2:
+        return f"{segments[0]}/{segments[2]}"
+
+    return segments[0]
+
+
+def save_spotify_cache(cache: CacheBackend):
+    """
+    Makes sure that the Spotify cache is saved to the disk.
 
     ### Arguments
     - cache: The cache to save.
     """
 
-    cache_file_loc = get_spotify_cache_path()
+    logger.debug("Saving Spotify cache (%s entries)", len(cache))
+
+    cache.flush()
+
+
+def get_all_items(
+    response: Dict[str, Any],
+    threads: int = REQUEST_THREADS,
+    response_key: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """
+    Get the items of all pages of a paginated response.
+    Offset-based pages are fetched concurrently, since the first page tells
+    us the total number of items, cursor-based pages are fetched one by one.
+
+    ### Arguments
+    - response: The first page of the response.
+    - threads: The number of pages to fetch concurrently.
+    - response_key: The key of the paging object in the following pages,
+        e.g. `artists` for followed artists.
+    - params: Query parameters added to the offset-based pages,
+        e.g. the `fields` projection of the first request.
+
+    ### Returns
+    - The items of all pages in order.
+
+    ### Notes
+    - Fetching stops at the first page that couldn't be fetched,
+    like when walking the pages with `SpotifyClient.next`.
+    """
+
+    spotify_client = SpotifyClient()
+    items = list(response["items"])
+
+    if not response.get("next"):
+        return items
+
+    if response.get("cursors") is not None or response.get("total") is None:
+        page: Optional[Dict[str, Any]] = response
+        while page and page.get("next"):
+            page = spotify_client.next(page)
+            if page is not None and response_key:
+                page = page.get(response_key)
+
+            if page is None:
+                break
+
+            items.extend(page["items"])
+
+        return items
+
+    next_url = urlsplit(response["next"])
+    query_params = {**dict(parse_qsl(next_url.query)), **(params or {})}
+    limit = response["limit"]
+
+    def fetch_page(offset: int) -> Optional[Dict[str, Any]]:
+        page_url = urlunsplit(
+            next_url._replace(
+                query=urlencode({**query_params, "offset": offset}, safe=",")
+            )
+        )
+        page = spotify_client.next({"next": page_url})
+        if page is not None and response_key:
+            return page.get(response_key)
+
+        return page
+
+    offsets = range(response["offset"] + limit, response["total"], limit)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for page in executor.map(fetch_page, offsets):
+            if page is None:
+                logger.debug("Failed to get page of %s", response.get("href"))
+                break
+
+            items.extend(page["items"])
+
+    logger.debug(
+        "Fetched %s items in %s pages from %s",
+        len(items),
+        len(offsets) + 1,
+        response.get("href"),
+    )
+
+    return items
+
+
+def _get_in_batches(
+    method: Callable[[List[str]], Optional[Dict]],
+    response_key: str,
+    ids: List[str],
+    batch_size: int,
+    threads: int = 1,
+    entity_type: Optional[str] = None,
+    fetch_one: Optional[Callable[[str], Optional[Dict]]] = None,
+) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch objects from one of Spotify's multi-id endpoints.
+
+    ### Arguments
+    - method: The SpotifyClient method to call with a list of ids.
+    - response_key: The key of the objects list in the response.
+    - ids: The ids to fetch, duplicates are fetched only once.
+    - batch_size: The maximum number of ids per request.
+    - threads: The number of requests to run concurrently.
+    - entity_type: If set, the entity memo is used for this type of objects.
+    - fetch_one: The SpotifyClient method to call with a single id,
+        used to fetch the objects of failed batches one by one.
+
+    ### Returns
+    - Dictionary mapping every id to its object, or None if it wasn't found.
+    """
+
+    spotify_client = SpotifyClient()
+
+    objects: Dict[str, Optional[Dict]] = {}
+    unique_ids = []
+    for entity_id in dict.fromkeys(ids):
+        entity = ENTITY_MEMO.get(entity_type, entity_id) if entity_type else None
+        if entity is None:
+            entity = spotify_client.get_cached(f"{response_key}/{entity_id}")  # type: ignore # pylint: disable=E1101
+
+        if entity is not None:
+            objects[entity_id] = entity
+            if entity_type:
+                ENTITY_MEMO.set(entity_type, entity_id, entity)
+        else:
+            unique_ids.append(entity_id)
+
+    batches = [
+        unique_ids[index : index + batch_size]
+        for index in range(0, len(unique_ids), batch_size)
+    ]
+
+    def fetch_single(entity_id: str) -> Optional[Dict]:
+        try:
+            return fetch_one(entity_id) if fetch_one is not None else None
+        except SpotifyException as exception:
+            logger.warning(
+                "Failed to fetch %s %s: %s", response_key, entity_id, exception
+            )
+            return None
+
+    def fetch_batch(batch: List[str]) -> List[Optional[Dict]]:
+        # One invalid id fails the whole batch,
+        # so its objects are fetched one by one
+        try:
+            response = method(batch)
+        except SpotifyException as exception:
+            logger.warning(
+                "Failed to fetch %s %s, fetching them one by one: %s",
+                len(batch),
+                response_key,
+                exception,
+            )
+            return [fetch_single(entity_id) for entity_id in batch]
+
+        if response is None:
+            return [None] * len(batch)
+
+        return response.get(response_key) or [None] * len(batch)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for batch, batch_objects in zip(batches, executor.map(fetch_batch, batches)):
+            for entity_id, entity in zip(batch, batch_objects):
+                objects[entity_id] = entity
+                if entity_type and entity is not None:
+                    ENTITY_MEMO.set(entity_type, entity_id, entity)
+
+    logger.debug(
+        "Fetched %s %s in %s request(s)", len(unique_ids), response_key, len(batches)
+    )
+
+    return objects
+
+
+def get_tracks(ids: List[str], threads: int = 1) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch multiple tracks using the `/tracks?ids=` endpoint.
+
+    ### Arguments
+    - ids: The track ids to fetch.
+    - threads: The number of requests to run concurrently.
+
+    ### Returns
+    - Dictionary mapping track ids to raw track metadata.
+    """
+
+    return _get_in_batches(
+        SpotifyClient().tracks,
+        "tracks",
+        ids,
+        TRACKS_BATCH_SIZE,
+        threads,
+        fetch_one=SpotifyClient().track,
+    )
+
+
+def get_albums(ids: List[str], threads: int = 1) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch multiple albums using the `/albums?ids=` endpoint.
+
+    ### Arguments
+    - ids: The album ids to fetch.
+    - threads: The number of requests to run concurrently.
+
+    ### Returns
+    - Dictionary mapping album ids to raw album metadata.
+    """
+
+    return _get_in_batches(
+        SpotifyClient().albums,
+        "albums",
+        ids,
+        ALBUMS_BATCH_SIZE,
+        threads,
+        "album",
+        SpotifyClient().album,
+    )
 
-    logger.debug("Saving Spotify cache to %s", cache_file_loc)
 
-    # Only cache tracks
-    cache = {
-        key: value
-        for key, value in cache.items()
-        if value is not None and "tracks/" in key
-    }
+def get_artists(ids: List[str], threads: int = 1) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch multiple artists using the `/artists?ids=` endpoint.
+
+    ### Arguments
+    - ids: The artist ids to fetch.
+    - threads: The number of requests to run concurrently.
+
+    ### Returns
+    - Dictionary mapping artist ids to raw artist metadata.
+    """
 
-    with open(cache_file_loc, "w", encoding="utf-8") as cache_file:
-        json.dump(cache, cache_file)
+    return _get_in_batches(
+        SpotifyClient().artists,
+        "artists",
+        ids,
+        ARTISTS_BATCH_SIZE,
+        threads,
+        "artist",
+        SpotifyClient().artist,
+    )
@@ -0,0 +1,146 @@
+"""
+Module with a pool of YouTube Music clients, shared by the YouTube Music
+audio provider, the YouTube Music queries and the connection check.
+A client is only used by one thread at a time, and each client has its own
+HTTP session, so connections are kept alive between the requests of a thread.
+
+```python
+from spotdl.utils.ytmusic import ytm_client
+
+with ytm_client("de") as client:
+    client.search("Abstrakt - Nobody Else", filter="songs")
+```
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import ContextManager, Dict, Iterator, List
+
+from ytmusicapi import YTMusic
+
+__all__ = ["MAX_IDLE_CLIENTS", "YTMusicPool", "YTM_POOL", "ytm_client"]
+
+logger = logging.getLogger(__name__)
+
+# Enough for every thread of a download with 16 threads and parallel search
+MAX_IDLE_CLIENTS = 32
+
+
+class YTMusicPool:
+    """
+    Thread-safe pool of YTMusic clients. Clients are created when all
+    clients of a language are in use, and reused once they are returned.
+    """
+
+    def __init__(self, max_idle: int = MAX_IDLE_CLIENTS):
+        """
+        Initializes the pool.
+
+        ### Arguments
+        - max_idle: The maximum number of unused clients kept per language.
+        """
+
+        self.max_idle = max_idle
+        self._idle: Dict[str, List[YTMusic]] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, language: str = "en") -> YTMusic:
+        """
+        Get a client that isn't used by any other thread.
+
+        ### Arguments
+        - language: The language of the results.
+
+        ### Returns
+        - The client, it has to be returned with `release`.
+        """
+
+        with self._lock:
+            idle = self._idle.get(language)
+            if idle:
+                self.reused += 1
+
+                return idle.pop()
+
+            self.created += 1
+
+        logger.debug("Creating YouTube Music client (%s)", language)
+
+        return YTMusic(language=language)
+
+    def release(self, client: YTMusic) -> None:
+        """
+        Return a client to the pool.
+
+        ### Arguments
+        - client: The client returned by `acquire`.
+        """
+
+        with self._lock:
+            idle = self._idle.setdefault(client.language, [])
+            if len(idle) < self.max_idle:
+                idle.append(client)
+
+    @contextmanager
+    def client(self, language: str = "en") -> Iterator[YTMusic]:
+        """
+        Use a client of the pool.
+
+        ### Arguments
+        - language: The language of the results.
+
+        ### Returns
+        - The client, it's returned to the pool at the end of the block.
+        """
+
+        client = self.acquire(language)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def clear(self) -> None:
+        """
+        Remove the unused clients and reset the counters.
+        """
+
+        with self._lock:
+            self._idle.clear()
+            self.created = 0
+            self.reused = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the pool statistics.
+
+        ### Returns
+        - Dictionary with the number of clients created, reused and unused.
+        """
+
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+            }
+
+
+YTM_POOL = YTMusicPool()
+
+
+def ytm_client(language: str = "en") -> ContextManager[YTMusic]:
+    """
+    Use a client of the shared pool.
+
+    ### Arguments
+    - language: The language of the results.
+
+    ### Returns
+    - Context manager with the client.
+    """
+
+    return YTM_POOL.client(language)
@@ -53,6 +53,7 @@ def new_initialize(
     headless=True,
     max_retries=3,
     use_cache_file=False,
+    requests_per_second=None,
 ):
     """This function allows calling `initialize()` multiple times"""
     try:
@@ -68,6 +69,7 @@ def new_initialize(
             headless=headless,
             max_retries=max_retries,
             use_cache_file=use_cache_file,
+            requests_per_second=requests_per_second,
         )
 
 
@@ -0,0 +1,222 @@
+import threading
+import time
+
+import pytest
+
+from spotdl.download import downloader as downloader_module
+from spotdl.download.downloader import Downloader
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.match_store import MatchStore
+
+SONG = Song.from_missing_data(
+    name="Nobody Else",
+    artists=["Abstrakt"],
+    artist="Abstrakt",
+    duration=162,
+    song_id="0kx3ml8bdAYrQtcIwvkhp8",
+)
+
+
+def create_result(video_id: str, verified: bool) -> Result:
+    return Result(
+        source="test",
+        url=f"https://music.youtube.com/watch?v={video_id}",
+        verified=verified,
+        name="Nobody Else",
+        duration=162,
+        author="Abstrakt",
+        result_id=video_id,
+    )
+
+
+def create_downloader(monkeypatch, matches, parallel_search=True):
+    """
+    Create a downloader whose providers return `matches` in order,
+    each match is a tuple of delay, result id, verified and score.
+    """
+
+    downloader = Downloader(
+        {
+            "ffmpeg": "true",
+            "audio_providers": ["youtube-music", "youtube"],
+            "lyrics_providers": [],
+            "parallel_search": parallel_search,
+            "simple_tui": True,
+        }
+    )
+
+    searched = []
+    for audio_provider, match in zip(downloader.audio_providers, matches):
+
+        def find_match(song, only_verified=False, match=match, provider=audio_provider):
+            searched.append(provider.name)
+            if isinstance(match, Exception):
+                raise match
+
+            if match is None:
+                return None
+
+            delay, result_id, verified, score = match
+            time.sleep(delay)
+
+            return create_result(result_id, verified), score
+
+        monkeypatch.setattr(audio_provider, "find_match", find_match)
+
+    return downloader, searched
+
+
+def test_search_providers_in_order(monkeypatch):
+    downloader, searched = create_downloader(
+        monkeypatch, [(0, "a", False, 60.0), (0, "b", True, 95.0)], False
+    )
+
+    assert downloader.search(SONG).endswith("v=a")
+    assert searched == ["YouTubeMusic"]
+
+
+def test_search_providers_parallel(monkeypatch):
+    downloader, searched = create_downloader(
+        monkeypatch, [(0.2, "a", False, 60.0), (0.2, "b", False, 70.0)]
+    )
+
+    start = time.perf_counter()
+    assert downloader.search(SONG).endswith("v=b")
+    assert time.perf_counter() - start < 0.35
+    assert sorted(searched) == ["YouTube", "YouTubeMusic"]
+
+
+def test_search_providers_parallel_verified_match(monkeypatch):
+    release = threading.Event()
+    downloader, _ = create_downloader(
+        monkeypatch, [(0, "a", True, 90.0), (0, "b", True, 95.0)]
+    )
+
+    # The second provider doesn't finish until the first match was used
+    slow_find_match = downloader.audio_providers[1].find_match
+    monkeypatch.setattr(
+        downloader.audio_providers[1],
+        "find_match",
+        lambda *args: release.wait(1) and slow_find_match(*args),
+    )
+
+    assert downloader.search(SONG).endswith("v=a")
+    release.set()
+
+
+def test_search_providers_parallel_errors(monkeypatch):
+    downloader, _ = create_downloader(
+        monkeypatch, [ValueError("failed"), (0, "b", False, 50.0)]
+    )
+    assert downloader.search(SONG).endswith("v=b")
+
+    downloader, _ = create_downloader(monkeypatch, [ValueError("failed"), None])
+    with pytest.raises(ValueError):
+        downloader.search(SONG)
+
+
+def test_search_stored_match_provider(monkeypatch, tmp_path):
+    downloader, searched = create_downloader(
+        monkeypatch, [(0, "a", False, 60.0), (0, "b", False, 70.0)], False
+    )
+    downloader.match_store = MatchStore(tmp_path / "match_store.db")
+
+    # Stored matches of the configured providers are used
+    downloader.match_store.set(SONG, "https://youtube.com/watch?v=c", "YouTube")
+    assert downloader.search(SONG).endswith("v=c")
+    assert searched == []
+
+    # Stored matches of other providers are searched again and replaced
+    downloader.match_store.set(SONG, "https://piped.video/watch?v=d", "Piped")
+    assert downloader.search(SONG).endswith("v=a")
+    assert searched == ["YouTubeMusic"]
+    assert downloader.match_store.get(SONG)["provider"] == "YouTubeMusic"
+
+    # Pinned matches are always used
+    downloader.match_store.pin(SONG, "https://piped.video/watch?v=e")
+    assert downloader.search(SONG).endswith("v=e")
+    assert searched == ["YouTubeMusic"]
+
+
+def test_get_audio_downloader(monkeypatch):
+    downloader, _ = create_downloader(monkeypatch, [])
+    calls = []
+
+    audio_downloader = downloader.get_audio_downloader(calls.append)
+    assert downloader.get_audio_downloader(lambda data: calls.append(data["id"])) is (
+        audio_downloader
+    )
+
+    # Only the progress hook of the current song is called
+    for hook in audio_downloader.audio_handler._progress_hooks:
+        hook({"id": "a"})
+    assert calls == ["a"]
+
+    # Every thread has its own audio downloader
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(downloader.get_audio_downloader(calls.append))
+    )
+    thread.start()
+    thread.join()
+    assert other[0] is not audio_downloader
+    assert downloader.audio_downloader_count == 2
+
+
+def create_incremental_downloader(monkeypatch):
+    """
+    Create a downloader that records the songs it would download
+    and the batches of songs it reinitializes.
+    """
+
+    downloader, _ = create_downloader(monkeypatch, [])
+    batches = []
+
+    async def pool_download(song):
+        return song, None
+
+    def reinit_songs(songs, threads):
+        batches.append(len(songs))
+        return [None] * len(songs)
+
+    monkeypatch.setattr(downloader, "pool_download", pool_download)
+    monkeypatch.setattr(downloader_module, "reinit_songs", reinit_songs)
+
+    return downloader, batches
+
+
+def test_download_songs_incrementally(monkeypatch):
+    downloader, batches = create_incremental_downloader(monkeypatch)
+
+    # Songs from YouTube Music queries don't have a Spotify url
+    songs = [
+        Song.from_missing_data(
+            name=f"Song {index}",
+            artists=["Abstrakt"],
+            artist="Abstrakt",
+            download_url=f"https://music.youtube.com/watch?v={index % 60}",
+        )
+        for index in range(120)
+    ]
+
+    results = downloader.download_songs_incrementally(iter(songs))
+    assert len(results) == 60
+    assert batches == [50, 50, 20]
+
+
+def test_download_songs_incrementally_producer_error(monkeypatch):
+    downloader, _ = create_incremental_downloader(monkeypatch)
+    finished = []
+    monkeypatch.setattr(downloader, "finish_download", finished.append)
+
+    def songs():
+        yield SONG
+        raise ValueError("Invalid playlist")
+
+    results = downloader.download_songs_incrementally(songs())
+    assert results == [(SONG, None)]
+    assert finished == [results]
+    assert downloader.errors == [
+        "Failed to get the next songs to download: Invalid playlist"
+    ]
@@ -0,0 +1,194 @@
+import threading
+import time
+
+from spotdl.providers.audio import base
+from spotdl.providers.audio.base import AudioProvider, VideoInfoCache
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+
+
+def create_result(video_id: str, verified: bool) -> Result:
+    return Result(
+        source="test",
+        url=f"https://music.youtube.com/watch?v={video_id}",
+        verified=verified,
+        name="Nobody Else",
+        duration=162,
+        author="Abstrakt",
+        result_id=video_id,
+        artists=("Abstrakt",),
+    )
+
+
+class PassesProvider(AudioProvider):
+    SUPPORTS_ISRC = False
+    GET_RESULTS_OPTS = [{"filter": "songs"}, {"filter": "videos"}]
+
+    def get_results(self, search_term, **kwargs):
+        if kwargs["filter"] == "songs":
+            return [create_result("a", True), create_result("b", True)]
+
+        return [create_result("b", False), create_result("c", False)]
+
+
+def test_search_skips_duplicate_results(monkeypatch):
+    scored = []
+
+    def fake_order_results(results, song, search_query, score_threshold):
+        scored.append([result.result_id for result in results])
+        return {result: 50.0 for result in results}
+
+    monkeypatch.setattr(base, "order_results", fake_order_results)
+    monkeypatch.setattr(PassesProvider, "get_views", lambda self, url: 0)
+
+    song = Song.from_missing_data(
+        name="Nobody Else",
+        artists=["Abstrakt"],
+        artist="Abstrakt",
+        duration=162,
+        song_id="0kx3ml8bdAYrQtcIwvkhp8",
+    )
+
+    assert PassesProvider().search(song) is not None
+    assert scored == [["a", "b"], ["c"]]
+
+
+def test_video_info_cache(monkeypatch):
+    cache = VideoInfoCache(maxsize=2, ttl=10)
+    now = [0.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+
+    cache.set("https://music.youtube.com/watch?v=a", {"id": "a"})
+    cache.set("https://www.youtube.com/watch?v=b", {"id": "b"})
+
+    # Keyed by video id, not by url
+    assert cache.get("https://www.youtube.com/watch?v=a") == {"id": "a"}
+
+    # Least recently used entry is evicted
+    cache.set("https://www.youtube.com/watch?v=c", {"id": "c"})
+    assert cache.get("https://www.youtube.com/watch?v=b") is None
+
+    now[0] = 11
+    assert cache.get("https://www.youtube.com/watch?v=a") is None
+    assert cache.stats == {"hits": 1, "misses": 2, "size": 1, "maxsize": 2}
+
+
+def test_get_best_result_fetches_views_concurrently(monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_views(self, url):
+        barrier.wait()
+        return {"a": 100, "b": 1000, "c": 10}[url[-1]]
+
+    monkeypatch.setattr(PassesProvider, "get_views", get_views)
+
+    results = {
+        create_result("a", True): 90.0,
+        create_result("b", True): 88.0,
+        create_result("c", True): 85.0,
+    }
+
+    best_result, _ = PassesProvider().get_best_result(results)
+    assert best_result.result_id == "b"
+
+
+def test_get_info_handler():
+    provider = PassesProvider()
+    handlers = []
+
+    thread = threading.Thread(
+        target=lambda: handlers.append(provider.get_info_handler())
+    )
+    thread.start()
+    thread.join()
+
+    # Every thread gets its own instance, the download instance isn't used
+    assert provider.get_info_handler() is provider.get_info_handler()
+    assert provider.get_info_handler() is not handlers[0]
+    assert provider.audio_handler not in (provider.get_info_handler(), handlers[0])
+    assert provider.views_executor._max_workers == base.VIEWS_THREADS
+
+
+def test_get_download_metadata_reuses_info(monkeypatch):
+    provider = PassesProvider()
+    url = "https://music.youtube.com/watch?v=reused"
+    extracted = []
+    processed = []
+
+    def extract_info(url, download):
+        extracted.append(download)
+        return {"id": "reused", "ext": "webm", "view_count": 10}
+
+    def process_ie_result(info, download):
+        processed.append(download)
+        return info
+
+    monkeypatch.setattr(provider.get_info_handler(), "extract_info", extract_info)
+    monkeypatch.setattr(provider.audio_handler, "process_ie_result", process_ie_result)
+    monkeypatch.setattr(base, "INFO_CACHE", VideoInfoCache())
+
+    assert provider.get_views(url) == 10
+    assert provider.get_views(url) == 10
+    assert provider.get_download_metadata(url, download=True)["id"] == "reused"
+
+    assert extracted == [False]
+    assert processed == [True]
+
+
+class SlowProvider(PassesProvider):
+    SUPPORTS_ISRC = True
+    DELAYS = {"songs": 0.2, "videos": 0.2}
+
+    def get_results(self, search_term, **kwargs):
+        time.sleep(self.DELAYS.get(kwargs.get("filter"), 0.1))
+
+        if kwargs.get("filter") == "songs":
+            return [create_result("a", True)]
+
+        if kwargs.get("filter") == "videos":
+            return [create_result("c", False)]
+
+        return []
+
+
+def test_speculative_search(monkeypatch):
+    scores = {"a": 60.0, "c": 75.0}
+    monkeypatch.setattr(
+        base,
+        "order_results",
+        lambda results, *args, **kwargs: {
+            result: scores[result.result_id] for result in results
+        },
+    )
+    monkeypatch.setattr(SlowProvider, "get_views", lambda self, url: 0)
+
+    song = Song.from_missing_data(
+        name="Nobody Else",
+        artists=["Abstrakt"],
+        artist="Abstrakt",
+        duration=162,
+        song_id="0kx3ml8bdAYrQtcIwvkhp8",
+        isrc="GB2LD2210007",
+    )
+
+    matches = []
+    for speculative_search in (False, True):
+        start = time.perf_counter()
+        matches.append(
+            SlowProvider(speculative_search=speculative_search).find_match(song)
+        )
+        matches.append(time.perf_counter() - start)
+
+    # Same match, but the searches don't wait for each other
+    assert matches[0] == matches[2]
+    assert matches[0][0].result_id == "c"
+    assert matches[1] >= 0.5
+    assert matches[3] < 0.4
+
+    # A verified match is used without waiting for the other searches
+    scores["a"] = 90.0
+    monkeypatch.setattr(SlowProvider, "DELAYS", {"songs": 0.2, "videos": 1.0})
+    start = time.perf_counter()
+    match = SlowProvider(speculative_search=True).find_match(song)
+    assert match[0].result_id == "a"
+    assert time.perf_counter() - start < 0.4
@@ -1,4 +1,5 @@
 import pytest
+from spotipy.exceptions import SpotifyException
 
 from spotdl.types.artist import Artist
 
@@ -65,3 +66,112 @@ def test_artist_from_string():
     assert artist.name.lower().startswith("gor")
     # assert artist.url == "http://open.spotify.com/artist/3AA28KZvwAUcZuOKwyblJQ"
     assert len(artist.urls) > 1
+
+
+def test_artist_get_songs(monkeypatch):
+    """
+    Test if artist albums are fetched in batches and songs are deduplicated.
+    """
+
+    requested = []
+
+    def fake_album(album_id):
+        return {
+            "id": album_id,
+            "name": f"album{album_id}",
+            "artists": [{"name": "artist"}],
+            "album_type": "album",
+            "release_date": "2020-01-01",
+            "total_tracks": 2,
+            "label": "label",
+            "images": [],
+            "copyrights": [],
+            "tracks": {
+                "items": [
+                    {
+                        "id": f"{album_id}-{name}",
+                        "name": name,
+                        "artists": [{"name": "artist"}],
+                        "disc_number": 1,
+                        "duration_ms": 1000,
+                        "track_number": 1,
+                        "explicit": False,
+                        "external_urls": {"spotify": f"url-{album_id}-{name}"},
+                    }
+                    # Names with the same slug are duplicates
+                    for name in [
+                        "Intro" if album_id == "0" else "INTRO",
+                        f"song{album_id}",
+                    ]
+                ],
+                "next": None,
+            },
+        }
+
+    def fake_get_albums(ids, threads=1):
+        requested.append(ids)
+        return {album_id: fake_album(album_id) for album_id in ids}
+
+    monkeypatch.setattr("spotdl.types.artist.get_albums", fake_get_albums)
+
+    albums = [f"https://open.spotify.com/album/{index}" for index in range(25)]
+    songs = list(Artist.get_songs(albums))
+
+    assert [len(ids) for ids in requested] == [20, 5]
+    assert songs[0].url == "url-0-Intro"
+    assert [song.name for song in songs].count("Intro") == 1
+    assert "INTRO" not in [song.name for song in songs]
+    assert len(songs) == 26
+
+
+def test_artist_get_songs_failed_batch(monkeypatch):
+    """
+    Test if albums of a failed batch are fetched one by one,
+    and albums that can't be fetched are skipped.
+    """
+
+    def fake_album(album_id):
+        return {
+            "id": album_id,
+            "name": f"album{album_id}",
+            "artists": [{"name": "artist"}],
+            "album_type": "album",
+            "release_date": "2020-01-01",
+            "total_tracks": 1,
+            "label": "label",
+            "images": [],
+            "copyrights": [],
+            "tracks": {
+                "items": [
+                    {
+                        "id": album_id,
+                        "name": f"song{album_id}",
+                        "artists": [{"name": "artist"}],
+                        "disc_number": 1,
+                        "duration_ms": 1000,
+                        "track_number": 1,
+                        "explicit": False,
+                        "external_urls": {"spotify": f"url-{album_id}"},
+                    }
+                ],
+                "next": None,
+            },
+        }
+
+    def fake_get_album(album_id):
+        if album_id == "3":
+            raise SpotifyException(404, -1, "not found")
+
+        return fake_album(album_id)
+
+    # The batch request failed, so all of its albums are None
+    monkeypatch.setattr(
+        "spotdl.types.artist.get_albums",
+        lambda ids, threads=1: {album_id: None for album_id in ids},
+    )
+    monkeypatch.setattr("spotdl.types.artist.get_album", fake_get_album)
+
+    albums = [f"https://open.spotify.com/album/{index}" for index in range(5)]
+    songs = list(Artist.get_songs(albums))
+
+    assert [song.name for song in songs] == ["song0", "song1", "song2", "song4"]
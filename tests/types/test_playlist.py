@@ -1,6 +1,7 @@
 import pytest
 
-from spotdl.types.playlist import Playlist
+from spotdl.types.playlist import PLAYLIST_FIELDS, PLAYLIST_ITEMS_FIELDS, Playlist
+from spotdl.utils.spotify import SpotifyClient
 
 
 def test_playlist_init():
@@ -81,3 +82,69 @@ def test_playlist_length():
     )
 
     assert playlist.length == 9
+
+
+def test_playlist_get_metadata_fields(monkeypatch):
+    """
+    Test if Playlist metadata is built from the projected responses.
+    """
+
+    spotify_client = SpotifyClient()
+    requested_fields = []
+
+    def fake_playlist(url, fields=None):
+        requested_fields.append(fields)
+        return {
+            "name": "playlist",
+            "description": "description",
+            "external_urls": {"spotify": "author"},
+            "owner": {"display_name": "owner"},
+            "images": [],
+        }
+
+    def fake_playlist_items(url, fields=None):
+        requested_fields.append(fields)
+        return {
+            "href": "https://api.spotify.com/v1/playlists/abc/tracks",
+            "limit": 100,
+            "next": None,
+            "offset": 0,
+            "total": 1,
+            "items": [
+                {
+                    "track": {
+                        "id": "track",
+                        "name": "song",
+                        "type": "track",
+                        "is_local": False,
+                        "duration_ms": 1000,
+                        "disc_number": 1,
+                        "track_number": 1,
+                        "explicit": False,
+                        "external_urls": {"spotify": "track-url"},
+                        "external_ids": {"isrc": "isrc"},
+                        "artists": [{"name": "artist"}],
+                        "album": {
+                            "id": "album",
+                            "name": "album",
+                            "album_type": "album",
+                            "release_date": "2020-01-01",
+                            "total_tracks": 1,
+                            "images": [],
+                            "artists": [{"name": "artist"}],
+                        },
+                    }
+                }
+            ],
+        }
+
+    monkeypatch.setattr(spotify_client, "playlist", fake_playlist)
+    monkeypatch.setattr(spotify_client, "playlist_items", fake_playlist_items)
+
+    metadata, songs = Playlist.get_metadata("abc")
+
+    assert requested_fields == [PLAYLIST_FIELDS, PLAYLIST_ITEMS_FIELDS]
+    assert metadata["author_name"] == "owner"
+    assert songs[0].name == "song"
+    assert songs[0].album_artist == "artist"
+    assert songs[0].isrc == "isrc"
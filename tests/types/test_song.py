@@ -2,6 +2,7 @@
 
 from spotdl.types.album import Album
 from spotdl.types.song import Song
+from spotdl.utils.spotify import ENTITY_MEMO, SpotifyClient
 
 
 def test_song_init():
@@ -140,8 +141,7 @@ def test_song_from_data_dump():
     """
 
     # Loads from str
-    song = Song.from_data_dump(
-        """
+    song = Song.from_data_dump("""
         {
             "name": "Ropes",
             "artists": ["Dirty Palm", "Chandler Jewels"],
@@ -168,8 +168,7 @@ def test_song_from_data_dump():
             "url": "https://open.spotify.com/track/1t2qKa8K72IBC8yQlhD9bU",
             "popularity": 0
         }
-        """
-    )
+        """)
 
     assert song.name == "Ropes"
     assert song.artists == ["Dirty Palm", "Chandler Jewels"]
@@ -257,3 +256,102 @@ def test_song_from_dict():
     )
     assert song.explicit == False
     assert song.popularity == 0
+
+
+def test_song_list_from_urls(monkeypatch):
+    """
+    Tests if Song.list_from_urls fetches tracks, albums and artists in batches.
+    """
+
+    ENTITY_MEMO.clear()
+    spotify_client = SpotifyClient()
+    calls = {"tracks": [], "albums": [], "artists": []}
+
+    def fake_track(track_id, album_id):
+        return {
+            "id": track_id,
+            "name": f"song {track_id}",
+            "artists": [{"id": "artist", "name": "artist"}],
+            "album": {"id": album_id},
+            "duration_ms": 1000,
+            "disc_number": 1,
+            "track_number": 1,
+            "explicit": False,
+            "popularity": 1,
+            "external_ids": {"isrc": "isrc"},
+            "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+        }
+
+    def fake_tracks(ids):
+        calls["tracks"].append(ids)
+        return {
+            "tracks": [
+                None if track_id == "missing" else fake_track(track_id, "album")
+                for track_id in ids
+            ]
+        }
+
+    def fake_albums(ids):
+        calls["albums"].append(ids)
+        return {
+            "albums": [
+                {
+                    "id": album_id,
+                    "name": "album",
+                    "artists": [{"name": "artist"}],
+                    "album_type": "album",
+                    "copyrights": [],
+                    "genres": ["pop"],
+                    "tracks": {"items": [{"disc_number": 1}]},
+                    "release_date": "2020-01-01",
+                    "total_tracks": 60,
+                    "label": "label",
+                    "images": [],
+                }
+                for album_id in ids
+            ]
+        }
+
+    def fake_artists(ids):
+        calls["artists"].append(ids)
+        return {"artists": [{"id": artist_id, "genres": ["rock"]} for artist_id in ids]}
+
+    monkeypatch.setattr(spotify_client, "tracks", fake_tracks)
+    monkeypatch.setattr(spotify_client, "albums", fake_albums)
+    monkeypatch.setattr(spotify_client, "artists", fake_artists)
+
+    urls = [f"https://open.spotify.com/track/{index}?si=abc" for index in range(60)]
+    urls.append("https://open.spotify.com/track/missing")
+    urls.append("https://www.youtube.com/watch?v=test")
+
+    songs = Song.list_from_urls(urls)
+
+    assert len(songs) == 62
+    assert songs[0] is not None and songs[0].song_id == "0"
+    assert songs[59] is not None and songs[59].genres == ["pop", "rock"]
+    assert songs[60] is None
+    assert songs[61] is None
+    assert [len(ids) for ids in calls["tracks"]] == [50, 11]
+    assert calls["albums"] == [["album"]]
+    assert calls["artists"] == [["artist"]]
+
+
+def test_song_compact():
+    """
+    Test if songs share repeated strings and serialize to independent dicts.
+    """
+
+    album_name = "".join(["album ", "name"])
+    song = Song.from_missing_data(
+        name="name", artists=["artist"], genres=["pop"], album_name=album_name
+    )
+    other_song = Song.from_missing_data(name="other", album_name="album name")
+
+    assert not hasattr(song, "__dict__")
+    assert song.album_name is other_song.album_name
+
+    data = song.json
+    data["artists"].append("other artist")
+
+    assert song.artists == ["artist"]
+    assert Song.from_dict(song.json) == song
@@ -0,0 +1,50 @@
+import time
+
+from spotdl.utils.cache import MemoryCache, SQLiteCache
+
+
+def test_memory_cache():
+    cache = MemoryCache()
+    cache.set("key", {"value": 1})
+
+    assert cache.get("key") == {"value": 1}
+    assert cache.get("missing") is None
+    assert len(cache) == 1
+
+
+def test_sqlite_cache_persistence(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.set("key", {"value": 1}, "tracks")
+    cache.close()
+
+    cache = SQLiteCache(tmp_path / "cache.db")
+
+    assert cache.get("key") == {"value": 1}
+    assert len(cache) == 1
+
+
+def test_sqlite_cache_ttl(tmp_path):
+    cache = SQLiteCache(
+        tmp_path / "cache.db", ttls={"tracks": None, "me": 0, "playlists": 0.01}
+    )
+    cache.set("track", {"value": 1}, "tracks")
+    cache.set("me", {"value": 2}, "me")
+    cache.set("playlist", {"value": 3}, "playlists")
+
+    time.sleep(0.05)
+
+    assert cache.get("track") == {"value": 1}
+    assert cache.get("me") is None
+    assert cache.get("playlist") is None
+
+
+def test_sqlite_cache_eviction(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", max_entries=10)
+    for index in range(25):
+        cache.set(str(index), index)
+
+    cache.flush()
+
+    assert len(cache) == 10
+    assert cache.get("0") is None
+    assert cache.get("24") == 24
@@ -1,11 +1,15 @@
 from pathlib import Path
 
 from spotdl.types.song import Song, SongList
+from spotdl.utils import formatter
 from spotdl.utils.formatter import (
     create_file_name,
     create_song_title,
+    get_kakasi,
     parse_duration,
     sanitize_string,
+    slugify,
+    transliterate,
 )
 
 
@@ -166,3 +170,23 @@ def test_parse_duration():
     assert parse_duration("views") == float(0.0)
     assert parse_duration([1, 2, 3]) == float(0.0)  # type: ignore
     assert parse_duration({"json": "data"}) == float(0.0)  # type: ignore
+
+
+def test_slugify_japanese(monkeypatch):
+    """
+    Test that the transliterator is only used for strings
+    with japanese characters left after py_slugify
+    """
+
+    monkeypatch.setattr(formatter, "_KKS", None)
+    slugify.clear()
+    transliterate.clear()
+
+    assert slugify("Nobody Else - Abstrakt") == "nobody-else-abstrakt"
+    assert slugify("米津玄師 - Lemon") == "mi-jin-xuan-shi-lemon"
+    assert formatter._KKS is None
+    assert transliterate.stats["misses"] == 0
+
+    assert transliterate("米津玄師") == "yonetsu-gen-shi"
+    assert formatter._KKS is get_kakasi()
+    assert transliterate.stats["misses"] == 1
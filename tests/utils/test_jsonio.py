@@ -0,0 +1,48 @@
+from spotdl.utils import jsonio
+from spotdl.utils.jsonio import (
+    JsonLinesWriter,
+    dumps,
+    is_json_lines,
+    iter_json_lines,
+    load_json,
+    loads,
+    save_json,
+)
+
+DATA = [{"name": "Ça va", "artists": ["artist"], "duration": 200, "isrc": None}]
+
+
+def test_save_and_load_json(tmp_path):
+    save_json(tmp_path / "songs.spotdl", DATA)
+    save_json(tmp_path / "compact.spotdl", DATA, compact=True)
+
+    assert load_json(tmp_path / "songs.spotdl") == DATA
+    assert load_json(tmp_path / "compact.spotdl") == DATA
+    assert "\n" in (tmp_path / "songs.spotdl").read_text(encoding="utf-8")
+    assert "\n" not in (tmp_path / "compact.spotdl").read_text(encoding="utf-8")
+
+
+def test_json_stdlib_fallback(monkeypatch, tmp_path):
+    monkeypatch.setattr(jsonio, "orjson", None)
+
+    assert loads(dumps(DATA)) == DATA
+    assert dumps(DATA, compact=True).startswith('[{"name":"Ça va",')
+
+    save_json(tmp_path / "songs.spotdl", DATA)
+
+    assert load_json(tmp_path / "songs.spotdl") == DATA
+
+
+def test_json_lines(tmp_path):
+    path = tmp_path / "songs.spotdl.jsonl"
+
+    with JsonLinesWriter(path) as writer:
+        for item in DATA * 3:
+            writer.write(item)
+
+    # Simulate an interrupted write
+    with open(path, "a", encoding="utf-8") as json_file:
+        json_file.write('{"name": "unfinished')
+
+    assert is_json_lines(path)
+    assert list(iter_json_lines(path)) == DATA * 3
@@ -0,0 +1,88 @@
+from spotdl.types.song import Song
+from spotdl.utils.match_store import MatchStore
+
+URL = "https://music.youtube.com/watch?v=a"
+OTHER_URL = "https://music.youtube.com/watch?v=b"
+
+
+def create_song(song_id: str = "0kx3ml8bdAYrQtcIwvkhp8") -> Song:
+    return Song.from_missing_data(
+        name="Nobody Else",
+        artists=["Abstrakt"],
+        artist="Abstrakt",
+        song_id=song_id,
+        isrc="GB2LD2210007",
+    )
+
+
+def test_match_store(tmp_path):
+    store = MatchStore(tmp_path / "match_store.db")
+    song = create_song()
+
+    assert store.get(song) is None
+
+    store.set(song, URL, "YouTubeMusic", 95.0)
+    match = store.get(song)
+    assert match is not None
+    assert match["url"] == URL
+    assert match["provider"] == "YouTubeMusic"
+    assert match["score"] == 95.0
+
+    # Other tracks with the same ISRC use the same match
+    assert store.get(create_song("7d4gXmcfYmH1bQhXDyYkFh"))["url"] == URL
+
+    store.close()
+
+    # Matches are kept between runs
+    store = MatchStore(tmp_path / "match_store.db")
+    assert store.get(song)["url"] == URL
+
+    store.invalidate(song)
+    assert store.get(song) is None
+    assert store.stats == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_match_store_ttl(tmp_path):
+    store = MatchStore(tmp_path / "match_store.db", ttl=-1)
+    song = create_song()
+
+    store.set(song, URL, "YouTubeMusic", 95.0)
+    assert store.get(song) is None
+
+    store.pin(song, OTHER_URL)
+    assert store.get(song)["url"] == OTHER_URL
+
+
+def test_match_store_pin_and_blacklist(tmp_path):
+    store = MatchStore(tmp_path / "match_store.db")
+    song = create_song()
+
+    store.pin(song, URL)
+    store.set(song, OTHER_URL, "YouTubeMusic", 95.0)
+    assert store.get(song)["url"] == URL
+
+    store.invalidate(song, pinned=False)
+    assert store.get(song)["url"] == URL
+
+    store.blacklist(song, URL)
+    assert store.get(song) is None
+    assert store.get_blacklist(song) == [URL, URL]
+
+    store.set(song, OTHER_URL, "YouTubeMusic", 95.0)
+    assert store.get(song)["url"] == OTHER_URL
+
+
+def test_match_store_songs_without_ids(tmp_path):
+    store = MatchStore(tmp_path / "match_store.db")
+    song = Song.from_missing_data(
+        name="Nobody Else", artists=["Abstrakt"], artist="Abstrakt"
+    )
+    other_song = Song.from_missing_data(
+        name="Lemon", artists=["Kenshi Yonezu"], artist="Kenshi Yonezu"
+    )
+
+    assert not store.get_keys(song)
+
+    store.set(song, URL, "YouTubeMusic", 95.0)
+    assert store.get(other_song) is None
+    assert store.stats == {"hits": 0, "misses": 0, "size": 0}
@@ -0,0 +1,122 @@
+import logging
+import random
+
+import pytest
+
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.logging import MATCH
+from spotdl.utils.matching import (
+    SongMatchContext,
+    calc_max_score,
+    calc_name_match,
+    calc_time_match,
+    check_forbidden_words,
+    create_match_strings,
+    get_best_matches,
+    order_results,
+)
+
+SONG = Song.from_missing_data(
+    name="Down (feat. Lil Wayne)",
+    artists=["Jay Sean", "Lil Wayne"],
+    artist="Jay Sean",
+    album_name="All or Nothing",
+    duration=212,
+    song_id="6cmm1LMvZdB5zsCwX5BjqE",
+    explicit=False,
+)
+
+NAMES = [
+    "Down",
+    "Down (feat. Lil Wayne)",
+    "Jay Sean - Down ft. Lil Wayne",
+    "Down (Remix)",
+    "Down - Live at Wembley",
+    "Jay Sean feat. Lil Wayne - Down (Official Music Video)",
+    "Down (Slowed + Reverb)",
+    "Sean Paul - Down",
+]
+ARTISTS = [
+    None,
+    ("Jay Sean",),
+    ("Jay Sean", "Lil Wayne"),
+    ("Lil Wayne", "Jay Sean"),
+    ("Jay Sean feat. Lil Wayne",),
+    ("Sean Paul",),
+]
+ALBUMS = [None, "All or Nothing", "Down", "Greatest Hits"]
+
+
+def create_results(count: int):
+    generator = random.Random(count)
+
+    return [
+        Result(
+            source="youtube-music",
+            url=f"https://music.youtube.com/watch?v={index}",
+            verified=generator.random() > 0.5,
+            name=generator.choice(NAMES),
+            duration=212 + generator.randint(-40, 40),
+            author=generator.choice(["Jay Sean", "JaySeanVEVO", "Lyrics Channel"]),
+            result_id=str(index),
+            isrc_search=generator.random() > 0.8,
+            artists=generator.choice(ARTISTS),
+            album=generator.choice(ALBUMS),
+            explicit=generator.choice([None, True, False]),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 10, 100])
+def test_order_results_match_logging(count, monkeypatch, caplog):
+    results = create_results(count)
+
+    def fail_json(_):
+        raise AssertionError("Result.json built without MATCH logging")
+
+    # The result dump is only built when MATCH messages are logged
+    with (
+        monkeypatch.context() as patch,
+        caplog.at_level(logging.INFO, logger="spotdl.utils.matching"),
+    ):
+        patch.setattr(Result, "json", property(fail_json))
+        scores = order_results(results, SONG)
+
+    with caplog.at_level(MATCH, logger="spotdl.utils.matching"):
+        assert order_results(results, SONG) == scores
+
+    assert any("Calculating match value" in record.message for record in caplog.records)
+
+
+def test_song_match_context():
+    context = SongMatchContext.from_song(SONG)
+    result = create_results(1)[0]
+
+    assert context.slug_name == "down-feat-lil-wayne"
+    assert context.slug_artists == ["jay-sean", "lil-wayne"]
+    assert context.get_slug_title() == "jay-sean-lil-wayne-down-feat-lil-wayne"
+
+    match_strings = create_match_strings(SONG, result, context=context)
+    assert match_strings == create_match_strings(SONG, result)
+    assert context.match_strings[(result, None)] == match_strings
+
+
+@pytest.mark.parametrize("count", [50, 100])
+def test_order_results_score_threshold(count):
+    results = create_results(count)
+    scores = order_results(results, SONG)
+    pruned_scores = order_results(results, SONG, score_threshold=8)
+
+    assert set(pruned_scores.items()) <= set(scores.items())
+    assert get_best_matches(pruned_scores, 8) == get_best_matches(scores, 8)
+
+
+def test_calc_max_score():
+    for result, score in order_results(create_results(100), SONG).items():
+        name_match = calc_name_match(SONG, result)
+        name_match -= 15 * len(check_forbidden_words(SONG, result)[1])
+        time_match = calc_time_match(SONG, result)
+
+        assert score <= calc_max_score(SONG, result, name_match, time_match)
@@ -0,0 +1,45 @@
+from spotdl.utils.formatter import ratio, slugify
+from spotdl.utils.memo import MemoizedFunction, get_memo_stats, memoize
+
+
+def test_memoized_function():
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    memoized = MemoizedFunction(double, maxsize=2)
+
+    assert [memoized(value) for value in (1, 1, 2, 3, 1)] == [2, 2, 4, 6, 2]
+    assert calls == [1, 2, 3, 1]
+    assert memoized.stats == {
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+    # Counters are kept when resizing
+    memoized.resize(4)
+    memoized(1)
+    assert memoized.stats["misses"] == 5
+    assert memoized.stats["evictions"] == 2
+    assert memoized.stats["maxsize"] == 4
+
+    memoized.clear()
+    assert memoized.stats["misses"] == 0
+
+
+def test_memoize_registers_functions():
+    @memoize(maxsize=8)
+    def memo_test_function(value):
+        return value
+
+    assert memo_test_function(1) == 1
+    assert memo_test_function.__name__ == "memo_test_function"
+    assert get_memo_stats()["memo_test_function"]["misses"] == 1
+
+    assert isinstance(slugify, MemoizedFunction)
+    assert isinstance(ratio, MemoizedFunction)
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from spotdl.utils.ratelimit import RATE_WINDOW, RateLimiter
+
+
+def test_rate_limiter_unlimited():
+    limiter = RateLimiter()
+
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+
+    assert time.monotonic() - start < 0.5
+    assert limiter.stats["target_rate"] is None
+    assert limiter.stats["queue_depth"] == 0
+
+
+def test_rate_limiter_rate():
+    limiter = RateLimiter(rate=20, burst=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    # First request uses the initial token, the rest wait 1/20 s each
+    assert time.monotonic() - start >= 0.2
+
+
+def test_rate_limiter_pause():
+    limiter = RateLimiter()
+    limiter.pause(0.2)
+
+    assert limiter.stats["paused_for"] > 0
+
+    finished = []
+
+    def worker():
+        limiter.acquire()
+        finished.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(finished) == 4
+    assert all(end - start >= 0.15 for end in finished)
+
+
+def test_rate_limiter_history(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    limiter = RateLimiter()
+
+    # Requests older than the rate window are forgotten
+    # without reading the current rate
+    for _ in range(100):
+        limiter.acquire()
+        now[0] += 1
+
+    assert len(limiter._history) <= RATE_WINDOW + 1
+    assert limiter.current_rate == 1
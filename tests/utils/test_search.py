@@ -1,8 +1,20 @@
+import time
+
 import pytest
 
+from spotdl.console.sync import save_sync_file
+from spotdl.types.artist import Artist
+from spotdl.types.playlist import Playlist
 from spotdl.types.saved import SavedError
 from spotdl.types.song import Song
-from spotdl.utils.search import get_search_results, get_simple_songs, parse_query
+from spotdl.utils import search
+from spotdl.utils.search import (
+    get_search_results,
+    get_simple_songs,
+    iter_simple_songs,
+    lists_from_urls,
+    parse_query,
+)
 
 SONG = ["https://open.spotify.com/track/2Ikdgh3J5vCRmnCL3Xcrtv"]
 PLAYLIST = ["https://open.spotify.com/playlist/78Lg6HmUqlTnmipvNxc536"]
@@ -89,3 +101,93 @@ def test_create_empty_song():
 def test_get_simple_songs():
     songs = get_simple_songs(QUERY)
     assert len(songs) > 1
+
+
+def test_lists_from_urls(monkeypatch):
+    urls = [f"https://open.spotify.com/playlist/{index}" for index in range(8)]
+
+    def fake_from_url(url, fetch_songs=True):
+        # Finish in reverse order to make sure the result order is kept
+        time.sleep(0.01 * (8 - int(url.split("/")[-1])))
+        return Playlist(
+            name=url,
+            url=url,
+            urls=[],
+            songs=[],
+            description="",
+            author_url="",
+            author_name="",
+            cover_url="",
+        )
+
+    monkeypatch.setattr(Playlist, "from_url", fake_from_url)
+
+    playlists = lists_from_urls(Playlist, urls, threads=4)
+
+    assert [playlist.url for playlist in playlists] == urls
+
+
+def test_iter_simple_songs(monkeypatch):
+    consumed = []
+
+    def fake_parse_requests(query, use_ytm_data=False):
+        for request in query:
+            consumed.append(request)
+            yield Song.from_missing_data(
+                name=request, url=request, album_name=f"{request} album"
+            )
+
+    monkeypatch.setattr(search, "parse_requests", fake_parse_requests)
+
+    songs = iter_simple_songs(["first", "live", "last"], albums_to_ignore=["live"])
+
+    # Songs are yielded before the rest of the query is parsed
+    assert next(songs).name == "first"
+    assert consumed == ["first"]
+
+    assert [song.name for song in songs] == ["last"]
+
+
+def test_iter_simple_songs_artist(monkeypatch):
+    fetched = []
+
+    def fake_get_discography(url):
+        return {
+            "name": "artist",
+            "genres": [],
+            "url": url,
+            "albums": ["first", "second"],
+        }, 3
+
+    def fake_get_songs(albums):
+        for album in albums:
+            fetched.append(album)
+            yield Song.from_missing_data(name=album, url=album, album_name=album)
+
+    monkeypatch.setattr(Artist, "get_discography", fake_get_discography)
+    monkeypatch.setattr(Artist, "get_songs", fake_get_songs)
+
+    songs = iter_simple_songs(
+        ["https://open.spotify.com/intl-de/artist/1FPC2zwfMHhrP3frOfaai6"]
+    )
+
+    # Songs are yielded before the rest of the albums is fetched
+    song = next(songs)
+    assert fetched == ["first"]
+    assert song.list_name == "artist"
+    assert song.list_url == "https://open.spotify.com/artist/1FPC2zwfMHhrP3frOfaai6"
+    assert song.list_length == 3
+
+    assert [song.name for song in songs] == ["second"]
+
+
+def test_get_simple_songs_json_lines(tmp_path):
+    path = tmp_path / "songs.spotdl.jsonl"
+    songs = [
+        Song.from_missing_data(name=name, url=name, album_name="album")
+        for name in ["first", "second"]
+    ]
+
+    save_sync_file(str(path), ["query"], songs)
+
+    assert get_simple_songs([str(path)]) == songs
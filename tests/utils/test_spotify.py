@@ -1,6 +1,23 @@
+import concurrent.futures
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+from spotipy import Spotify
+from spotipy.exceptions import SpotifyException
 
-from spotdl.utils.spotify import SpotifyClient, SpotifyError
+from spotdl.utils.spotify import (
+    EntityMemo,
+    SpotifyClient,
+    _get_in_batches,
+    SpotifyError,
+    get_all_items,
+    get_cache_key,
+    get_cache_namespace,
+    get_retry_after,
+    get_spotify_id,
+)
 
 
 def test_init(patch_dependencies):
@@ -37,3 +54,290 @@ def test_multiple_init():
             user_auth=False,
             no_cache=True,
         )
+
+
+def test_get_spotify_id():
+    """
+    Test extracting ids from urls, uris and ids
+    """
+
+    assert get_spotify_id("https://open.spotify.com/album/abc123") == "abc123"
+    assert (
+        get_spotify_id("https://open.spotify.com/intl-de/album/abc123?si=xyz")
+        == "abc123"
+    )
+    assert get_spotify_id("spotify:album:abc123") == "abc123"
+    assert get_spotify_id("abc123") == "abc123"
+
+
+def test_entity_memo():
+    """
+    Test the entity memo eviction and counters
+    """
+
+    memo = EntityMemo(maxsize=2)
+    memo.set("album", "1", {"id": "1"})
+    memo.set("album", "2", {"id": "2"})
+
+    assert memo.get("album", "1") == {"id": "1"}
+    assert memo.get("artist", "1") is None
+
+    # "2" is the least recently used entity
+    memo.set("album", "3", {"id": "3"})
+
+    assert memo.get("album", "2") is None
+    assert memo.get("album", "3") == {"id": "3"}
+    assert memo.stats == {"hits": 2, "misses": 2, "size": 2, "maxsize": 2}
+
+
+def test_get_cache_namespace():
+    """
+    Test getting cache namespaces from request urls
+    """
+
+    assert get_cache_namespace("tracks/abc123") == "tracks"
+    assert get_cache_namespace("tracks/?ids=1,2,3") == "tracks"
+    assert get_cache_namespace("artists/abc123/albums") == "artists/albums"
+    assert (
+        get_cache_namespace(
+            "https://api.spotify.com/v1/playlists/abc123/tracks?offset=100&limit=100"
+        )
+        == "playlists/tracks"
+    )
+    assert get_cache_namespace("me/following") == "me"
+
+
+def test_get_cache_key():
+    """
+    Test that equivalent requests get the same cache key
+    """
+
+    assert get_cache_key("tracks/abc123", {"market": None}) == "tracks/abc123"
+    assert get_cache_key("tracks/?ids=1,2,3", {"market": "DE"}) == (
+        "tracks?ids=1,2,3&market=DE"
+    )
+    assert get_cache_key(
+        "http://api.spotify.com/v1/playlists/abc123/tracks?offset=0&limit=100"
+    ) == get_cache_key(
+        "playlists/abc123/tracks", {"limit": 100, "offset": 0, "fields": None}
+    )
+    assert get_cache_key(
+        "https://api.spotify.com/v1/playlists/abc123/tracks?offset=100&limit=100"
+    ) == get_cache_key("playlists/abc123/tracks", {"offset": 100, "limit": 100})
+
+
+def test_get_all_items(monkeypatch):
+    """
+    Test fetching offset-based and cursor-based pages
+    """
+
+    spotify_client = SpotifyClient()
+    requested = []
+
+    def fake_next(result):
+        requested.append(result["next"])
+        if "after=" in result["next"]:
+            return {"artists": {"items": [3], "next": None, "cursors": {}}}
+
+        offset = int(result["next"].split("offset=")[1].split("&")[0])
+        return {"items": list(range(offset, min(offset + 2, 7)))}
+
+    monkeypatch.setattr(spotify_client, "next", fake_next)
+
+    first_page = {
+        "href": "https://api.spotify.com/v1/albums/abc/tracks?offset=0&limit=2",
+        "items": [0, 1],
+        "limit": 2,
+        "offset": 0,
+        "total": 7,
+        "next": "https://api.spotify.com/v1/albums/abc/tracks?offset=2&limit=2",
+    }
+
+    assert get_all_items(first_page) == list(range(7))
+    assert len(requested) == 3
+
+    cursor_page = {
+        "items": [1, 2],
+        "next": "https://api.spotify.com/v1/me/following?type=artist&after=2",
+        "cursors": {"after": "2"},
+        "total": 3,
+    }
+
+    assert get_all_items(cursor_page, response_key="artists") == [1, 2, 3]
+
+
+def test_get_retry_after():
+    exception = SpotifyException(429, -1, "rate limited", headers={"Retry-After": "7"})
+
+    assert get_retry_after(exception) == 7
+    assert get_retry_after(SpotifyException(429, -1, "rate limited")) == 5
+
+
+def test_get_coalesces_requests(monkeypatch):
+    """
+    Test that concurrent identical requests are made only once
+    """
+
+    spotify_client = SpotifyClient()
+    calls = []
+    barrier = threading.Barrier(4)
+
+    def fake_internal_call(method, url, payload, params):
+        calls.append(url)
+        time.sleep(0.2)
+        return {"id": "coalesced"}
+
+    monkeypatch.setattr(spotify_client, "_internal_call", fake_internal_call)
+
+    def worker():
+        barrier.wait()
+        return spotify_client._get("albums/coalesced", market="US")
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = [executor.submit(worker) for _ in range(4)]
+
+    assert [result.result() for result in results] == [{"id": "coalesced"}] * 4
+    assert len(calls) == 1
+
+
+def test_internal_call_rate_limited(monkeypatch):
+    """
+    Test that 429 responses of any request pause all threads and are retried
+    """
+
+    spotify_client = SpotifyClient()
+    calls = []
+    pauses = []
+
+    def fake_internal_call(self, method, url, payload, params):
+        calls.append(method)
+        if len(calls) == 1:
+            raise SpotifyException(
+                429, -1, "rate limited", headers={"Retry-After": "7"}
+            )
+
+        return {"snapshot_id": "abc"}
+
+    monkeypatch.setattr(Spotify, "_internal_call", fake_internal_call)
+    monkeypatch.setattr(spotify_client.rate_limiter, "pause", pauses.append)
+
+    assert spotify_client._post("playlists/abc/tracks") == {"snapshot_id": "abc"}
+    assert calls == ["POST", "POST"]
+    assert pauses == [7]
+
+
+def test_internal_call_retry_after(monkeypatch):
+    """
+    Test that urllib3 doesn't wait for the Retry-After of 429 responses,
+    so that the rate limiter pauses all threads for that long
+    """
+
+    requests_made = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            requests_made.append(self.path)
+            if len(requests_made) == 1:
+                self.send_response(429)
+                self.send_header("Retry-After", "7")
+                body = b'{"error": {"status": 429, "message": "rate limited"}}'
+            else:
+                self.send_response(200)
+                body = b'{"id": "abc"}'
+
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    spotify_client = SpotifyClient()
+    pauses = []
+    monkeypatch.setattr(spotify_client, "_auth_headers", lambda: {})
+    monkeypatch.setattr(spotify_client.rate_limiter, "pause", pauses.append)
+
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/albums/abc"
+        start = time.monotonic()
+        response = spotify_client._internal_call("GET", url, None, {})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response == {"id": "abc"}
+    assert len(requests_made) == 2
+    assert pauses == [7]
+    assert time.monotonic() - start < 5
+
+
+def test_get_all_items_params(monkeypatch):
+    """
+    Test that extra parameters are added to every page
+    """
+
+    spotify_client = SpotifyClient()
+    requested = []
+
+    def fake_next(result):
+        requested.append(result["next"])
+        return {"items": [len(requested)]}
+
+    monkeypatch.setattr(spotify_client, "next", fake_next)
+
+    first_page = {
+        "items": [0],
+        "limit": 1,
+        "offset": 0,
+        "total": 3,
+        "next": "https://api.spotify.com/v1/playlists/abc/tracks?offset=1&limit=1",
+    }
+
+    assert get_all_items(first_page, params={"fields": "items(track(id))"}) == [
+        0,
+        1,
+        2,
+    ]
+    assert all("fields=items%28track%28id%29%29" in url for url in requested)
+
+
+def test_get_in_batches_failed_batch():
+    """
+    Test that a failed batch doesn't fail the other batches,
+    and that its objects are fetched one by one
+    """
+
+    fetched_one = []
+
+    def fetch(ids):
+        if "invalid" in ids:
+            raise SpotifyException(400, -1, "invalid id")
+
+        return {"tracks": [{"id": entity_id} for entity_id in ids]}
+
+    def fetch_one(entity_id):
+        fetched_one.append(entity_id)
+        if entity_id == "invalid":
+            raise SpotifyException(400, -1, "invalid id")
+
+        return {"id": entity_id}
+
+    ids = ["a", "b", "invalid", "c"]
+    assert _get_in_batches(fetch, "tracks", ids, 2) == {
+        "a": {"id": "a"},
+        "b": {"id": "b"},
+        "invalid": None,
+        "c": None,
+    }
+
+    assert _get_in_batches(fetch, "tracks", ids, 2, fetch_one=fetch_one) == {
+        "a": {"id": "a"},
+        "b": {"id": "b"},
+        "invalid": None,
+        "c": {"id": "c"},
+    }
+    assert fetched_one == ["invalid", "c"]
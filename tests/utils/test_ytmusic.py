@@ -0,0 +1,43 @@
+import threading
+
+from spotdl.utils.ytmusic import YTMusicPool
+
+
+def test_ytmusic_pool():
+    pool = YTMusicPool(max_idle=1)
+
+    with pool.client("de") as client:
+        assert client.language == "de"
+
+        # Clients in use aren't shared
+        with pool.client("de") as other:
+            assert other is not client
+
+    # Only one unused client is kept
+    with pool.client("de") as reused:
+        assert reused is other
+
+    with pool.client() as english:
+        assert english.language == "en"
+
+    assert pool.stats == {"created": 3, "reused": 1, "idle": 2}
+
+
+def test_ytmusic_pool_threads():
+    pool = YTMusicPool()
+    barrier = threading.Barrier(4)
+    clients = []
+
+    def use_client():
+        with pool.client() as client:
+            clients.append(client)
+            barrier.wait(5)
+
+    threads = [threading.Thread(target=use_client) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 4
+    assert pool.stats == {"created": 4, "reused": 0, "idle": 4}